@@ -75,6 +75,7 @@ class AnsiStyle:
     # Initialize the AnsiStyle with a variadic list of AnsiCodeEnum.
     def __init__(self, *codes: AnsiCodeEnum) -> None:
         self.codes = list(codes)
+        self._start_sequence = AnsiStyle._compile_start_sequence(self.codes)
         return None
 
     # Format the AnsiStyle to an ANSI escape sequence string.
@@ -90,21 +91,24 @@ class AnsiStyle:
     #  +---------------------------------- Start of the escape sequence string
     #
     def format(self, s: str) -> str:
+        ANSI_RESET = "\x1b[0m"
+        return f"{self._start_sequence}{s}{ANSI_RESET}"
+
+    # Build the start sequence once, when the AnsiStyle is created.
+    @staticmethod
+    def _compile_start_sequence(codes: List[AnsiCodeEnum]) -> str:
         # fmt: off
         ANSI_START_SEQUENCE = "\x1B["
         ANSI_END_SEQUENCE   = "m"
-        ANSI_RESET          = "\x1B[0m"
         # fmt: on
 
         parts: List[str] = []
         parts.append(ANSI_START_SEQUENCE)
-        for i, code in enumerate(self.codes):  # "1;91;44"
+        for i, code in enumerate(codes):  # "1;91;44"
             if i > 0:
                 parts.append(";")
             parts.append(str(code.value))  # Access the underlying value (int)
         parts.append(ANSI_END_SEQUENCE)
-        parts.append(s)
-        parts.append(ANSI_RESET)
         return "".join(parts)
 
 
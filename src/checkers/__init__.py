@@ -1,11 +1,57 @@
 """Checkers board game."""
 
+import argparse
+import sys
+import time
+from typing import Optional, Sequence, TextIO
 
-def main() -> None:
-    """Main CLI program for Checkers."""
-    print("Welcome to Checkers!")
-    print("This game is not yet implemented.")
+from checkers.board import PERFT_COUNTS, Position, perft
+
+
+def run_perft(depth: int, stdout: TextIO) -> bool:
+    """Writes the perft count and speed for each depth up to depth, returning whether all match the references."""
+    position = Position.initial()
+    ok = True
+    for d in range(1, depth + 1):
+        start = time.perf_counter()
+        count = perft(position, d)
+        seconds = time.perf_counter() - start
+        if d >= len(PERFT_COUNTS):
+            check = ""
+        elif count == PERFT_COUNTS[d]:
+            check = "ok"
+        else:
+            check = f"expected {PERFT_COUNTS[d]:,}"
+            ok = False
+        rate = count / seconds if seconds else 0.0
+        stdout.write(f"perft({d}) = {count:>12,}  {seconds:>8.3f} s {rate:>12,.0f} leaves/s  {check}\n")
+    return ok
+
+
+def main(argv: Optional[Sequence[str]] = None, stdout: Optional[TextIO] = None) -> int:
+    """Main CLI program for Checkers.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+        stdout: Stream output is written to (default: sys.stdout)
+
+    Returns:
+        1 when a perft count differs from its reference, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="checkers", description="Play checkers.")
+    commands = parser.add_subparsers(dest="command")
+    perft_parser = commands.add_parser("perft", help="count the positions reachable from the start, depth by depth")
+    perft_parser.add_argument("depth", type=int, nargs="?", default=6, help="deepest depth to count (default: 6)")
+    args = parser.parse_args(argv)
+
+    stdout = stdout or sys.stdout
+    if args.command == "perft":
+        return 0 if run_perft(args.depth, stdout) else 1
+
+    stdout.write("Welcome to Checkers!\n")
+    stdout.write("This game is not yet implemented.\n")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
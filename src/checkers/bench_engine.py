@@ -0,0 +1,39 @@
+"""Benchmark: search depth and speed of the checkers engine under a time budget.
+
+Run from src/:
+
+    python -m checkers.bench_engine
+"""
+
+import time
+
+from checkers.board import Position, format_move
+from checkers.engine import Engine
+
+BUDGETS = (0.1, 0.5, 2.0)
+
+
+def _middlegame() -> Position:
+    position = Position.initial()
+    for text in ("11-15", "23-19", "8-11", "22-17", "9-13", "17-14", "10x17", "21x14"):
+        position = position.play(position.parse_move(text))
+    return position
+
+
+def main() -> None:
+    for label, position in (("opening", Position.initial()), ("middlegame", _middlegame())):
+        for budget in BUDGETS:
+            # A fresh table each time, so earlier searches do not help
+            engine = Engine()
+            start = time.perf_counter()
+            result = engine.search(position, time_limit=budget)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<11} {budget:>4} s budget: {format_move(result.move):>6} depth {result.depth:>2} "
+                f"in {elapsed:.3f} s {result.nodes:>9,} nodes {result.nodes_per_second:>8,.0f} nodes/s "
+                f"TT hit rate {result.tt_hit_rate:>6.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
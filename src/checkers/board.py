@@ -0,0 +1,234 @@
+"""Checkers (English draughts) positions on 32-bit bitboards.
+
+The 32 playable squares are numbered 0-31 row by row from Black's side, so
+square i is bit i of a mask and standard notation square i + 1:
+
+    row 0:    ·  0  ·  1  ·  2  ·  3
+    row 1:    4  ·  5  ·  6  ·  7  ·
+    row 2:    ·  8  ·  9  · 10  · 11
+    ...
+    row 7:   28  · 29  · 30  · 31  ·
+
+A position is three masks (Black's pieces, White's pieces, and kings of
+either color) and the side to move. Black starts on squares 0-11 and moves
+first, towards row 7; White moves towards row 0.
+
+Moves are generated a whole mask at a time by shifting. A step down and to
+the left is a shift by 4 from even rows and by 3 from odd rows, and so on
+for the other directions, with masks for the board edges. Captures are
+mandatory, a capture continues for as long as the piece can keep jumping,
+and a man that reaches the far row is crowned and stops there.
+
+A move is an int packing its origin, destination and the mask of captured
+pieces (see `encode_move`), so moves compare and hash cheaply:
+
+>>> position = Position.initial()
+>>> [format_move(move) for move in sorted(position.moves(), key=move_origin)]
+['9-13', '9-14', '10-14', '10-15', '11-15', '11-16', '12-16']
+"""
+
+from enum import IntEnum
+from typing import NamedTuple
+
+FULL = 0xFFFF_FFFF
+
+# fmt: off
+ROW_0     = 0x0000_000F
+ROW_7     = 0xF000_0000
+EVEN_ROWS = 0x0F0F_0F0F  # Rows 0, 2, 4 and 6, whose squares are one column right of odd rows'
+ODD_ROWS  = 0xF0F0_F0F0
+LEFT      = 0x1111_1111  # First square of each row
+RIGHT     = 0x8888_8888  # Last square of each row
+
+BLACK_START = 0x0000_0FFF
+WHITE_START = 0xFFF0_0000
+# fmt: on
+
+
+# Squares one step away in each direction. Each is two shifts: even and odd
+# rows are offset by half a square, and edge squares have no neighbor.
+def _down_left(bits: int) -> int:
+    return (bits & EVEN_ROWS) << 4 | (bits & ODD_ROWS & ~LEFT & ~ROW_7) << 3
+
+
+def _down_right(bits: int) -> int:
+    return (bits & EVEN_ROWS & ~RIGHT) << 5 | (bits & ODD_ROWS & ~ROW_7) << 4
+
+
+def _up_left(bits: int) -> int:
+    return (bits & EVEN_ROWS & ~ROW_0) >> 4 | (bits & ODD_ROWS & ~LEFT) >> 5
+
+
+def _up_right(bits: int) -> int:
+    return (bits & EVEN_ROWS & ~RIGHT & ~ROW_0) >> 3 | (bits & ODD_ROWS) >> 4
+
+
+# (step, opposite step) per direction
+_DOWN = ((_down_left, _up_right), (_down_right, _up_left))
+_UP = ((_up_left, _down_right), (_up_right, _down_left))
+_ALL = _DOWN + _UP
+
+
+class Side(IntEnum):
+    BLACK = 0
+    WHITE = 1
+
+
+def encode_move(origin: int, destination: int, captured: int = 0) -> int:
+    """Packs a move from square origin to square destination, capturing the pieces in the captured mask."""
+    return origin | destination << 5 | captured << 10
+
+
+def move_origin(move: int) -> int:
+    return move & 31
+
+
+def move_destination(move: int) -> int:
+    return move >> 5 & 31
+
+
+def move_captures(move: int) -> int:
+    """Returns the mask of pieces the move captures."""
+    return move >> 10
+
+
+def format_move(move: int) -> str:
+    """Formats a move in standard notation, e.g. "11-15" or "22x15"."""
+    separator = "x" if move_captures(move) else "-"
+    return f"{move_origin(move) + 1}{separator}{move_destination(move) + 1}"
+
+
+def _jumps(
+    origin: int, bit: int, theirs: int, empty: int, directions: tuple, crown: int, captured: int, moves: list[int]
+) -> None:
+    # Extends a capture by the piece now on bit, appending every complete move
+    extended = False
+    for step, _ in directions:
+        over = step(bit) & theirs
+        if not over:
+            continue
+        landing = step(over) & empty
+        if not landing:
+            continue
+        extended = True
+        if landing & crown:
+            # A man that is crowned ends its move
+            moves.append(origin | (landing.bit_length() - 1) << 5 | (captured | over) << 10)
+        else:
+            _jumps(origin, landing, theirs & ~over, empty, directions, crown, captured | over, moves)
+    if not extended and captured:
+        moves.append(origin | (bit.bit_length() - 1) << 5 | captured << 10)
+
+
+def generate_moves(mine: int, theirs: int, kings: int, side: Side) -> list[int]:
+    """Returns the legal moves of side, whose pieces are mine, against theirs; captures are mandatory."""
+    empty = FULL & ~(mine | theirs)
+    my_kings = mine & kings
+    forward, backward, crown = (_DOWN, _UP, ROW_7) if side == Side.BLACK else (_UP, _DOWN, ROW_0)
+
+    # Pieces with at least one capture, found for all pieces at once
+    jumpers = 0
+    for step, back in forward:
+        jumpers |= mine & back(back(step(step(mine) & theirs) & empty))
+    if my_kings:
+        for step, back in backward:
+            jumpers |= my_kings & back(back(step(step(my_kings) & theirs) & empty))
+
+    moves: list[int] = []
+    king_jumped = False
+    while jumpers:
+        bit = jumpers & -jumpers
+        jumpers ^= bit
+        origin = bit.bit_length() - 1
+        if bit & kings:
+            # The king's own square is empty while it jumps, and it cannot be crowned again
+            _jumps(origin, bit, theirs, empty | bit, _ALL, 0, 0, moves)
+            king_jumped = True
+        else:
+            _jumps(origin, bit, theirs, empty, forward, crown, 0, moves)
+    if moves:
+        # A king can take the same pieces in either direction around a loop,
+        # which finds the same move twice
+        return list(dict.fromkeys(moves)) if king_jumped else moves
+
+    for directions, pieces in ((forward, mine), (backward, my_kings)):
+        if not pieces:
+            continue
+        for step, back in directions:
+            targets = step(pieces) & empty
+            while targets:
+                bit = targets & -targets
+                targets ^= bit
+                moves.append((back(bit).bit_length() - 1) | (bit.bit_length() - 1) << 5)
+    return moves
+
+
+class Position(NamedTuple):
+    black: int  # Mask of Black's pieces
+    white: int  # Mask of White's pieces
+    kings: int  # Mask of the pieces of either color that are kings
+    turn: Side  # Side to move
+
+    @classmethod
+    def initial(cls) -> "Position":
+        return cls(BLACK_START, WHITE_START, 0, Side.BLACK)
+
+    def __str__(self) -> str:
+        rows = []
+        for row in range(8):
+            cells = []
+            for column in range(8):
+                if (row + column) % 2 == 0:
+                    cells.append(" ")
+                    continue
+                bit = 1 << (row * 4 + column // 2)
+                piece = "b" if self.black & bit else "w" if self.white & bit else "."
+                cells.append(piece.upper() if self.kings & bit else piece)
+            rows.append(" ".join(cells).rstrip())
+        return "\n".join(rows)
+
+    def moves(self) -> list[int]:
+        """Returns the legal moves of the side to move; none means it has lost."""
+        if self.turn == Side.BLACK:
+            return generate_moves(self.black, self.white, self.kings, Side.BLACK)
+        return generate_moves(self.white, self.black, self.kings, Side.WHITE)
+
+    def play(self, move: int) -> "Position":
+        """Returns the position after move, which must be legal."""
+        origin = 1 << (move & 31)
+        destination = 1 << (move >> 5 & 31)
+        captured = move >> 10
+        black, white, kings = self.black, self.white, self.kings
+        if kings & origin:
+            kings = kings & ~origin | destination
+        elif destination & (ROW_7 | ROW_0):
+            kings |= destination  # Men only reach the row they are crowned on
+        kings &= ~captured
+        # A king's capture can end on the square it started from
+        if self.turn == Side.BLACK:
+            return _new_position(Position, (black & ~origin | destination, white & ~captured, kings, Side.WHITE))
+        return _new_position(Position, (black & ~captured, white & ~origin | destination, kings, Side.BLACK))
+
+    def parse_move(self, text: str) -> int:
+        """Returns the legal move written as text, e.g. "11-15" or "22x15"."""
+        for move in self.moves():
+            if format_move(move) == text.strip():
+                return move
+        raise ValueError(f"Illegal move: {text!r}")
+
+
+# Skips NamedTuple's keyword-handling __new__ on the hot path
+_new_position = tuple.__new__
+
+# Leaf counts from the initial position, by depth
+PERFT_COUNTS = (1, 7, 49, 302, 1469, 7361, 36768, 179740, 845931)
+
+
+def perft(position: Position, depth: int) -> int:
+    """Counts the positions depth moves after position, to check and time move generation."""
+    if depth == 0:
+        return 1
+    moves = position.moves()
+    if depth == 1:
+        return len(moves)
+    return sum(perft(position.play(move), depth - 1) for move in moves)
@@ -0,0 +1,374 @@
+"""Checkers search engine: iterative deepening alpha-beta under a time budget.
+
+`Engine.search` deepens one ply at a time until the time budget runs out,
+and returns the best move of the deepest completed iteration, so it always
+has an answer by the deadline:
+
+>>> result = Engine().search(Position.initial(), max_depth=6)
+>>> result.depth
+6
+
+Moves are ordered by the transposition table move, then captures (the most
+pieces first), then two killer moves per ply, then the history heuristic.
+At the horizon, positions with a capture pending are searched on until
+they are quiet, since captures are mandatory and would swing the score.
+
+The transposition table is a fixed number of slots in flat arrays, sized
+from a memory budget, and keyed by a Zobrist hash that is updated from each
+move rather than recomputed.
+"""
+
+import random
+import time
+from array import array
+from typing import NamedTuple, Optional
+
+from checkers.board import ROW_0, ROW_7, Position, Side
+
+# Scores beyond WIN_BOUND mean a forced win or loss, WIN - plies away
+WIN = 1 << 20
+WIN_BOUND = WIN - 1024
+_INFINITY = WIN + 1
+
+# fmt: off
+MAN = 100
+KING = 150
+_BACK_RANK = 8   # Bonus per man still guarding its own back row
+_ADVANCE = 2     # Bonus per row a man has advanced
+# fmt: on
+
+# Transposition table bound types
+EXACT = 0
+LOWER = 1  # The value is at least this (a beta cutoff)
+UPPER = 2  # The value is at most this (no move raised alpha)
+
+# Check the clock every this many nodes
+_CLOCK_INTERVAL = 128
+
+_MAX_PLY = 128
+
+# Zobrist keys by piece (Side for men, Side + 2 for kings) and square, plus the side to move
+_rng = random.Random(32)
+_KEYS = tuple(tuple(_rng.getrandbits(64) for _ in range(32)) for _ in range(4))
+_WHITE_TO_MOVE = _rng.getrandbits(64)
+del _rng
+
+# Mask of each row, from Black's back row to White's
+_ROWS = tuple(0xF << 4 * row for row in range(8))
+
+
+def zobrist(position: Position) -> int:
+    """Computes the Zobrist hash of position from scratch."""
+    key = _WHITE_TO_MOVE if position.turn == Side.WHITE else 0
+    for piece, mask in enumerate(
+        (
+            position.black & ~position.kings,
+            position.white & ~position.kings,
+            position.black & position.kings,
+            position.white & position.kings,
+        )
+    ):
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            key ^= _KEYS[piece][bit.bit_length() - 1]
+    return key
+
+
+def _child_key(position: Position, key: int, move: int) -> int:
+    # The hash after move, from the hash before it
+    side = position.turn
+    origin = move & 31
+    destination = move >> 5 & 31
+    captured = move >> 10
+    kings = position.kings
+    if kings >> origin & 1:
+        key ^= _KEYS[side + 2][origin] ^ _KEYS[side + 2][destination]
+    elif 1 << destination & (ROW_0 | ROW_7):
+        key ^= _KEYS[side][origin] ^ _KEYS[side + 2][destination]  # Crowned
+    else:
+        key ^= _KEYS[side][origin] ^ _KEYS[side][destination]
+    them = side ^ 1
+    while captured:
+        bit = captured & -captured
+        captured ^= bit
+        key ^= _KEYS[them + 2 if kings & bit else them][bit.bit_length() - 1]
+    return key ^ _WHITE_TO_MOVE
+
+
+def evaluate(position: Position) -> int:
+    """Returns the static score of position for the side to move: material, advancement and back-row guards."""
+    black, white, kings = position.black, position.white, position.kings
+    black_men, white_men = black & ~kings, white & ~kings
+    score = MAN * (black_men.bit_count() - white_men.bit_count())
+    score += KING * ((black & kings).bit_count() - (white & kings).bit_count())
+    score += _BACK_RANK * ((black_men & _ROWS[0]).bit_count() - (white_men & _ROWS[7]).bit_count())
+    for row in range(1, 7):
+        score += _ADVANCE * row * ((black_men & _ROWS[row]).bit_count() - (white_men & _ROWS[7 - row]).bit_count())
+    return score if position.turn == Side.BLACK else -score
+
+
+class TranspositionTable:
+    """Search results by Zobrist hash, in a fixed number of slots held in flat arrays.
+
+    Each hash maps to one slot, by its low bits. A slot keeps the deeper of
+    two entries from the same search, but entries left over from earlier
+    searches are always replaced.
+
+    Args:
+        max_bytes: Memory budget; the table has the largest power of two slots that fits.
+    """
+
+    SLOT_BYTES = 24  # Key, move and packed (generation, depth, bound, value)
+
+    def __init__(self, max_bytes: int = 16 << 20):
+        slots = 1 << max(0, (max_bytes // self.SLOT_BYTES).bit_length() - 1)
+        self._mask = slots - 1
+        self._keys = array("Q", bytes(8 * slots))
+        self._moves = array("Q", bytes(8 * slots))
+        # generation << 40 | depth << 32 | bound << 30 | value + 2**29; 0 is an empty slot
+        self._info = array("Q", bytes(8 * slots))
+        self.generation = 1
+        self.probes = 0
+        self.hits = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(table) * table.itemsize for table in (self._keys, self._moves, self._info))
+
+    def __len__(self) -> int:
+        return len(self._info) - self._info.count(0)
+
+    def new_search(self) -> None:
+        """Marks existing entries as replaceable and resets the hit counters."""
+        self.generation += 1
+        self.probes = self.hits = 0
+
+    def probe(self, key: int) -> Optional[tuple[int, int, int, int]]:
+        """Returns (depth, value, bound, move) stored for key, if any."""
+        self.probes += 1
+        index = key & self._mask
+        info = self._info[index]
+        if not info or self._keys[index] != key:
+            return None
+        self.hits += 1
+        return info >> 32 & 0xFF, (info & 0x3FFF_FFFF) - (1 << 29), info >> 30 & 3, self._moves[index]
+
+    def store(self, key: int, depth: int, value: int, bound: int, move: int) -> None:
+        index = key & self._mask
+        old = self._info[index]
+        if old and self._keys[index] != key and old >> 40 == self.generation and depth < (old >> 32 & 0xFF):
+            return
+        self._keys[index] = key
+        self._moves[index] = move
+        self._info[index] = self.generation << 40 | depth << 32 | bound << 30 | value + (1 << 29)
+
+
+class SearchResult(NamedTuple):
+    move: int
+    score: int  # From the point of view of the side to move
+    depth: int  # Deepest iteration completed
+    nodes: int  # Including quiescence nodes
+    seconds: float
+    tt_probes: int
+    tt_hits: int
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    @property
+    def tt_hit_rate(self) -> float:
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+
+class _Timeout(Exception):
+    pass
+
+
+class Engine:
+    """Iterative deepening alpha-beta search, keeping its transposition table between moves.
+
+    Args:
+        table_bytes: Memory budget of the transposition table.
+    """
+
+    def __init__(self, table_bytes: int = 16 << 20):
+        self.table = TranspositionTable(table_bytes)
+        self._killers = [[0, 0] for _ in range(_MAX_PLY)]
+        self._history = [0] * 1024  # By origin and destination (the low 10 bits of a move)
+        self._nodes = 0
+        self._deadline: Optional[float] = None
+
+    def search(
+        self, position: Position, time_limit: Optional[float] = None, max_depth: Optional[int] = None
+    ) -> SearchResult:
+        """Returns the best move for the side to move.
+
+        Searches one ply deeper at a time until max_depth, a forced win or
+        loss is found, or time_limit seconds have passed. The move from the
+        deepest completed iteration is returned, or the first move in
+        order if not even one ply was completed in time. A forced move is
+        returned without searching (depth 0).
+        """
+        start = time.perf_counter()
+        moves = position.moves()
+        if not moves:
+            raise ValueError("Game is over")
+        self._nodes = 0
+        self._deadline = start + time_limit if time_limit is not None else None
+        self._killers = [[0, 0] for _ in range(_MAX_PLY)]
+        self._history = [0] * 1024
+        self.table.new_search()
+        if max_depth is None:
+            max_depth = _MAX_PLY - 1 if time_limit is not None else 8
+
+        key = zobrist(position)
+        best_move, best_score, completed = self._order(moves, 0, 0)[0], 0, 0
+        if len(moves) == 1:
+            # Nothing to choose: only resolve pending captures, for the score
+            try:
+                child = position.play(best_move)
+                best_score = -self._quiesce(child, _child_key(position, key, best_move), -_INFINITY, _INFINITY, 1)
+            except _Timeout:
+                pass
+        else:
+            for depth in range(1, max_depth + 1):
+                try:
+                    score, move = self._root(position, key, moves, depth, best_move)
+                except _Timeout:
+                    break
+                best_move, best_score, completed = move, score, depth
+                if abs(score) >= WIN_BOUND:
+                    break
+
+        return SearchResult(
+            best_move,
+            best_score,
+            completed,
+            self._nodes,
+            time.perf_counter() - start,
+            self.table.probes,
+            self.table.hits,
+        )
+
+    def _order(self, moves: list[int], table_move: int, ply: int) -> list[int]:
+        if moves[0] >> 10:
+            # Captures are mandatory, so either every move is one or none is
+            moves = sorted(moves, key=lambda move: (move >> 10).bit_count(), reverse=True)
+        else:
+            killers = self._killers[ply]
+            history = self._history
+            moves = sorted(
+                moves,
+                key=lambda move: (1 << 40) if move in killers else history[move & 1023],
+                reverse=True,
+            )
+        if table_move in moves:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+        return moves
+
+    def _root(self, position: Position, key: int, moves: list[int], depth: int, first: int) -> tuple[int, int]:
+        alpha, best_move = -_INFINITY, first
+        for move in self._order(moves, first, 0):
+            value = -self._negamax(
+                position.play(move), _child_key(position, key, move), depth - 1, -_INFINITY, -alpha, 1
+            )
+            if value > alpha:
+                alpha, best_move = value, move
+        self.table.store(key, depth, alpha, EXACT, best_move)
+        return alpha, best_move
+
+    def _tick(self) -> None:
+        self._nodes += 1
+        if self._deadline is not None and not self._nodes % _CLOCK_INTERVAL and time.perf_counter() > self._deadline:
+            raise _Timeout
+
+    def _quiesce(self, position: Position, key: int, alpha: int, beta: int, ply: int) -> int:
+        self._tick()
+        moves = position.moves()
+        if not moves:
+            return ply - WIN
+        if not moves[0] >> 10 or ply >= _MAX_PLY - 1:
+            return evaluate(position)
+        # A capture is pending: the static score is not reliable, and there is no standing pat
+        best_value = -_INFINITY
+        for move in self._order(moves, 0, ply):
+            value = -self._quiesce(position.play(move), _child_key(position, key, move), -beta, -alpha, ply + 1)
+            if value > best_value:
+                best_value = value
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+        return best_value
+
+    def _negamax(self, position: Position, key: int, depth: int, alpha: int, beta: int, ply: int) -> int:
+        if depth <= 0:
+            return self._quiesce(position, key, alpha, beta, ply)
+        self._tick()
+        moves = position.moves()
+        if not moves:
+            return ply - WIN  # No moves left loses
+
+        original_alpha = alpha
+        entry = self.table.probe(key)
+        table_move = 0
+        if entry is not None:
+            entry_depth, value, bound, table_move = entry
+            if entry_depth >= depth:
+                value = _from_table(value, ply)
+                if bound == EXACT:
+                    return value
+                if bound == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        best_value, best_move = -_INFINITY, moves[0]
+        for move in self._order(moves, table_move, ply):
+            value = -self._negamax(
+                position.play(move), _child_key(position, key, move), depth - 1, -beta, -alpha, ply + 1
+            )
+            if value > best_value:
+                best_value, best_move = value, move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        if not move >> 10:
+                            killers = self._killers[ply]
+                            if killers[0] != move:
+                                killers[1] = killers[0]
+                                killers[0] = move
+                            self._history[move & 1023] += depth * depth
+                        break
+
+        if best_value <= original_alpha:
+            bound = UPPER
+        elif best_value >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table.store(key, depth, _to_table(best_value, ply), bound, best_move)
+        return best_value
+
+
+# Win and loss scores count plies from the root, but the table is shared
+# between nodes at different plies, so it stores them counted from the node
+def _to_table(value: int, ply: int) -> int:
+    if value >= WIN_BOUND:
+        return value + ply
+    if value <= -WIN_BOUND:
+        return value - ply
+    return value
+
+
+def _from_table(value: int, ply: int) -> int:
+    if value >= WIN_BOUND:
+        return value - ply
+    if value <= -WIN_BOUND:
+        return value + ply
+    return value
@@ -0,0 +1,126 @@
+"""Tests for the checkers bitboard core."""
+
+import io
+
+import pytest
+
+from checkers import main
+from checkers.board import (
+    PERFT_COUNTS,
+    Position,
+    Side,
+    _down_left,
+    _down_right,
+    _up_left,
+    _up_right,
+    encode_move,
+    format_move,
+    move_captures,
+    perft,
+)
+
+
+def _mask(*squares: int) -> int:
+    # Standard notation squares, numbered from 1
+    return sum(1 << (square - 1) for square in squares)
+
+
+def _coordinates(index: int) -> tuple[int, int]:
+    row = index // 4
+    return row, index % 4 * 2 + (1 if row % 2 == 0 else 0)
+
+
+def _moves(position: Position) -> list[str]:
+    return sorted(map(format_move, position.moves()))
+
+
+def test_steps_match_board_geometry():
+    """Test every shift lands on the diagonal neighbor, and squares on an edge have none."""
+    squares = {_coordinates(index): index for index in range(32)}
+    for index in range(32):
+        row, column = _coordinates(index)
+        for step, (dy, dx) in (
+            (_down_left, (1, -1)),
+            (_down_right, (1, 1)),
+            (_up_left, (-1, -1)),
+            (_up_right, (-1, 1)),
+        ):
+            neighbor = squares.get((row + dy, column + dx))
+            assert step(1 << index) == (0 if neighbor is None else 1 << neighbor)
+
+
+def test_perft():
+    """Test leaf counts from the initial position match the reference counts."""
+    position = Position.initial()
+    for depth, expected in enumerate(PERFT_COUNTS[:7]):
+        assert perft(position, depth) == expected
+
+
+def test_captures_are_mandatory():
+    """Test only captures are returned when one is available."""
+    position = Position(_mask(1, 18), _mask(22), 0, Side.BLACK)
+    assert _moves(position) == ["18x25"]
+    after = position.play(position.parse_move("18x25"))
+    assert after == Position(_mask(1, 25), 0, 0, Side.WHITE)
+
+
+def test_multi_jump():
+    """Test a capture continues while the piece can keep jumping."""
+    position = Position(_mask(10), _mask(14, 22, 32), 0, Side.BLACK)
+    [move] = position.moves()
+    assert format_move(move) == "10x26"
+    assert move_captures(move) == _mask(14, 22)
+
+
+def test_crowning_ends_the_move():
+    """Test a man reaching the far row is crowned and stops, even if a king could jump on."""
+    position = Position(_mask(21), _mask(25, 26), 0, Side.BLACK)
+    assert _moves(position) == ["21x30"]
+    after = position.play(position.moves()[0])
+    assert after.kings == _mask(30)
+
+    position = Position(_mask(1), _mask(5, 6), 0, Side.WHITE)
+    assert position.play(position.parse_move("6-2")).kings == _mask(2)
+
+
+def test_kings_move_and_capture_backwards():
+    """Test kings move and jump in every direction, and captured kings are removed."""
+    position = Position(_mask(17), _mask(14, 32), _mask(17, 14), Side.BLACK)
+    assert _moves(position) == ["17x10"]
+    assert position.play(position.moves()[0]) == Position(_mask(10), _mask(32), _mask(10), Side.WHITE)
+
+    position = Position(_mask(18), _mask(32), _mask(18), Side.BLACK)
+    assert _moves(position) == ["18-14", "18-15", "18-22", "18-23"]
+
+
+def test_circular_king_capture():
+    """Test a king capture may end on the square it started from."""
+    king = _mask(10)
+    position = Position(king, _mask(14, 15, 22, 23), king, Side.BLACK)
+    loops = [move for move in position.moves() if format_move(move) == "10x10"]
+    assert len(loops) == 1 and move_captures(loops[0]) == _mask(14, 15, 22, 23)
+    after = position.play(loops[0])
+    assert (after.black, after.white, after.kings) == (king, 0, king)
+
+
+def test_no_moves():
+    """Test a side that is blocked or has no pieces left has no moves."""
+    assert Position(_mask(1), 0, 0, Side.WHITE).moves() == []
+    assert Position(_mask(4), _mask(8, 11), 0, Side.BLACK).moves() == []
+
+
+def test_format_and_parse():
+    """Test moves are written and read in standard notation."""
+    assert format_move(encode_move(10, 14)) == "11-15"
+    assert format_move(encode_move(21, 14, _mask(18))) == "22x15"
+    with pytest.raises(ValueError):
+        Position.initial().parse_move("11-10")
+
+
+def test_main_perft():
+    """Test the perft command reports each depth and checks it against the reference."""
+    out = io.StringIO()
+    assert main(["perft", "4"], stdout=out) == 0
+    lines = out.getvalue().splitlines()
+    assert [line.split()[2] for line in lines] == ["7", "49", "302", "1,469"]
+    assert all(line.endswith("ok") for line in lines)
@@ -0,0 +1,124 @@
+"""Tests for the checkers search engine."""
+
+import random
+import time
+
+import pytest
+
+from checkers.board import Position, Side, format_move
+from checkers.engine import (
+    _INFINITY,
+    EXACT,
+    LOWER,
+    WIN_BOUND,
+    Engine,
+    TranspositionTable,
+    _child_key,
+    evaluate,
+    zobrist,
+)
+
+
+def _mask(*squares: int) -> int:
+    # Standard notation squares, numbered from 1
+    return sum(1 << (square - 1) for square in squares)
+
+
+def test_incremental_hash_matches_scratch():
+    """Test the hash updated from each move matches one computed from scratch, through captures and crowning."""
+    rng = random.Random(0)
+    for _ in range(20):
+        position = Position.initial()
+        key = zobrist(position)
+        for _ in range(150):
+            moves = position.moves()
+            if not moves:
+                break
+            move = rng.choice(moves)
+            key = _child_key(position, key, move)
+            position = position.play(move)
+            assert key == zobrist(position)
+
+
+def test_evaluate():
+    """Test the score is symmetric and from the side to move's point of view."""
+    initial = Position.initial()
+    assert evaluate(initial) == 0
+    up_a_man = Position(initial.black, initial.white & ~_mask(32), 0, Side.BLACK)
+    assert evaluate(up_a_man) > 0
+    assert evaluate(up_a_man._replace(turn=Side.WHITE)) == -evaluate(up_a_man)
+
+
+def test_transposition_table():
+    """Test entries round-trip, the table fits its budget, and deeper entries are kept within a search."""
+    table = TranspositionTable(max_bytes=1000)
+    assert table.nbytes <= 1000
+    slots = table.nbytes // TranspositionTable.SLOT_BYTES
+    table.store(5, 7, -WIN_BOUND - 3, LOWER, 1 << 41 | 42)
+    assert table.probe(5) == (7, -WIN_BOUND - 3, LOWER, 1 << 41 | 42)
+
+    table.store(5 + slots, 2, 0, EXACT, 0)  # Same slot, shallower
+    assert table.probe(5 + slots) is None
+    table.new_search()
+    table.store(5 + slots, 2, 0, EXACT, 0)  # Entries from an earlier search are replaced
+    assert table.probe(5) is None
+    assert table.probe(5 + slots) == (2, 0, EXACT, 0)
+    assert len(table) == 1
+
+
+def test_quiescence_resolves_pending_captures():
+    """Test the horizon score follows forced exchanges to a quiet position."""
+    # Black must take 18x25, then White must retake 30x21
+    position = Position(_mask(1, 18), _mask(22, 30), 0, Side.BLACK)
+    quiet = position.play(position.parse_move("18x25"))
+    quiet = quiet.play(quiet.parse_move("30x21"))
+    engine = Engine(table_bytes=1 << 16)
+    assert engine._quiesce(position, zobrist(position), -_INFINITY, _INFINITY, 0) == evaluate(quiet)
+
+
+def test_finds_forced_win():
+    """Test the engine finds the only winning move and stops deepening once it has."""
+    position = Position(_mask(13, 19), _mask(21, 31), 0, Side.BLACK)
+    result = Engine(table_bytes=1 << 16).search(position, max_depth=12)
+    assert format_move(result.move) == "19-23"
+    assert result.score >= WIN_BOUND
+    assert result.depth < 12
+
+
+def test_time_limit():
+    """Test a search returns the best move found so far by its deadline, with its statistics."""
+    engine = Engine(table_bytes=1 << 20)
+    start = time.perf_counter()
+    result = engine.search(Position.initial(), time_limit=0.2)
+    assert time.perf_counter() - start < 0.3
+    assert result.move in Position.initial().moves()
+    assert result.depth >= 2
+    assert result.nodes > 0 and result.nodes_per_second > 0
+    assert 0 < result.tt_hit_rate < 1
+
+
+def test_single_move_and_game_over():
+    """Test a forced move is returned without searching, and a lost position raises."""
+    # Black's king must take White's last two pieces
+    position = Position(_mask(10), _mask(14, 22), _mask(10), Side.BLACK)
+    result = Engine(table_bytes=1 << 16).search(position, time_limit=1.0)
+    assert (format_move(result.move), result.depth, result.nodes) == ("10x26", 0, 1)
+    assert result.score >= WIN_BOUND
+    with pytest.raises(ValueError):
+        Engine(table_bytes=1 << 16).search(Position(_mask(1), 0, 0, Side.WHITE))
+
+
+def test_beats_random_play():
+    """Test a shallow search beats a random player."""
+    rng = random.Random(0)
+    engine = Engine(table_bytes=1 << 20)
+    position = Position.initial()
+    for _ in range(200):
+        moves = position.moves()
+        if not moves:
+            break
+        if position.turn == Side.BLACK:
+            position = position.play(engine.search(position, max_depth=3).move)
+        else:
+            position = position.play(rng.choice(moves))
+    assert position.turn == Side.WHITE and not position.moves()
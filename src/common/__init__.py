@@ -0,0 +1 @@
+"""Helpers shared across the packages."""
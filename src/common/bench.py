@@ -0,0 +1,135 @@
+"""Small benchmark harness: throughput, per-call latency percentiles and allocations.
+
+Results convert to plain dicts (`to_json`) so they can be written to JSON and
+compared between commits with `compare`.
+"""
+
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
+
+
+class BenchResult(NamedTuple):
+    name: str
+    calls: int
+    ops_per_sec: float
+    p50_ns: float
+    p99_ns: float
+    bytes_per_call: float  # Memory still held by the results, per call
+
+
+def _percentile(sorted_values: Sequence[int], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return float(sorted_values[index])
+
+
+def run_case(name: str, fn: Callable[[Any], Any], args: Sequence[Any], repeat: int = 5) -> BenchResult:
+    """Benchmarks fn called once per element of args.
+
+    Throughput is the best of `repeat` timed loops. Latency percentiles come
+    from timing every call individually in a separate loop, and allocations
+    from a tracemalloc run that keeps every result alive.
+    """
+    for arg in args[:100]:  # Warm up
+        fn(arg)
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for arg in args:
+            fn(arg)
+        best = min(best, time.perf_counter() - start)
+
+    clock = time.perf_counter_ns
+    latencies = []
+    for arg in args:
+        start_ns = clock()
+        fn(arg)
+        latencies.append(clock() - start_ns)
+    latencies.sort()
+
+    results: list[Any] = [None] * len(args)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i, arg in enumerate(args):
+        results[i] = fn(arg)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    return BenchResult(
+        name=name,
+        calls=len(args),
+        ops_per_sec=len(args) / best if best > 0 else float("inf"),
+        p50_ns=_percentile(latencies, 0.50),
+        p99_ns=_percentile(latencies, 0.99),
+        bytes_per_call=(after - before) / len(args),
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def to_json(results: Iterable[BenchResult], seed: int) -> dict[str, Any]:
+    """Returns results plus enough metadata to tell runs apart."""
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "results": [result._asdict() for result in results],
+    }
+
+
+def format_results(results: Iterable[BenchResult]) -> str:
+    lines = [f"{'case':<36} {'ops/sec':>14} {'p50 ns':>10} {'p99 ns':>10} {'bytes/call':>11}"]
+    for r in results:
+        lines.append(
+            f"{r.name:<36} {r.ops_per_sec:>14,.0f} {r.p50_ns:>10,.0f} {r.p99_ns:>10,.0f} {r.bytes_per_call:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.10) -> tuple[str, bool]:
+    """Compares two JSON result sets case by case.
+
+    Returns:
+        A text table of throughput ratios (current / baseline) and whether any
+        case lost more than `threshold` of its baseline throughput.
+    """
+    old = {r["name"]: r for r in baseline["results"]}
+    lines = [f"{'case':<36} {'baseline':>14} {'current':>14} {'ratio':>7}"]
+    regressed = False
+    for r in current["results"]:
+        if r["name"] not in old:
+            continue
+        before = old[r["name"]]["ops_per_sec"]
+        ratio = r["ops_per_sec"] / before if before else float("inf")
+        flag = ""
+        if ratio < 1 - threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        lines.append(f"{r['name']:<36} {before:>14,.0f} {r['ops_per_sec']:>14,.0f} {ratio:>6.2f}x{flag}")
+    return "\n".join(lines), regressed
+
+
+def write_json(path: str, data: dict[str, Any]) -> None:
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def read_json(path: str) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
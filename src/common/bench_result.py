@@ -0,0 +1,84 @@
+"""Benchmark: slotted Ok/Err and interned errors versus the NamedTuple originals.
+
+Run from src/:
+
+    python -m common.bench_result
+"""
+
+import timeit
+import tracemalloc
+from enum import Enum, auto
+from typing import Generic, NamedTuple, TypeVar
+
+from common.result import Ok, Err, interned_err
+
+T = TypeVar("T")
+E = TypeVar("E")
+
+N = 1_000_000
+
+
+# The original NamedTuple representation
+class TupleOk(NamedTuple, Generic[T]):
+    value: T
+
+
+class TupleErr(NamedTuple, Generic[E]):
+    error: E
+
+
+class Kind(Enum):
+    BAD = auto()
+
+
+def _unwrap(result, ok_cls, err_cls):
+    match result:
+        case ok_cls(value):
+            return value
+        case err_cls(error):
+            return error
+
+
+def _traced_bytes(build) -> int:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    items = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return after - before
+
+
+def _bytes_per_instance(make) -> float:
+    values = list(range(N))
+    # Subtract the list holding the instances
+    with_instances = _traced_bytes(lambda: [make(v) for v in values])
+    list_only = _traced_bytes(lambda: [v for v in values])
+    return (with_instances - list_only) / N
+
+
+def _ops_per_sec(fn) -> float:
+    seconds = min(timeit.repeat(fn, number=N, repeat=3))
+    return N / seconds
+
+
+def main() -> None:
+    tuple_err = TupleErr(Kind.BAD)
+    slot_err = interned_err(Kind.BAD)
+    rows = [
+        ("construct Ok (NamedTuple)", lambda: TupleOk(42), lambda i: TupleOk(i)),
+        ("construct Ok (slots)", lambda: Ok(42), lambda i: Ok(i)),
+        ("construct Err (NamedTuple)", lambda: TupleErr(Kind.BAD), lambda i: TupleErr(Kind.BAD)),
+        ("construct Err (slots)", lambda: Err(Kind.BAD), lambda i: Err(Kind.BAD)),
+        ("interned Err", lambda: interned_err(Kind.BAD), lambda i: interned_err(Kind.BAD)),
+        ("match Err (NamedTuple)", lambda: _unwrap(tuple_err, TupleOk, TupleErr), None),
+        ("match Err (slots)", lambda: _unwrap(slot_err, Ok, Err), None),
+    ]
+    print(f"{'case':<28} {'ops/sec':>14} {'bytes/instance':>16}")
+    for name, op, make in rows:
+        size = f"{_bytes_per_instance(make):.1f}" if make else "-"
+        print(f"{name:<28} {_ops_per_sec(op):>14,.0f} {size:>16}")
+
+
+if __name__ == "__main__":
+    main()
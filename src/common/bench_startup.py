@@ -0,0 +1,87 @@
+"""Startup benchmark: import time of every script in [project.scripts].
+
+Runs `python -X importtime` on each entry point's module in a fresh process
+with stdout piped, and reports the best cumulative import time over several
+runs plus whether colorful was imported:
+
+    python -m common.bench_startup --output startup.json
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Sequence
+
+from common.bench import write_json
+
+PYPROJECT = Path(__file__).resolve().parents[2] / "pyproject.toml"
+SRC = Path(__file__).resolve().parents[1]
+
+
+class StartupResult(NamedTuple):
+    script: str
+    module: str
+    import_us: int  # Best cumulative import time of the entry module
+    imports_colorful: bool
+
+
+def entry_points(pyproject: Path = PYPROJECT) -> dict[str, str]:
+    """Returns {script name: module} for every [project.scripts] entry."""
+    with open(pyproject, "rb") as f:
+        scripts = tomllib.load(f)["project"]["scripts"]
+    return {name: target.split(":")[0] for name, target in scripts.items()}
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Imports module in a fresh interpreter and returns {module: cumulative us}."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(script: str, module: str, runs: int = 5) -> StartupResult:
+    best = None
+    imports_colorful = False
+    for _ in range(runs):
+        times = _import_times(module)
+        best = times[module] if best is None else min(best, times[module])
+        imports_colorful = imports_colorful or "colorful" in times
+    return StartupResult(script, module, best or 0, imports_colorful)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure import time of every [project.scripts] entry point.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per script; the best is kept")
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = [measure(script, module, args.runs) for script, module in entry_points().items()]
+
+    print(f"{'script':<24} {'module':<20} {'import us':>10} {'colorful':>9}")
+    for r in results:
+        print(f"{r.script:<24} {r.module:<20} {r.import_us:>10,} {'yes' if r.imports_colorful else 'no':>9}")
+
+    if args.output:
+        data: dict[str, Any] = {"results": [r._asdict() for r in results]}
+        write_json(args.output, data)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,84 @@
-from typing import Generic, TypeVar, NamedTuple
+from enum import Enum
+from functools import cache
+from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
 E = TypeVar("E")
 
 
-class Ok(NamedTuple, Generic[T]):
+# Ok and Err are plain __slots__ classes rather than NamedTuples: they are
+# smaller, about twice as fast to construct, and an Ok never compares equal to
+# an Err (or to a bare tuple) holding the same value. Like the NamedTuples they
+# replaced they are immutable, since `interned_err` hands out shared instances.
+class Ok(Generic[T]):
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
     value: T
 
+    def __init__(self, value: T) -> None:
+        _set_value(self, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Ok is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Ok is immutable")
+
+    # Rebuilt through __init__, since the default slot restore goes through __setattr__
+    def __reduce__(self) -> tuple[type, tuple[Any]]:
+        return Ok, (self.value,)
+
+    def __eq__(self, other: Any) -> bool:
+        return other.__class__ is Ok and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash((Ok, self.value))
+
+    def __repr__(self) -> str:
+        return f"Ok(value={self.value!r})"
+
+
+# The slots' own setters skip the __setattr__ guards, and are faster than object.__setattr__
+_set_value = Ok.value.__set__
+
+
+class Err(Generic[E]):
+    __slots__ = ("error",)
+    __match_args__ = ("error",)
 
-class Err(NamedTuple, Generic[E]):
     error: E
 
+    def __init__(self, error: E) -> None:
+        _set_error(self, error)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Err is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Err is immutable")
+
+    # Rebuilt through __init__, since the default slot restore goes through __setattr__
+    def __reduce__(self) -> tuple[type, tuple[Any]]:
+        return Err, (self.error,)
+
+    def __eq__(self, other: Any) -> bool:
+        return other.__class__ is Err and self.error == other.error
+
+    def __hash__(self) -> int:
+        return hash((Err, self.error))
+
+    def __repr__(self) -> str:
+        return f"Err(error={self.error!r})"
+
+
+_set_error = Err.error.__set__
+
 
 type Result[T, E] = Ok[T] | Err[E]
+
+
+@cache
+def interned_err[K: Enum](error: K) -> Err[K]:
+    """Returns the shared Err instance for an enum-valued error."""
+    return Err(error)
@@ -0,0 +1,140 @@
+"""A column of results stored as parallel arrays instead of one object per row."""
+
+from typing import Any, Callable, Generic, Iterable, Iterator, Sequence, TypeVar
+
+from common.result import Ok, Err, Result
+
+T = TypeVar("T")
+E = TypeVar("E")
+U = TypeVar("U")
+
+# Lazy step kinds
+_MAP = 0
+_AND_THEN = 1
+_FILTER_OK = 2
+
+
+class ResultBatch(Generic[T, E]):
+    """A column of results: row i is `Ok(oks[i])` if `mask[i]` else `Err(errs[i])`.
+
+    `map`, `and_then` and `filter_ok` are lazy: they return a new batch that
+    records the step, and all recorded steps run fused in a single pass over
+    the rows when the batch is materialized (`collect`, `partition`, iteration).
+    The materialized batch is kept, so the steps run at most once per batch.
+
+    >>> batch = ResultBatch([1, 2, 3], [None, None, None], b"\\x01\\x01\\x01")
+    >>> batch.map(lambda v: v * 10).filter_ok(lambda v: v > 10).partition()
+    ([20, 30], [])
+    """
+
+    __slots__ = ("oks", "errs", "mask", "_steps", "_collected")
+
+    oks: Sequence[T]
+    errs: Sequence[E]
+    mask: bytes | bytearray
+
+    def __init__(
+        self,
+        oks: Sequence[T],
+        errs: Sequence[E],
+        mask: bytes | bytearray,
+        _steps: tuple[tuple[int, Callable[[Any], Any]], ...] = (),
+    ) -> None:
+        if not len(oks) == len(errs) == len(mask):
+            raise ValueError("oks, errs and mask must have the same length")
+        self.oks = oks
+        self.errs = errs
+        self.mask = mask
+        self._steps = _steps
+        self._collected: "ResultBatch[T, E] | None" = None
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result[T, E]]) -> "ResultBatch[T, E]":
+        """Builds a batch from Ok/Err objects."""
+        oks: list[Any] = []
+        errs: list[Any] = []
+        mask = bytearray()
+        for result in results:
+            match result:
+                case Ok(value):
+                    oks.append(value)
+                    errs.append(None)
+                    mask.append(1)
+                case Err(error):
+                    oks.append(None)
+                    errs.append(error)
+                    mask.append(0)
+        return cls(oks, errs, mask)
+
+    def _with_step(self, kind: int, f: Callable[[Any], Any]) -> "ResultBatch[Any, Any]":
+        return ResultBatch(self.oks, self.errs, self.mask, self._steps + ((kind, f),))
+
+    def map(self, f: Callable[[T], U]) -> "ResultBatch[U, E]":
+        """Lazily applies f to every Ok value."""
+        return self._with_step(_MAP, f)
+
+    def and_then(self, f: Callable[[T], Result[U, E]]) -> "ResultBatch[U, E]":
+        """Lazily applies f to every Ok value; an Err from f replaces the row."""
+        return self._with_step(_AND_THEN, f)
+
+    def filter_ok(self, predicate: Callable[[T], bool]) -> "ResultBatch[T, E]":
+        """Lazily drops Ok rows whose value fails predicate. Err rows are kept."""
+        return self._with_step(_FILTER_OK, predicate)
+
+    def collect(self) -> "ResultBatch[T, E]":
+        """Runs all pending steps in one pass and returns a materialized batch."""
+        steps = self._steps
+        if not steps:
+            return self
+        if self._collected is not None:
+            return self._collected
+
+        oks: list[Any] = []
+        errs: list[Any] = []
+        mask = bytearray()
+        for value, error, ok in zip(self.oks, self.errs, self.mask):
+            keep = True
+            if ok:
+                for kind, f in steps:
+                    if kind == _MAP:
+                        value = f(value)
+                    elif kind == _AND_THEN:
+                        result = f(value)
+                        if not isinstance(result, Ok):
+                            ok = 0
+                            error = result.error
+                            break
+                        value = result.value
+                    elif not f(value):
+                        keep = False
+                        break
+            if not keep:
+                continue
+            if ok:
+                oks.append(value)
+                errs.append(None)
+                mask.append(1)
+            else:
+                oks.append(None)
+                errs.append(error)
+                mask.append(0)
+        self._collected = ResultBatch(oks, errs, mask)
+        return self._collected
+
+    def partition(self) -> tuple[list[T], list[E]]:
+        """Materializes the batch into its Ok values and its Err errors."""
+        batch = self.collect()
+        oks = [value for value, ok in zip(batch.oks, batch.mask) if ok]
+        errs = [error for error, ok in zip(batch.errs, batch.mask) if not ok]
+        return oks, errs
+
+    def __len__(self) -> int:
+        # Only filter_ok drops rows, so without it no step needs to run
+        if all(kind != _FILTER_OK for kind, _ in self._steps):
+            return len(self.mask)
+        return len(self.collect().mask)
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        batch = self.collect()
+        for value, error, ok in zip(batch.oks, batch.errs, batch.mask):
+            yield Ok(value) if ok else Err(error)
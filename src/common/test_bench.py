@@ -0,0 +1,25 @@
+"""Tests for the benchmark harness."""
+
+from common.bench import compare, run_case, to_json
+
+
+def test_run_case_reports_every_metric():
+    """Test run_case returns throughput, latency and allocation numbers."""
+    result = run_case("list", lambda n: [0] * n, [10] * 200, repeat=1)
+    assert result.name == "list"
+    assert result.calls == 200
+    assert result.ops_per_sec > 0
+    assert 0 < result.p50_ns <= result.p99_ns
+    assert result.bytes_per_call > 0
+
+
+def test_compare_flags_regressions():
+    """Test compare reports cases that lost more than the threshold."""
+    fast = run_case("case", str, list(range(100)), repeat=1)
+    baseline = to_json([fast], seed=0)
+    current = to_json([fast._replace(ops_per_sec=fast.ops_per_sec / 2)], seed=0)
+    table, regressed = compare(baseline, current, threshold=0.10)
+    assert regressed
+    assert "REGRESSION" in table
+    _, regressed = compare(baseline, baseline)
+    assert not regressed
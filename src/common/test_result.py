@@ -0,0 +1,76 @@
+"""Tests for the Result types."""
+
+import copy
+import pickle
+from enum import Enum, auto
+
+import pytest
+
+from common.result import Ok, Err, interned_err
+
+
+class Kind(Enum):
+    A = auto()
+    B = auto()
+
+
+def describe(result):
+    match result:
+        case Ok(value):
+            return f"ok {value}"
+        case Err(error):
+            return f"err {error}"
+
+
+def test_match_patterns():
+    """Test Ok and Err work with positional match patterns."""
+    assert describe(Ok(1)) == "ok 1"
+    assert describe(Err("bad")) == "err bad"
+
+
+def test_equality():
+    """Test results compare by type and payload."""
+    assert Ok(1) == Ok(1)
+    assert Ok(1) != Ok(2)
+    assert Ok(1) != Err(1)
+    assert Ok(1) != (1,)
+    assert hash(Err(Kind.A)) == hash(Err(Kind.A))
+
+
+def test_repr():
+    """Test the repr names the payload field."""
+    assert repr(Ok(42)) == "Ok(value=42)"
+    assert repr(Err(Kind.A)) == "Err(error=<Kind.A: 1>)"
+
+
+def test_slots():
+    """Test results do not carry a per-instance __dict__."""
+    assert not hasattr(Ok(1), "__dict__")
+    assert not hasattr(Err(1), "__dict__")
+
+
+def test_immutable():
+    """Test fields cannot be set or deleted, so shared instances stay intact."""
+    for result, field in ((Ok(1), "value"), (interned_err(Kind.A), "error")):
+        with pytest.raises(AttributeError):
+            setattr(result, field, 2)
+        with pytest.raises(AttributeError):
+            delattr(result, field)
+    assert interned_err(Kind.A) == Err(Kind.A)
+
+
+def test_pickle_and_copy():
+    """Test results survive pickling, copy and deepcopy, e.g. to cross a process boundary."""
+    for result in (Ok([1, 2]), Err(Kind.B), interned_err(Kind.A)):
+        for clone in (pickle.loads(pickle.dumps(result)), copy.copy(result), copy.deepcopy(result)):
+            assert clone == result
+            assert clone.__class__ is result.__class__
+    value = [1]
+    assert copy.deepcopy(Ok(value)).value is not value
+
+
+def test_interned_err():
+    """Test enum-valued errors share one Err instance per member."""
+    assert interned_err(Kind.A) is interned_err(Kind.A)
+    assert interned_err(Kind.A) is not interned_err(Kind.B)
+    assert interned_err(Kind.A) == Err(Kind.A)
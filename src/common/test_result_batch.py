@@ -0,0 +1,74 @@
+"""Tests for ResultBatch."""
+
+from common.result import Ok, Err
+from common.result_batch import ResultBatch
+
+
+def make_batch():
+    return ResultBatch.from_results([Ok(1), Err("bad"), Ok(2), Ok(3)])
+
+
+def test_from_results_round_trip():
+    """Test iterating a batch yields the original results."""
+    assert list(make_batch()) == [Ok(1), Err("bad"), Ok(2), Ok(3)]
+
+
+def test_map_only_touches_oks():
+    """Test map transforms Ok values and leaves errors alone."""
+    assert list(make_batch().map(lambda v: v * 10)) == [Ok(10), Err("bad"), Ok(20), Ok(30)]
+
+
+def test_and_then_can_fail_rows():
+    """Test and_then turns rows into errors when the step fails."""
+    batch = make_batch().and_then(lambda v: Ok(v) if v % 2 else Err("even"))
+    assert list(batch) == [Ok(1), Err("bad"), Err("even"), Ok(3)]
+
+
+def test_filter_ok_drops_rows():
+    """Test filter_ok drops Ok rows failing the predicate but keeps errors."""
+    batch = make_batch().filter_ok(lambda v: v > 1)
+    assert list(batch) == [Err("bad"), Ok(2), Ok(3)]
+    assert len(batch) == 3
+
+
+def test_steps_are_lazy_and_fused():
+    """Test steps run only on materialization, row by row in order."""
+    calls = []
+
+    def record(name):
+        def step(v):
+            calls.append((name, v))
+            return v
+
+        return step
+
+    batch = ResultBatch([1, 2], [None, None], b"\x01\x01").map(record("a")).map(record("b"))
+    assert calls == []
+    batch.collect()
+    assert calls == [("a", 1), ("b", 1), ("a", 2), ("b", 2)]
+
+
+def test_partition():
+    """Test partition splits values and errors."""
+    oks, errs = make_batch().map(lambda v: v + 1).partition()
+    assert oks == [2, 3, 4]
+    assert errs == ["bad"]
+
+
+def test_steps_run_once():
+    """Test len, iteration and partition reuse one materialization, and len without filter_ok runs no step."""
+    calls = []
+
+    def double(v):
+        calls.append(v)
+        return v * 2
+
+    batch = make_batch().map(double)
+    assert len(batch) == 4
+    assert calls == []
+    assert list(batch) == [Ok(2), Err("bad"), Ok(4), Ok(6)]
+    assert batch.partition() == ([2, 4, 6], ["bad"])
+    filtered = batch.filter_ok(lambda v: v > 2)
+    assert len(filtered) == 3
+    assert filtered.partition() == ([4, 6], ["bad"])
+    assert calls == [1, 2, 3, 1, 2, 3]
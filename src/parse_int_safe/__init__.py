@@ -1,9 +1,10 @@
 """Safe integer parsing with optional bounds validation."""
 
 from enum import Enum, auto
-from typing import NamedTuple, Optional
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional
 import sys
-from common.result import Result, Ok, Err
+from common.result import Result, Ok, Err, interned_err
 
 
 class ParseIntErrorKind(Enum):
@@ -12,22 +13,118 @@ class ParseIntErrorKind(Enum):
     TOO_HIGH = auto()
 
 
+# Shared Err instances; failures never allocate
+_ERR_NOT_AN_INTEGER = interned_err(ParseIntErrorKind.NOT_AN_INTEGER)
+_ERR_TOO_LOW = interned_err(ParseIntErrorKind.TOO_LOW)
+_ERR_TOO_HIGH = interned_err(ParseIntErrorKind.TOO_HIGH)
+
+
 class Bounds(NamedTuple):
     min: Optional[int] = None
     max: Optional[int] = None
 
 
-def parse_int_safe(s: str, bounds: Bounds = Bounds()) -> Result[int, ParseIntErrorKind]:
-    """Safely parse string to int with optional bounds."""
+# Strings up to this length are below every allowed `sys.set_int_max_str_digits`
+# limit, so `int()` can never reject them for being too long.
+_FAST_PATH_MAX_LEN = sys.int_info.str_digits_check_threshold
+
+
+def _parse_int(s: str) -> Optional[int]:
+    """Parse like `int(s.strip())`, returning None instead of raising.
+
+    ASCII input is validated up front (sign, digits, single underscores between
+    digits), so the common valid and invalid cases never raise. Anything else,
+    e.g. Unicode digits or very long input, is left to `int()`.
+    """
+    t = s.strip()
+    digits = t[1:] if t[:1] in ("+", "-") else t
+    if digits.isascii() and len(digits) <= _FAST_PATH_MAX_LEN:
+        if digits.isdigit():
+            return int(t)
+        if (
+            "_" in digits
+            and digits[0] != "_"
+            and digits[-1] != "_"
+            and "__" not in digits
+            and digits.replace("_", "").isdigit()
+        ):
+            return int(t)
+        return None
     try:
-        val = int(s.strip())
-        if bounds.min is not None and val < bounds.min:
-            return Err(ParseIntErrorKind.TOO_LOW)
-        if bounds.max is not None and val > bounds.max:
-            return Err(ParseIntErrorKind.TOO_HIGH)
-        return Ok(val)
+        return int(t)
     except ValueError:
-        return Err(ParseIntErrorKind.NOT_AN_INTEGER)
+        return None
+
+
+def parse_int_safe(s: str, bounds: Bounds = Bounds()) -> Result[int, ParseIntErrorKind]:
+    """Safely parse string to int with optional bounds."""
+    val = _parse_int(s)
+    if val is None:
+        return _ERR_NOT_AN_INTEGER
+    if bounds.min is not None and val < bounds.min:
+        return _ERR_TOO_LOW
+    if bounds.max is not None and val > bounds.max:
+        return _ERR_TOO_HIGH
+    return Ok(val)
+
+
+type Parser = Callable[[str], Result[int, ParseIntErrorKind]]
+
+
+@lru_cache(maxsize=256)
+def make_parser(bounds: Bounds = Bounds()) -> Parser:
+    """Returns a parse function specialized for the given bounds.
+
+    Which bounds are set is resolved once, when the parser is built, instead of
+    on every call. Parsers are cached per distinct `Bounds` value.
+
+    >>> parse_age = make_parser(Bounds(min=0, max=100))
+    >>> parse_age("42")
+    Ok(value=42)
+    """
+    lo, hi = bounds
+
+    if lo is None and hi is None:
+
+        def parse(s: str) -> Result[int, ParseIntErrorKind]:
+            val = _parse_int(s)
+            if val is None:
+                return _ERR_NOT_AN_INTEGER
+            return Ok(val)
+
+    elif hi is None:
+
+        def parse(s: str) -> Result[int, ParseIntErrorKind]:
+            val = _parse_int(s)
+            if val is None:
+                return _ERR_NOT_AN_INTEGER
+            if val < lo:
+                return _ERR_TOO_LOW
+            return Ok(val)
+
+    elif lo is None:
+
+        def parse(s: str) -> Result[int, ParseIntErrorKind]:
+            val = _parse_int(s)
+            if val is None:
+                return _ERR_NOT_AN_INTEGER
+            if val > hi:
+                return _ERR_TOO_HIGH
+            return Ok(val)
+
+    else:
+
+        def parse(s: str) -> Result[int, ParseIntErrorKind]:
+            val = _parse_int(s)
+            if val is None:
+                return _ERR_NOT_AN_INTEGER
+            if val < lo:
+                return _ERR_TOO_LOW
+            if val > hi:
+                return _ERR_TOO_HIGH
+            return Ok(val)
+
+    return parse
 
 
 def main(
@@ -0,0 +1,175 @@
+"""Batch (columnar) integer parsing.
+
+Parses many strings at once and returns two parallel compact arrays instead of
+one `Ok`/`Err` object per input.
+"""
+
+from array import array
+from itertools import batched, compress
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from common.result_batch import ResultBatch
+from parse_int_safe import Bounds, ParseIntErrorKind, _parse_int
+
+# Error code stored for rows that parsed successfully. Failed rows store the
+# `ParseIntErrorKind` value (1, 2 or 3).
+ERROR_CODE_OK = 0
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+_NOT_AN_INTEGER = ParseIntErrorKind.NOT_AN_INTEGER.value
+_TOO_LOW = ParseIntErrorKind.TOO_LOW.value
+_TOO_HIGH = ParseIntErrorKind.TOO_HIGH.value
+
+# Error kind by error code
+_KINDS: tuple[Optional[ParseIntErrorKind], ...] = (None, *ParseIntErrorKind)
+_KIND_NAMES = {kind.value: kind.name for kind in ParseIntErrorKind}
+
+
+class ParsedBatch(NamedTuple):
+    """Columnar parse output.
+
+    `values[i]` holds the parsed value of row i (0 for failed rows) and
+    `errors[i]` holds `ERROR_CODE_OK` or the `ParseIntErrorKind` value.
+    """
+
+    values: array  # array("q")
+    errors: array  # array("B")
+
+
+def error_kind(code: int) -> Optional[ParseIntErrorKind]:
+    """Returns the error kind for an error code, or None for `ERROR_CODE_OK`."""
+    return _KINDS[code]
+
+
+def _effective_bounds(bounds: Bounds) -> tuple[int, int]:
+    """Returns the bounds intersected with the int64 range of the values column."""
+    lo = INT64_MIN if bounds.min is None else max(bounds.min, INT64_MIN)
+    hi = INT64_MAX if bounds.max is None else min(bounds.max, INT64_MAX)
+    return lo, hi
+
+
+def parse_int_safe_many(strings: Iterable[str], bounds: Bounds = Bounds()) -> ParsedBatch:
+    """Parse many strings into columnar output.
+
+    Semantics match `parse_int_safe` row by row, except that the values column
+    is int64: values outside that range are reported as TOO_LOW / TOO_HIGH.
+
+    >>> batch = parse_int_safe_many(["1", "x", "300"], Bounds(max=255))
+    >>> batch.values.tolist(), batch.errors.tolist()
+    ([1, 0, 0], [0, 1, 3])
+    """
+    parsed = [_parse_int(s) for s in strings]
+
+    # Bounds pass over the whole batch
+    lo, hi = _effective_bounds(bounds)
+    errors = array(
+        "B",
+        [
+            _NOT_AN_INTEGER if v is None else _TOO_LOW if v < lo else _TOO_HIGH if v > hi else ERROR_CODE_OK
+            for v in parsed
+        ],
+    )
+    values = array("q", [0 if code else v for v, code in zip(parsed, errors)])
+    return ParsedBatch(values, errors)
+
+
+def to_result_batch(batch: ParsedBatch) -> ResultBatch[int, ParseIntErrorKind]:
+    """Wraps columnar parse output in a ResultBatch for chaining validation steps."""
+    errors = batch.errors
+    return ResultBatch(batch.values, [_KINDS[code] for code in errors], bytes(code == ERROR_CODE_OK for code in errors))
+
+
+class ValidationReport(NamedTuple):
+    """Failures found while validating rows, stored as compact parallel arrays.
+
+    `offsets[i]` is the 0-based row of the i-th failure and `kinds[i]` its
+    error code.
+    """
+
+    rows: int  # Rows validated, through the last recorded failure when stopped early
+    offsets: array  # array("q")
+    kinds: array  # array("B")
+    stopped_early: bool  # True when max_errors was reached and later rows were skipped
+
+    def counts(self) -> dict[ParseIntErrorKind, int]:
+        """Returns the number of failures per error kind."""
+        return {kind: self.kinds.count(kind.value) for kind in ParseIntErrorKind}
+
+
+def validate_batches(batches: Iterable[ParsedBatch], max_errors: Optional[int] = None) -> ValidationReport:
+    """Collects the failures of consecutive batches into a ValidationReport.
+
+    Args:
+        batches: Parsed batches of consecutive rows
+        max_errors: Stop after this many failures. The report only says it
+            stopped early when a row after the last recorded failure exists;
+            to find out, at most one more batch is consumed.
+    """
+    offsets = array("q")
+    kinds = array("B")
+    rows = 0
+    full = False  # max_errors failures recorded, ending on the last row so far
+    for batch in batches:
+        errors = batch.errors
+        if full:
+            if errors:
+                return ValidationReport(rows, offsets, kinds, True)
+            continue
+        offsets.extend(compress(range(rows, rows + len(errors)), errors))
+        kinds.extend(compress(errors, errors))
+        rows += len(errors)
+        if max_errors is not None and len(offsets) >= max_errors:
+            del offsets[max_errors:]
+            del kinds[max_errors:]
+            last = offsets[-1] + 1 if offsets else 0
+            if last < rows:
+                return ValidationReport(last, offsets, kinds, True)
+            full = True
+    return ValidationReport(rows, offsets, kinds, False)
+
+
+def validate_many(
+    strings: Iterable[str],
+    bounds: Bounds = Bounds(),
+    max_errors: Optional[int] = None,
+    chunk_size: int = 1 << 16,
+) -> ValidationReport:
+    """Validates strings chunk by chunk, recording only the failures.
+
+    >>> report = validate_many(["1", "x", "3", "-1"], Bounds(min=0))
+    >>> report.offsets.tolist(), report.kinds.tolist()
+    ([1, 3], [1, 2])
+    """
+    batches = (parse_int_safe_many(chunk, bounds) for chunk in batched(strings, chunk_size))
+    return validate_batches(batches, max_errors)
+
+
+# Failures per block of text yielded by format_report_chunks
+REPORT_CHUNK_ROWS = 1 << 14
+
+
+def format_report_chunks(
+    report: ValidationReport, limit: Optional[int] = 20, chunk_rows: int = REPORT_CHUNK_ROWS
+) -> Iterator[str]:
+    """Yields the text of format_report in blocks of up to chunk_rows failures, so it is never one huge string."""
+    stopped = " (stopped early)" if report.stopped_early else ""
+    header = [f"rows: {report.rows}", f"errors: {len(report.offsets)}{stopped}"]
+    header.extend(f"{kind.name}: {count}" for kind, count in report.counts().items())
+    yield "\n".join(header) + "\n"
+
+    shown = len(report.offsets) if limit is None else min(limit, len(report.offsets))
+    for start in range(0, shown, chunk_rows):
+        end = min(start + chunk_rows, shown)
+        yield "".join(
+            f"{offset + 1}\t{_KIND_NAMES[kind]}\n"
+            for offset, kind in zip(report.offsets[start:end], report.kinds[start:end])
+        )
+    if shown < len(report.offsets):
+        yield f"... {len(report.offsets) - shown} more\n"
+
+
+def format_report(report: ValidationReport, limit: Optional[int] = 20) -> str:
+    """Formats a report as text: per-kind counts, then up to limit failures by line number."""
+    return "".join(format_report_chunks(report, limit))
@@ -0,0 +1,120 @@
+"""Benchmarks for parse_int_safe, Ok/Err construction and the CLI main loop.
+
+    python -m parse_int_safe.bench_parse_int_safe --output after.json --compare before.json
+
+Inputs come from seeded generators, so runs with the same --seed and -n use
+identical data and their JSON results can be compared between commits.
+"""
+
+import argparse
+import random
+import sys
+from typing import Callable, Optional, Sequence
+
+from common.bench import BenchResult, compare, format_results, read_json, run_case, to_json, write_json
+from common.result import Err, Ok
+from parse_int_safe import Bounds, ParseIntErrorKind, make_parser, parse_int_safe
+from parse_int_safe import main as cli_main
+from parse_int_safe.batch import parse_int_safe_many
+
+
+def valid_inputs(rng: random.Random, n: int) -> list[str]:
+    return [str(rng.randint(-1_000_000, 1_000_000)) for _ in range(n)]
+
+
+def invalid_inputs(rng: random.Random, n: int) -> list[str]:
+    junk = ["abc", "12.5", "42abc", "", "   ", "0x1f", "1e3", "--1", "1__0", "NaN"]
+    return [rng.choice(junk) for _ in range(n)]
+
+
+def padded_inputs(rng: random.Random, n: int) -> list[str]:
+    pads = [" ", "  ", "\t", "\n", " \t "]
+    return [f"{rng.choice(pads)}{rng.randint(-1000, 1000)}{rng.choice(pads)}" for _ in range(n)]
+
+
+def huge_inputs(rng: random.Random, n: int) -> list[str]:
+    return [str(rng.getrandbits(rng.randint(64, 2048))) for _ in range(n)]
+
+
+def bounded_inputs(rng: random.Random, n: int) -> list[str]:
+    # About a third each of too low, in range and too high for BOUNDS
+    return [str(rng.randint(-100, 200)) for _ in range(n)]
+
+
+BOUNDS = Bounds(min=0, max=100)
+
+GENERATORS: dict[str, Callable[[random.Random, int], list[str]]] = {
+    "valid": valid_inputs,
+    "invalid": invalid_inputs,
+    "padded": padded_inputs,
+    "huge": huge_inputs,
+    "bounded": bounded_inputs,
+}
+
+
+def _run_main(answers: Sequence[str]) -> None:
+    it = iter(answers)
+    cli_main(input_fn=lambda _: next(it), output_fn=lambda *_: None, exit_fn=lambda _: None)
+
+
+def run(seed: int = 0, n: int = 20_000) -> list[BenchResult]:
+    """Runs every benchmark case with inputs generated from seed."""
+    results: list[BenchResult] = []
+    data = {name: gen(random.Random(seed), n) for name, gen in GENERATORS.items()}
+
+    for name, inputs in data.items():
+        results.append(run_case(f"parse_int_safe/{name}", parse_int_safe, inputs))
+
+    parse_bounded = make_parser(BOUNDS)
+    results.append(run_case("parse_int_safe/bounded+bounds", lambda s: parse_int_safe(s, BOUNDS), data["bounded"]))
+    results.append(run_case("make_parser/bounded+bounds", parse_bounded, data["bounded"]))
+
+    # One call parses the whole batch; report per-row numbers
+    batch = run_case("parse_int_safe_many/bounded", lambda rows: parse_int_safe_many(rows, BOUNDS), [data["bounded"]])
+    results.append(
+        batch._replace(
+            calls=n,
+            ops_per_sec=batch.ops_per_sec * n,
+            p50_ns=batch.p50_ns / n,
+            p99_ns=batch.p99_ns / n,
+            bytes_per_call=batch.bytes_per_call / n,
+        )
+    )
+
+    ints = list(range(n))
+    results.append(run_case("Ok(value)", Ok, ints))
+    results.append(run_case("Err(kind)", Err, [ParseIntErrorKind.NOT_AN_INTEGER] * n))
+
+    rng = random.Random(seed)
+    sessions = [["Alice", *rng.choices(["abc", "-5", "500"], k=rng.randint(0, 2)), "42"] for _ in range(n // 10)]
+    results.append(run_case("main/session", _run_main, sessions))
+
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark parse_int_safe and common.result.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-n", type=int, default=20_000, help="inputs per case")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="compare against a previous JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="throughput loss reported as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.seed, args.n)
+    print(format_results(results))
+
+    data = to_json(results, args.seed)
+    if args.output:
+        write_json(args.output, data)
+
+    if args.compare:
+        table, regressed = compare(read_json(args.compare), data, args.threshold)
+        print()
+        print(table)
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Multi-process parsing of large newline-delimited files.
+
+The file is memory-mapped and split into newline-aligned byte ranges. Each
+range is parsed by a worker process and the per-range batches are merged in
+input order, so the result is identical to the sequential path.
+"""
+
+import itertools
+import mmap
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
+
+from parse_int_safe import Bounds
+from parse_int_safe.batch import ParsedBatch, parse_int_safe_many
+from parse_int_safe.stream import iter_line_chunks, parse_chunks
+
+DEFAULT_RANGE_SIZE = 8 << 20  # 8 MiB
+
+# Ranges submitted ahead of the consumer, per worker. Finished batches wait
+# in their futures until they are yielded, so this bounds memory when the
+# consumer is slower than the workers.
+_IN_FLIGHT_PER_WORKER = 2
+
+
+def split_ranges(buffer: mmap.mmap | bytes, range_size: int = DEFAULT_RANGE_SIZE) -> list[tuple[int, int]]:
+    """Splits a buffer into (start, end) byte ranges that each end after a newline.
+
+    Every range except possibly the last ends with "\\n"; ranges are roughly
+    range_size bytes, longer when a line crosses the boundary.
+    """
+    size = len(buffer)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    while start < size:
+        end = start + range_size
+        if end < size:
+            newline = buffer.find(b"\n", end - 1)
+            end = size if newline < 0 else newline + 1
+        else:
+            end = size
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _parse_range(path: str, start: int, end: int, bounds: Bounds) -> ParsedBatch:
+    """Worker: parses the lines in [start, end) of the file at path."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = mm[start:end].decode(errors="replace").split("\n")
+    if lines[-1] == "":
+        lines.pop()  # The range ended with a newline
+    return parse_int_safe_many(lines, bounds)
+
+
+def iter_parallel_batches(
+    path: str,
+    bounds: Bounds = Bounds(),
+    workers: Optional[int] = None,
+    range_size: int = DEFAULT_RANGE_SIZE,
+) -> Iterator[ParsedBatch]:
+    """Yields one parsed batch per byte range of the file, in input order.
+
+    At most 2 ranges per worker are parsed ahead of the consumer, so memory
+    stays bounded however large the file is.
+
+    Args:
+        path: File of newline-delimited values
+        bounds: Bounds applied to every value
+        workers: Number of worker processes (default: os.cpu_count()); 1
+            parses in the calling process
+        range_size: Approximate number of bytes per range
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = split_ranges(mm, range_size)
+
+    if workers == 1 or len(ranges) == 1:
+        for start, end in ranges:
+            yield _parse_range(path, start, end, bounds)
+        return
+
+    window = _IN_FLIGHT_PER_WORKER * (workers or os.cpu_count() or 1)
+    pending = iter(ranges)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = deque(
+            executor.submit(_parse_range, path, start, end, bounds) for start, end in itertools.islice(pending, window)
+        )
+        while futures:
+            batch = futures.popleft().result()
+            following = next(pending, None)
+            if following is not None:
+                futures.append(executor.submit(_parse_range, path, *following, bounds))
+            yield batch
+
+
+def _merge(batches: Iterator[ParsedBatch]) -> ParsedBatch:
+    values = array("q")
+    errors = array("B")
+    for batch in batches:
+        values.extend(batch.values)
+        errors.extend(batch.errors)
+    return ParsedBatch(values, errors)
+
+
+def parse_file(path: str, bounds: Bounds = Bounds()) -> ParsedBatch:
+    """Parses every line of a file sequentially into one batch."""
+    with open(path, "rb") as f:
+        return _merge(parse_chunks(iter_line_chunks(f), bounds))
+
+
+def parse_file_parallel(
+    path: str,
+    bounds: Bounds = Bounds(),
+    workers: Optional[int] = None,
+    range_size: int = DEFAULT_RANGE_SIZE,
+) -> ParsedBatch:
+    """Parses every line of a file across worker processes into one batch.
+
+    The result is identical to `parse_file(path, bounds)`.
+    """
+    return _merge(iter_parallel_batches(path, bounds, workers, range_size))
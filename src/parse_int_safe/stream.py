@@ -0,0 +1,206 @@
+"""Streaming (non-interactive) validation of newline-delimited integers.
+
+Reads a file or stdin in fixed-size chunks and writes one result per input line
+as it goes, so memory use does not depend on the input size:
+
+    parse-int-safe-stream export.txt --min 0 --max 100 --errors-only
+    parse-int-safe-stream export.txt --min 0 --report --max-errors 1000
+"""
+
+import argparse
+import sys
+from contextlib import ExitStack
+from typing import BinaryIO, Iterable, Iterator, Optional, Sequence, TextIO
+
+from parse_int_safe import Bounds
+from parse_int_safe.batch import (
+    _KIND_NAMES,
+    ParsedBatch,
+    format_report_chunks,
+    parse_int_safe_many,
+    validate_batches,
+)
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+# Longest line held in memory while waiting for its newline. A longer line is
+# replaced by "", which fails as NOT_AN_INTEGER (int() already rejects more
+# than 4300 digits), so memory stays bounded on input without newlines.
+MAX_LINE_LENGTH = 1 << 20
+
+
+def iter_line_chunks(f: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[str]]:
+    """Yields the lines of a binary stream, one list of decoded lines per chunk.
+
+    Lines are split on "\\n" only; a trailing newline does not produce an extra
+    empty line. Invalid UTF-8 is replaced, so such lines fail to parse, and so
+    do lines longer than MAX_LINE_LENGTH that span chunks.
+    """
+    pending: list[bytes] = []  # Pieces of the line that continues into the next chunk
+    pending_size = 0  # Its length so far, which keeps growing once the pieces are dropped
+
+    def add_pending(piece: bytes) -> None:
+        nonlocal pending_size
+        pending_size += len(piece)
+        if pending_size > MAX_LINE_LENGTH:
+            pending.clear()
+        else:
+            pending.append(piece)
+
+    def finish_line() -> str:
+        nonlocal pending_size
+        line = "" if pending_size > MAX_LINE_LENGTH else b"".join(pending).decode(errors="replace")
+        pending.clear()
+        pending_size = 0
+        return line
+
+    while chunk := f.read(chunk_size):
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            add_pending(chunk)
+            continue
+        lines = []
+        start = 0
+        if pending_size:
+            # The chunk's first line ends the pending one
+            start = chunk.find(b"\n") + 1
+            add_pending(chunk[: start - 1])
+            lines.append(finish_line())
+        if start <= end:
+            lines.extend(chunk[start:end].decode(errors="replace").split("\n"))
+        add_pending(chunk[end + 1 :])
+        yield lines
+    if pending_size:
+        yield [finish_line()]
+
+
+def parse_chunks(chunks: Iterable[list[str]], bounds: Bounds = Bounds()) -> Iterator[ParsedBatch]:
+    """Yields one parsed batch per chunk of lines."""
+    for lines in chunks:
+        yield parse_int_safe_many(lines, bounds)
+
+
+def format_batches(batches: Iterable[ParsedBatch], errors_only: bool = False) -> Iterator[str]:
+    """Yields tab-separated result lines, one block of text per batch.
+
+    Each line is "<line number>\\tok\\t<value>" or "<line number>\\terror\\t<KIND>".
+    """
+    line_no = 1
+    for values, errors in batches:
+        lines: list[str] = []
+        for i, (value, code) in enumerate(zip(values, errors), line_no):
+            if code:
+                lines.append(f"{i}\terror\t{_KIND_NAMES[code]}\n")
+            elif not errors_only:
+                lines.append(f"{i}\tok\t{value}\n")
+        line_no += len(values)
+        yield "".join(lines)
+
+
+def write_batches(batches: Iterable[ParsedBatch], out: TextIO, errors_only: bool = False) -> tuple[int, int]:
+    """Writes results for each batch to out as it arrives.
+
+    Returns:
+        The number of lines read and the number of lines that failed.
+    """
+    total = failed = 0
+
+    def counted(batches: Iterable[ParsedBatch]) -> Iterator[ParsedBatch]:
+        nonlocal total, failed
+        for batch in batches:
+            total += len(batch.errors)
+            failed += len(batch.errors) - batch.errors.count(0)
+            yield batch
+
+    for text in format_batches(counted(batches), errors_only):
+        out.write(text)
+    return total, failed
+
+
+def stream(
+    f: BinaryIO,
+    out: TextIO,
+    bounds: Bounds = Bounds(),
+    errors_only: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[int, int]:
+    """Validates every line of f, writing results to out as it goes.
+
+    Returns:
+        The number of lines read and the number of lines that failed.
+    """
+    return write_batches(parse_chunks(iter_line_chunks(f, chunk_size), bounds), out, errors_only)
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+    stdin: Optional[BinaryIO] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> int:
+    """Streaming CLI program.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+        stdin: Binary stream read when the path is "-" (default: sys.stdin.buffer)
+        stdout: Stream results are written to (default: sys.stdout)
+        stderr: Stream the summary is written to (default: sys.stderr)
+
+    Returns:
+        0 when every line is a valid integer within bounds, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="parse-int-safe-stream",
+        description="Validate newline-delimited integers from a file or stdin.",
+    )
+    parser.add_argument("path", nargs="?", default="-", help='input file, or "-" for stdin (default)')
+    parser.add_argument("--min", type=int, default=None, help="minimum allowed value")
+    parser.add_argument("--max", type=int, default=None, help="maximum allowed value")
+    parser.add_argument("--errors-only", action="store_true", help="only write lines that failed")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="read size in bytes")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="parse a file across this many processes; 0 uses every core (default: 1)",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="write a failure report (counts per kind and failing lines) instead of per-line results",
+    )
+    parser.add_argument("--max-errors", type=int, default=None, help="with --report, stop after this many failures")
+    args = parser.parse_args(argv)
+    if args.max_errors is not None and not args.report:
+        parser.error("--max-errors requires --report")
+
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    bounds = Bounds(min=args.min, max=args.max)
+
+    with ExitStack() as stack:
+        if args.path == "-":
+            batches = parse_chunks(iter_line_chunks(stdin or sys.stdin.buffer, args.chunk_size), bounds)
+        elif args.workers != 1:
+            from parse_int_safe.parallel import iter_parallel_batches  # parallel builds on this module
+
+            batches = iter_parallel_batches(args.path, bounds, workers=args.workers or None)
+        else:
+            f = stack.enter_context(open(args.path, "rb"))
+            batches = parse_chunks(iter_line_chunks(f, args.chunk_size), bounds)
+
+        if args.report:
+            report = validate_batches(batches, args.max_errors)
+            for text in format_report_chunks(report, limit=None):
+                stdout.write(text)
+            total, failed = report.rows, len(report.offsets)
+        else:
+            total, failed = write_batches(batches, stdout, args.errors_only)
+
+    stderr.write(f"{total} lines, {failed} errors\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
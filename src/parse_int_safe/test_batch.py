@@ -0,0 +1,156 @@
+"""Tests for batch (columnar) parsing."""
+
+from parse_int_safe import parse_int_safe, Ok, Bounds, ParseIntErrorKind
+from parse_int_safe.batch import (
+    parse_int_safe_many,
+    error_kind,
+    to_result_batch,
+    validate_many,
+    format_report,
+    format_report_chunks,
+    ERROR_CODE_OK,
+    INT64_MAX,
+    INT64_MIN,
+)
+
+
+def test_batch_returns_compact_arrays():
+    """Test the batch output uses int64 values and uint8 error codes."""
+    batch = parse_int_safe_many(["1", "2"])
+    assert batch.values.typecode == "q"
+    assert batch.errors.typecode == "B"
+
+
+def test_batch_valid_and_invalid():
+    """Test valid rows keep their value and invalid rows get an error code."""
+    batch = parse_int_safe_many([" 42 ", "abc", "-7", ""])
+    assert batch.values.tolist() == [42, 0, -7, 0]
+    assert batch.errors.tolist() == [
+        ERROR_CODE_OK,
+        ParseIntErrorKind.NOT_AN_INTEGER.value,
+        ERROR_CODE_OK,
+        ParseIntErrorKind.NOT_AN_INTEGER.value,
+    ]
+
+
+def test_batch_empty_input():
+    """Test parsing no strings returns empty arrays."""
+    batch = parse_int_safe_many([])
+    assert len(batch.values) == 0
+    assert len(batch.errors) == 0
+
+
+def test_batch_bounds():
+    """Test bounds are applied to every row."""
+    batch = parse_int_safe_many(["-1", "0", "100", "101"], Bounds(min=0, max=100))
+    assert [error_kind(code) for code in batch.errors] == [
+        ParseIntErrorKind.TOO_LOW,
+        None,
+        None,
+        ParseIntErrorKind.TOO_HIGH,
+    ]
+    assert batch.values.tolist() == [0, 0, 100, 0]
+
+
+def test_batch_out_of_int64_range():
+    """Test values that do not fit the int64 column are reported as out of bounds."""
+    batch = parse_int_safe_many([str(INT64_MAX), str(INT64_MAX + 1), str(INT64_MIN - 1)])
+    assert batch.values.tolist() == [INT64_MAX, 0, 0]
+    assert [error_kind(code) for code in batch.errors] == [
+        None,
+        ParseIntErrorKind.TOO_HIGH,
+        ParseIntErrorKind.TOO_LOW,
+    ]
+
+
+def test_batch_matches_scalar():
+    """Test every row agrees with parse_int_safe."""
+    inputs = ["5", " 10 ", "x", "12.5", "-3", "20", "1_000", "٣"]
+    bounds = Bounds(min=0, max=15)
+    batch = parse_int_safe_many(inputs, bounds)
+    for s, value, code in zip(inputs, batch.values, batch.errors):
+        match parse_int_safe(s, bounds):
+            case Ok(expected):
+                assert (value, code) == (expected, ERROR_CODE_OK)
+            case err:
+                assert error_kind(code) == err.error
+
+
+def test_to_result_batch():
+    """Test batch output can be chained as a ResultBatch."""
+    batch = to_result_batch(parse_int_safe_many(["1", "x", "20", "3"], Bounds(max=10)))
+    oks, errs = batch.map(lambda v: v * 2).partition()
+    assert oks == [2, 6]
+    assert errs == [ParseIntErrorKind.NOT_AN_INTEGER, ParseIntErrorKind.TOO_HIGH]
+
+
+def test_validate_many_records_failures():
+    """Test only failures are recorded, as row offsets and error codes."""
+    inputs = ["1", "x", "2", "-5", "200", "3"]
+    report = validate_many(inputs, Bounds(min=0, max=100), chunk_size=2)
+    assert report.rows == 6
+    assert report.offsets.tolist() == [1, 3, 4]
+    assert [error_kind(code) for code in report.kinds] == [
+        ParseIntErrorKind.NOT_AN_INTEGER,
+        ParseIntErrorKind.TOO_LOW,
+        ParseIntErrorKind.TOO_HIGH,
+    ]
+    assert report.counts() == {
+        ParseIntErrorKind.NOT_AN_INTEGER: 1,
+        ParseIntErrorKind.TOO_LOW: 1,
+        ParseIntErrorKind.TOO_HIGH: 1,
+    }
+    assert not report.stopped_early
+
+
+def test_validate_many_stops_after_max_errors():
+    """Test validation stops once max_errors failures are recorded."""
+    consumed = []
+
+    def inputs():
+        for i in range(1000):
+            consumed.append(i)
+            yield "x" if i % 10 == 0 else "1"
+
+    report = validate_many(inputs(), max_errors=3, chunk_size=8)
+    assert report.offsets.tolist() == [0, 10, 20]
+    assert report.rows == 21
+    assert report.stopped_early
+    assert len(consumed) < 1000
+
+
+def test_validate_many_exactly_max_errors_is_not_early():
+    """Test reaching max_errors on the last row is not reported as stopping early."""
+    for chunk_size in (1, 2, 8):
+        report = validate_many(["1", "x", "y"], max_errors=2, chunk_size=chunk_size)
+        assert (report.rows, report.offsets.tolist(), report.stopped_early) == (3, [1, 2], False)
+        report = validate_many(["1", "x", "y", "1"], max_errors=2, chunk_size=chunk_size)
+        assert (report.rows, report.offsets.tolist(), report.stopped_early) == (3, [1, 2], True)
+
+
+def test_format_report():
+    """Test the report lists counts and failing line numbers."""
+    report = validate_many(["x", "1", "y", "z"])
+    assert format_report(report, limit=2) == (
+        "rows: 4\n"
+        "errors: 3\n"
+        "NOT_AN_INTEGER: 3\n"
+        "TOO_LOW: 0\n"
+        "TOO_HIGH: 0\n"
+        "1\tNOT_AN_INTEGER\n"
+        "3\tNOT_AN_INTEGER\n"
+        "... 1 more\n"
+    )
+
+
+def test_format_report_chunks():
+    """Test a report is yielded in blocks of failures that join to the formatted text."""
+    report = validate_many(["x", "1"] * 5)
+    chunks = list(format_report_chunks(report, limit=None, chunk_rows=2))
+    assert "".join(chunks) == format_report(report, limit=None)
+    assert chunks[1:] == [
+        "1\tNOT_AN_INTEGER\n3\tNOT_AN_INTEGER\n",
+        "5\tNOT_AN_INTEGER\n7\tNOT_AN_INTEGER\n",
+        "9\tNOT_AN_INTEGER\n",
+    ]
+    assert "".join(format_report_chunks(report, limit=3, chunk_rows=2)) == format_report(report, limit=3)
@@ -0,0 +1,78 @@
+"""Differential tests for the exception-free parse fast path."""
+
+import random
+
+from parse_int_safe import parse_int_safe, Ok, Err, Bounds, ParseIntErrorKind
+
+
+def reference_parse_int_safe(s: str, bounds: Bounds = Bounds()):
+    """The original try/except implementation of parse_int_safe."""
+    try:
+        val = int(s.strip())
+        if bounds.min is not None and val < bounds.min:
+            return Err(ParseIntErrorKind.TOO_LOW)
+        if bounds.max is not None and val > bounds.max:
+            return Err(ParseIntErrorKind.TOO_HIGH)
+        return Ok(val)
+    except ValueError:
+        return Err(ParseIntErrorKind.NOT_AN_INTEGER)
+
+
+EDGE_CASES = [
+    "",
+    " ",
+    "+",
+    "-",
+    "+-1",
+    "--1",
+    "- 1",
+    "+0",
+    "-0",
+    "007",
+    "1_000",
+    "-1_000_000",
+    "_1",
+    "1_",
+    "1__0",
+    "+_1",
+    "1 2",
+    "0x10",
+    "1e3",
+    "12.5",
+    "\t42\n",
+    "\x1c42\x1f",
+    " 42　",
+    "٣",
+    "-١٢٣",
+    "1_٣",
+    "²",
+    "½",
+    "１２",
+    "9" * 640,
+    "9" * 641,
+    "9" * 4300,
+    "9" * 4301,
+    "-" + "1_" * 400 + "1",
+]
+
+
+def test_fast_path_edge_cases():
+    """Test hand-picked edge cases agree with int() semantics."""
+    for s in EDGE_CASES:
+        assert parse_int_safe(s) == reference_parse_int_safe(s), repr(s)
+
+
+def test_fast_path_edge_cases_with_bounds():
+    """Test hand-picked edge cases agree with bounds applied."""
+    bounds = Bounds(min=-100, max=100)
+    for s in EDGE_CASES:
+        assert parse_int_safe(s, bounds) == reference_parse_int_safe(s, bounds), repr(s)
+
+
+def test_fast_path_random_inputs():
+    """Test seeded random strings agree with the reference implementation."""
+    rng = random.Random(1234)
+    alphabet = "0123456789" * 3 + "+-_ \t\n.eaZ٣１ "
+    for _ in range(20_000):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        assert parse_int_safe(s) == reference_parse_int_safe(s), repr(s)
@@ -0,0 +1,40 @@
+"""Tests for precompiled bounds parsers."""
+
+from parse_int_safe import make_parser, parse_int_safe, Ok, Err, Bounds, ParseIntErrorKind
+
+INPUTS = ["-11", "-10", "0", "10", "11", "abc", " 5 ", ""]
+
+BOUNDS = [
+    Bounds(),
+    Bounds(min=-10),
+    Bounds(max=10),
+    Bounds(min=-10, max=10),
+]
+
+
+def test_make_parser_matches_parse_int_safe():
+    """Test every specialized parser agrees with parse_int_safe."""
+    for bounds in BOUNDS:
+        parse = make_parser(bounds)
+        for s in INPUTS:
+            assert parse(s) == parse_int_safe(s, bounds), (bounds, s)
+
+
+def test_make_parser_min_only():
+    """Test a min-only parser rejects low values and accepts high ones."""
+    parse = make_parser(Bounds(min=0))
+    assert parse("-1") == Err(ParseIntErrorKind.TOO_LOW)
+    assert parse("1000000") == Ok(1000000)
+
+
+def test_make_parser_max_only():
+    """Test a max-only parser rejects high values and accepts low ones."""
+    parse = make_parser(Bounds(max=0))
+    assert parse("1") == Err(ParseIntErrorKind.TOO_HIGH)
+    assert parse("-1000000") == Ok(-1000000)
+
+
+def test_make_parser_is_cached_per_bounds():
+    """Test equal bounds return the same parser and different bounds do not."""
+    assert make_parser(Bounds(min=1, max=2)) is make_parser(Bounds(min=1, max=2))
+    assert make_parser(Bounds(min=1, max=2)) is not make_parser(Bounds(min=1, max=3))
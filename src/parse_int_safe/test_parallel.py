@@ -0,0 +1,111 @@
+"""Tests for multi-process parsing."""
+
+import io
+import random
+from concurrent.futures import Future
+
+from parse_int_safe import Bounds, parallel
+from parse_int_safe.parallel import iter_parallel_batches, parse_file, parse_file_parallel, split_ranges
+from parse_int_safe.stream import main
+
+
+def write_lines(path, lines, trailing_newline=True):
+    path.write_text("\n".join(lines) + ("\n" if trailing_newline else ""), encoding="utf-8")
+    return path
+
+
+def random_lines(n, seed=0):
+    rng = random.Random(seed)
+    choices = ["abc", "", " 7 ", "1_000", "٣", "12.5", "é"]
+    return [str(rng.randint(-500, 500)) if rng.random() < 0.7 else rng.choice(choices) for _ in range(n)]
+
+
+def test_split_ranges_newline_aligned():
+    """Test every range ends after a newline and the ranges cover the buffer."""
+    data = b"1\n22\n333\n4444\n55555"
+    ranges = split_ranges(data, range_size=3)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_parallel_matches_sequential(tmp_path):
+    """Test the merged parallel result is identical to the sequential path."""
+    path = write_lines(tmp_path / "input.txt", random_lines(5000))
+    bounds = Bounds(min=-100, max=100)
+    expected = parse_file(path, bounds)
+    for workers in (1, 2, 3):
+        assert parse_file_parallel(path, bounds, workers=workers, range_size=1000) == expected
+
+
+def test_parallel_without_trailing_newline(tmp_path):
+    """Test the last line is parsed when the file does not end with a newline."""
+    path = write_lines(tmp_path / "input.txt", ["1", "", "x", "4"], trailing_newline=False)
+    batch = parse_file_parallel(path, workers=2, range_size=2)
+    assert batch == parse_file(path)
+    assert batch.values.tolist() == [1, 0, 0, 4]
+
+
+def test_parallel_empty_file(tmp_path):
+    """Test an empty file parses to empty arrays."""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    batch = parse_file_parallel(path, workers=2)
+    assert len(batch.values) == 0 and len(batch.errors) == 0
+
+
+def test_main_workers_matches_sequential(tmp_path):
+    """Test the streaming CLI writes the same output with worker processes."""
+    path = write_lines(tmp_path / "input.txt", random_lines(2000, seed=1))
+    sequential, parallel = io.StringIO(), io.StringIO()
+    main([str(path)], stdout=sequential, stderr=io.StringIO())
+    main([str(path), "--workers", "2"], stdout=parallel, stderr=io.StringIO())
+    assert parallel.getvalue() == sequential.getvalue()
+
+
+class CountingExecutor:
+    """Runs submissions inline and tracks how many results have not been taken yet."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        executor = type(self)
+        executor.in_flight += 1
+        executor.max_in_flight = max(executor.max_in_flight, executor.in_flight)
+        future = Future()
+        future.set_result(fn(*args))
+        original_result = future.result
+
+        def result(timeout=None):
+            executor.in_flight -= 1
+            return original_result(timeout)
+
+        future.result = result
+        return future
+
+
+def test_parallel_bounds_in_flight_ranges(tmp_path, monkeypatch):
+    """Test only a few ranges per worker are submitted ahead of a slow consumer."""
+    path = write_lines(tmp_path / "input.txt", random_lines(2000, seed=2))
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", CountingExecutor)
+    batches = iter_parallel_batches(path, workers=2, range_size=100)
+    first = next(batches)
+    assert CountingExecutor.in_flight == 4  # 2 per worker
+    rest = list(batches)
+    assert CountingExecutor.max_in_flight == 4
+    assert len(rest) + 1 == len(split_ranges(path.read_bytes(), 100)) > 10
+    assert parse_file_parallel(path, workers=1, range_size=100).values.tolist() == (
+        first.values.tolist() + [value for batch in rest for value in batch.values]
+    )
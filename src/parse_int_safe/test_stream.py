@@ -0,0 +1,91 @@
+"""Tests for the streaming CLI program."""
+
+import io
+
+import pytest
+
+from parse_int_safe import stream
+from parse_int_safe.stream import iter_line_chunks, main
+
+
+def test_iter_line_chunks_small_chunks():
+    """Test lines split across chunk boundaries are reassembled."""
+    f = io.BytesIO(b"12\n345\n\n6789\n")
+    lines = [line for chunk in iter_line_chunks(f, chunk_size=2) for line in chunk]
+    assert lines == ["12", "345", "", "6789"]
+
+
+def test_iter_line_chunks_long_lines(monkeypatch):
+    """Test lines spanning many chunks are joined, and ones over MAX_LINE_LENGTH become "" without being kept."""
+    monkeypatch.setattr(stream, "MAX_LINE_LENGTH", 8)
+    f = io.BytesIO(b"1\n12345678\n123456789\n2\n" + b"9" * 100)
+    lines = [line for chunk in iter_line_chunks(f, chunk_size=3) for line in chunk]
+    assert lines == ["1", "12345678", "", "2", ""]
+
+
+def test_iter_line_chunks_without_trailing_newline():
+    """Test the last line is returned when the input does not end with a newline."""
+    f = io.BytesIO(b"1\r\n2")
+    lines = [line for chunk in iter_line_chunks(f, chunk_size=3) for line in chunk]
+    assert lines == ["1\r", "2"]
+
+
+def test_main_streams_results():
+    """Test main writes one result per line and a summary."""
+    stdin = io.BytesIO(b"5\nabc\n -1 \n101\n")
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    code = main(["--min", "0", "--max", "100"], stdin=stdin, stdout=stdout, stderr=stderr)
+
+    assert code == 1
+    assert stdout.getvalue().splitlines() == [
+        "1\tok\t5",
+        "2\terror\tNOT_AN_INTEGER",
+        "3\terror\tTOO_LOW",
+        "4\terror\tTOO_HIGH",
+    ]
+    assert stderr.getvalue() == "4 lines, 3 errors\n"
+
+
+def test_main_errors_only_from_file(tmp_path):
+    """Test main reads a file and only reports failing lines."""
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(str(i) for i in range(1000)) + "\nx\n")
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    code = main([str(path), "--errors-only", "--chunk-size", "64"], stdout=stdout, stderr=stderr)
+
+    assert code == 1
+    assert stdout.getvalue() == "1001\terror\tNOT_AN_INTEGER\n"
+    assert stderr.getvalue() == "1001 lines, 1 errors\n"
+
+
+def test_main_all_valid():
+    """Test main exits with 0 when every line is valid."""
+    stdout = io.StringIO()
+    code = main([], stdin=io.BytesIO(b"1\n2\n"), stdout=stdout, stderr=io.StringIO())
+    assert code == 0
+    assert stdout.getvalue() == "1\tok\t1\n2\tok\t2\n"
+
+
+def test_main_report_with_max_errors():
+    """Test report mode writes the recorded failures and stops early."""
+    stdin = io.BytesIO(b"1\nx\n2\ny\nz\n")
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    code = main(["--report", "--max-errors", "2"], stdin=stdin, stdout=stdout, stderr=stderr)
+
+    assert code == 1
+    assert stdout.getvalue().splitlines()[:2] == ["rows: 4", "errors: 2 (stopped early)"]
+    assert stdout.getvalue().splitlines()[-2:] == ["2\tNOT_AN_INTEGER", "4\tNOT_AN_INTEGER"]
+    assert stderr.getvalue() == "4 lines, 2 errors\n"
+
+
+def test_main_max_errors_requires_report():
+    """Test --max-errors without --report is a usage error instead of being ignored."""
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--max-errors", "2"], stdin=io.BytesIO(b"x\n"), stdout=io.StringIO(), stderr=io.StringIO())
+    assert exit_info.value.code == 2
@@ -1,2 +1,10 @@
+from . import themes as _themes
 from .theme import Theme
 from .themes import *
+
+
+def __getattr__(name: str):
+    # The ANSI_CODE_*_THEME themes are created on first access, see themes
+    if name in ANSI_CODE_THEMES:
+        return getattr(_themes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
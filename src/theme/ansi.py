@@ -0,0 +1,238 @@
+"""SGR (Select Graphic Rendition) escape sequences.
+
+A style is a list of ANSI codes. `compile_style` turns it into an immutable
+(prefix, suffix) pair once; compiled styles are interned in a bounded cache
+keyed by the code tuple, so styling a string is a single concatenation:
+
+>>> bold_red = compile_style((AnsiCodeEnum.BOLD, AnsiCodeEnum.FOREGROUND_RED))
+>>> bold_red("Hi")
+'\\x1b[1;31mHi\\x1b[39;22m'
+"""
+
+from enum import IntEnum
+from functools import lru_cache
+from typing import List, NamedTuple, Sequence
+
+from theme.color import ColorDepth, background_codes, foreground_codes
+
+
+# fmt: off
+class AnsiCodeEnum(IntEnum):
+    # ANSI code for resetting all styles and colors
+    RESET = 0
+
+    # ANSI codes for styles
+    BOLD          =  1
+    BOLD_OFF      = 22
+    DIM           =  2
+    DIM_OFF       = 22  # DIM and BOLD share off code 22
+    ITALIC        =  3
+    ITALIC_OFF    = 23
+    UNDERLINE     =  4
+    UNDERLINE_OFF = 24
+    BLINK         =  5
+    BLINK_OFF     = 25
+    INVERT        =  7
+    INVERT_OFF    = 27
+    HIDDEN        =  8
+    HIDDEN_OFF    = 28
+    STRIKE        =  9
+    STRIKE_OFF    = 29
+
+    # ANSI codes for extended foreground and background colors
+    EXTENDED_FOREGROUND = 38  # Start an extended foreground color e.g. 8-bit or 24-bit
+    EXTENDED_BACKGROUND = 48  # Start an extended background color e.g. 8-bit or 24-bit
+    COLOR_8_BIT         =  5  # Start a 8-bit foreground color (256 colors)
+    COLOR_24_BIT        =  2  # Start a 24-bit foreground color (e.g. RGB)
+
+    # ANSI codes for resetting foreground and background colors
+    # Note that these are used for extended foreground and background colors
+    # such as 8-bit and 24-bit colors
+    FOREGROUND_RESET = 39
+    BACKGROUND_RESET = 49
+
+    # ANSI codes for standard foreground colors
+    FOREGROUND_BLACK   = 30
+    FOREGROUND_RED     = 31
+    FOREGROUND_GREEN   = 32
+    FOREGROUND_YELLOW  = 33
+    FOREGROUND_BLUE    = 34
+    FOREGROUND_MAGENTA = 35
+    FOREGROUND_CYAN    = 36
+    FOREGROUND_WHITE   = 37
+
+    # ANSI codes for high intensity foreground colors (bright colors)
+    FOREGROUND_HIGH_INTENSITY_BLACK   = 90
+    FOREGROUND_HIGH_INTENSITY_RED     = 91
+    FOREGROUND_HIGH_INTENSITY_GREEN   = 92
+    FOREGROUND_HIGH_INTENSITY_YELLOW  = 93
+    FOREGROUND_HIGH_INTENSITY_BLUE    = 94
+    FOREGROUND_HIGH_INTENSITY_MAGENTA = 95
+    FOREGROUND_HIGH_INTENSITY_CYAN    = 96
+    FOREGROUND_HIGH_INTENSITY_WHITE   = 97
+
+    # ANSI codes for standard background colors
+    BACKGROUND_BLACK   = 40
+    BACKGROUND_RED     = 41
+    BACKGROUND_GREEN   = 42
+    BACKGROUND_YELLOW  = 43
+    BACKGROUND_BLUE    = 44
+    BACKGROUND_MAGENTA = 45
+    BACKGROUND_CYAN    = 46
+    BACKGROUND_WHITE   = 47
+
+    # ANSI codes for high intensity background colors (bright colors)
+    BACKGROUND_HIGH_INTENSITY_BLACK   = 100
+    BACKGROUND_HIGH_INTENSITY_RED     = 101
+    BACKGROUND_HIGH_INTENSITY_GREEN   = 102
+    BACKGROUND_HIGH_INTENSITY_YELLOW  = 103
+    BACKGROUND_HIGH_INTENSITY_BLUE    = 104
+    BACKGROUND_HIGH_INTENSITY_MAGENTA = 105
+    BACKGROUND_HIGH_INTENSITY_CYAN    = 106
+    BACKGROUND_HIGH_INTENSITY_WHITE   = 107
+# fmt: on
+
+
+# Build the off code lookup table: _OFF_CODES[code] is the code that turns
+# `code` off, or None. It covers every SGR code 0-255.
+def _build_off_code_table() -> tuple[AnsiCodeEnum | None, ...]:
+    table: List[AnsiCodeEnum | None] = [None] * 256
+
+    # Foreground colors, including the extended 8-bit/24-bit foreground
+    for code in range(AnsiCodeEnum.FOREGROUND_BLACK, AnsiCodeEnum.FOREGROUND_WHITE + 1):
+        table[code] = AnsiCodeEnum.FOREGROUND_RESET
+    for code in range(AnsiCodeEnum.FOREGROUND_HIGH_INTENSITY_BLACK, AnsiCodeEnum.FOREGROUND_HIGH_INTENSITY_WHITE + 1):
+        table[code] = AnsiCodeEnum.FOREGROUND_RESET
+    table[AnsiCodeEnum.EXTENDED_FOREGROUND] = AnsiCodeEnum.FOREGROUND_RESET
+
+    # Background colors, including the extended 8-bit/24-bit background
+    for code in range(AnsiCodeEnum.BACKGROUND_BLACK, AnsiCodeEnum.BACKGROUND_WHITE + 1):
+        table[code] = AnsiCodeEnum.BACKGROUND_RESET
+    for code in range(AnsiCodeEnum.BACKGROUND_HIGH_INTENSITY_BLACK, AnsiCodeEnum.BACKGROUND_HIGH_INTENSITY_WHITE + 1):
+        table[code] = AnsiCodeEnum.BACKGROUND_RESET
+    table[AnsiCodeEnum.EXTENDED_BACKGROUND] = AnsiCodeEnum.BACKGROUND_RESET
+
+    # Styles
+    # fmt: off
+    table[AnsiCodeEnum.BOLD]      = AnsiCodeEnum.BOLD_OFF
+    table[AnsiCodeEnum.DIM]       = AnsiCodeEnum.DIM_OFF
+    table[AnsiCodeEnum.ITALIC]    = AnsiCodeEnum.ITALIC_OFF
+    table[AnsiCodeEnum.UNDERLINE] = AnsiCodeEnum.UNDERLINE_OFF
+    table[21]                     = AnsiCodeEnum.UNDERLINE_OFF  # Double underline
+    table[AnsiCodeEnum.BLINK]     = AnsiCodeEnum.BLINK_OFF
+    table[6]                      = AnsiCodeEnum.BLINK_OFF  # Rapid blink
+    table[AnsiCodeEnum.INVERT]    = AnsiCodeEnum.INVERT_OFF
+    table[AnsiCodeEnum.HIDDEN]    = AnsiCodeEnum.HIDDEN_OFF
+    table[AnsiCodeEnum.STRIKE]    = AnsiCodeEnum.STRIKE_OFF
+    # fmt: on
+
+    return tuple(table)
+
+
+_OFF_CODES = _build_off_code_table()
+
+# Number of codes following 38/48 for each color mode, e.g. 38;5;208 or 38;2;r;g;b
+_EXTENDED_COLOR_ARGS = {AnsiCodeEnum.COLOR_8_BIT: 1, AnsiCodeEnum.COLOR_24_BIT: 3}
+
+
+# Returns the off codes for a list of codes, in reverse order. The arguments of
+# extended colors (38;5;n and 38;2;r;g;b) are skipped rather than looked up as
+# codes of their own. Codes without an off code, including ones outside 0-255,
+# are ignored, and an extended color with an unknown mode is taken to use the
+# rest of the codes as its arguments.
+def get_off_codes(codes: Sequence[int]) -> List[AnsiCodeEnum]:
+    off_codes: List[AnsiCodeEnum] = []
+    i = 0
+    n = len(codes)
+    while i < n:
+        code = codes[i]
+        if 0 <= code < len(_OFF_CODES) and (off_code := _OFF_CODES[code]):
+            off_codes.append(off_code)
+        if code == AnsiCodeEnum.EXTENDED_FOREGROUND or code == AnsiCodeEnum.EXTENDED_BACKGROUND:
+            mode = codes[i + 1] if i + 1 < n else None
+            if mode not in _EXTENDED_COLOR_ARGS:
+                break
+            i += 2 + _EXTENDED_COLOR_ARGS[mode]
+        else:
+            i += 1
+    off_codes.reverse()
+    return off_codes
+
+
+def remove_consecutive_duplicates(input: List[int]) -> List[int]:
+    """
+    Remove consecutive duplicates from a list, preserving order.
+
+    >>> remove_consecutive_duplicates([1, 1, 2, 3, 2, 4, 5])
+    [1, 2, 3, 2, 4, 5]
+
+    >>> remove_consecutive_duplicates([1, 2, 2, 2, 3])
+    [1, 2, 3]
+    """
+    if not input:
+        return []
+    output = [input[0]]
+    for item in input[1:]:
+        last_item = output[-1]
+        if item != last_item:
+            output.append(item)
+    return output
+
+
+# Escape a list of ANSI codes into an ANSI escape sequence string.
+# For example: [AnsiCodeEnum.BOLD, AnsiCodeEnum.FOREGROUND_RED] -> "\x1b[1;31m"
+def _escape_codes(*codes: AnsiCodeEnum) -> str:
+    codes_str = ";".join(map(str, codes))
+    return f"\x1b[{codes_str}m"
+
+
+# A style compiled to the escape sequences written before and after the text.
+class CompiledStyle(NamedTuple):
+    prefix: str
+    suffix: str
+
+    def __call__(self, text: str) -> str:
+        return f"{self.prefix}{text}{self.suffix}"
+
+
+# Compile a tuple of ANSI codes into its start and end sequences. The end
+# sequence turns off every code in reverse order. Compiled styles are cached
+# by code tuple, so each distinct style is built once.
+@lru_cache(maxsize=4096)
+def compile_style(codes: tuple[AnsiCodeEnum, ...]) -> CompiledStyle:
+    if not codes:
+        return CompiledStyle("", "")
+
+    # Dedupe off codes, e.g. BOLD and DIM are both turned off by 22
+    deduped_off_codes = remove_consecutive_duplicates(get_off_codes(codes))
+    return CompiledStyle(_escape_codes(*codes), _escape_codes(*deduped_off_codes))
+
+
+class AnsiStyle:
+    # Wrap text in the escape sequences for a list of ANSI codes.
+    # For example: [AnsiCodeEnum.BOLD, AnsiCodeEnum.FOREGROUND_RED], "x" -> "\x1b[1;31mx\x1b[39;22m"
+    @staticmethod
+    def dynamic(codes: List[AnsiCodeEnum], text: str) -> str:
+        return compile_style(tuple(codes))(text)
+
+    # ANSI codes for 8-bit foreground colors
+    @staticmethod
+    def foreground_8_bit(code: int) -> List[AnsiCodeEnum]:
+        return [AnsiCodeEnum.EXTENDED_FOREGROUND, AnsiCodeEnum.COLOR_8_BIT, code]
+
+    # ANSI codes for 8-bit background colors
+    @staticmethod
+    def background_8_bit(code: int) -> List[AnsiCodeEnum]:
+        return [AnsiCodeEnum.EXTENDED_BACKGROUND, AnsiCodeEnum.COLOR_8_BIT, code]
+
+    # ANSI codes for 24-bit foreground colors, or the nearest 256/16 palette
+    # color when depth is lower
+    @staticmethod
+    def foreground_24_bit(r: int, g: int, b: int, depth: ColorDepth = ColorDepth.TRUE_COLOR) -> List[AnsiCodeEnum]:
+        return foreground_codes(r, g, b, depth)
+
+    # ANSI codes for 24-bit background colors, or the nearest 256/16 palette
+    # color when depth is lower
+    @staticmethod
+    def background_24_bit(r: int, g: int, b: int, depth: ColorDepth = ColorDepth.TRUE_COLOR) -> List[AnsiCodeEnum]:
+        return background_codes(r, g, b, depth)
@@ -0,0 +1,107 @@
+"""Microbenchmark: styling 1M spans by rebuilding escape sequences vs compiled styles.
+
+Run from src/:
+
+    python -m theme.bench_ansi
+"""
+
+import time
+from typing import Callable, Dict, List
+
+from theme.ansi import (
+    AnsiCodeEnum,
+    AnsiStyle,
+    _escape_codes,
+    compile_style,
+    get_off_codes,
+    remove_consecutive_duplicates,
+)
+
+N = 1_000_000
+
+STYLES: List[List[AnsiCodeEnum]] = [
+    [AnsiCodeEnum.BOLD],
+    [AnsiCodeEnum.BOLD, AnsiCodeEnum.FOREGROUND_RED],
+    [AnsiCodeEnum.DIM, AnsiCodeEnum.ITALIC, AnsiCodeEnum.BACKGROUND_BLUE],
+    AnsiStyle.foreground_8_bit(208),
+]
+
+
+# The original _get_off_code: nested functions and OFF_MAP rebuilt on every call
+def _get_off_code(code: AnsiCodeEnum) -> AnsiCodeEnum | None:
+    def get_foreground_off_code(code: AnsiCodeEnum) -> AnsiCodeEnum | None:
+        if (
+            AnsiCodeEnum.FOREGROUND_BLACK <= code <= AnsiCodeEnum.FOREGROUND_WHITE
+            or AnsiCodeEnum.FOREGROUND_HIGH_INTENSITY_BLACK <= code <= AnsiCodeEnum.FOREGROUND_HIGH_INTENSITY_WHITE
+            or code == AnsiCodeEnum.EXTENDED_FOREGROUND
+        ):
+            return AnsiCodeEnum.FOREGROUND_RESET
+        return None
+
+    def get_background_off_code(code: AnsiCodeEnum) -> AnsiCodeEnum | None:
+        if (
+            AnsiCodeEnum.BACKGROUND_BLACK <= code <= AnsiCodeEnum.BACKGROUND_WHITE
+            or AnsiCodeEnum.BACKGROUND_HIGH_INTENSITY_BLACK <= code <= AnsiCodeEnum.BACKGROUND_HIGH_INTENSITY_WHITE
+            or code == AnsiCodeEnum.EXTENDED_BACKGROUND
+        ):
+            return AnsiCodeEnum.BACKGROUND_RESET
+        return None
+
+    def get_other_off_code(code: AnsiCodeEnum) -> AnsiCodeEnum | None:
+        # fmt: off
+        OFF_MAP: Dict[AnsiCodeEnum, AnsiCodeEnum] = {
+            AnsiCodeEnum.BOLD:      AnsiCodeEnum.BOLD_OFF,
+            AnsiCodeEnum.DIM:       AnsiCodeEnum.DIM_OFF,
+            AnsiCodeEnum.ITALIC:    AnsiCodeEnum.ITALIC_OFF,
+            AnsiCodeEnum.UNDERLINE: AnsiCodeEnum.UNDERLINE_OFF,
+            AnsiCodeEnum.BLINK:     AnsiCodeEnum.BLINK_OFF,
+            AnsiCodeEnum.INVERT:    AnsiCodeEnum.INVERT_OFF,
+            AnsiCodeEnum.HIDDEN:    AnsiCodeEnum.HIDDEN_OFF,
+            AnsiCodeEnum.STRIKE:    AnsiCodeEnum.STRIKE_OFF,
+        }
+        # fmt: on
+        return OFF_MAP.get(code)
+
+    return get_foreground_off_code(code) or get_background_off_code(code) or get_other_off_code(code)
+
+
+# The original AnsiStyle.dynamic: escape sequences rebuilt on every call
+def dynamic_uncompiled(codes: List[AnsiCodeEnum], text: str) -> str:
+    if not codes:
+        return text
+    off_codes: List[AnsiCodeEnum] = []
+    for code in reversed(codes):
+        if off_code := _get_off_code(code):
+            off_codes.append(off_code)
+    start_sequence = _escape_codes(*codes)
+    end_sequence = _escape_codes(*remove_consecutive_duplicates(off_codes))
+    return f"{start_sequence}{text}{end_sequence}"
+
+
+def _time(label: str, style_span: Callable[[int], str]) -> float:
+    start = time.perf_counter()
+    for i in range(N):
+        style_span(i)
+    seconds = time.perf_counter() - start
+    print(f"{label:<36} {seconds:>7.3f} s {seconds / N * 1e9:>8.0f} ns/span")
+    return seconds
+
+
+def main() -> None:
+    styles = STYLES
+    compiled = [compile_style(tuple(codes)) for codes in styles]
+    n = len(styles)
+
+    before = _time("rebuild per call (before)", lambda i: dynamic_uncompiled(styles[i % n], "span"))
+    _time("AnsiStyle.dynamic (cached)", lambda i: AnsiStyle.dynamic(styles[i % n], "span"))
+    after = _time("precompiled CompiledStyle", lambda i: compiled[i % n]("span"))
+    print(f"speedup: {before / after:.1f}x")
+
+    # End sequences alone: per-code function calls vs one table walk
+    codes = [code for style in styles for code in style]
+    _time("end codes via _get_off_code", lambda i: [off for code in codes if (off := _get_off_code(code))])
+    _time("end codes via table walk", lambda i: get_off_codes(codes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark: a 200x50 heatmap styled one cell at a time vs render_heatmap.
+
+Run from src/:
+
+    python -m theme.bench_gradient
+"""
+
+import math
+import time
+from typing import Callable, List
+
+from theme.ansi import AnsiStyle
+from theme.color import ColorDepth
+from theme.gradient import LEVELS, VIRIDIS, render_heatmap
+
+WIDTH = 200
+HEIGHT = 50
+REPEAT = 20
+
+
+def heatmap_values() -> List[List[float]]:
+    return [[math.sin(x / 10) * math.cos(y / 7) for x in range(WIDTH)] for y in range(HEIGHT)]
+
+
+# The per-cell approach: interpolate, build the codes and style every cell separately
+def render_per_cell(rows: List[List[float]], depth: ColorDepth) -> str:
+    vmin = min(min(row) for row in rows)
+    vmax = max(max(row) for row in rows)
+    lines = []
+    for row in rows:
+        cells = []
+        for v in row:
+            level = round((v - vmin) / (vmax - vmin) * (LEVELS - 1))
+            r, g, b = VIRIDIS.rgb(level / (LEVELS - 1))
+            cells.append(AnsiStyle.dynamic(AnsiStyle.background_24_bit(r, g, b, depth=depth), "  "))
+        lines.append("".join(cells))
+    return "\n".join(lines)
+
+
+def _time(label: str, render: Callable[[], str]) -> float:
+    render()  # Warm up caches
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        out = render()
+    ms = (time.perf_counter() - start) / REPEAT * 1e3
+    print(f"{label:<36} {ms:>8.2f} ms/frame {len(out):>9,} chars")
+    return ms
+
+
+def main() -> None:
+    rows = heatmap_values()
+    for depth in ColorDepth:
+        print(f"{depth.name}:")
+        before = _time("  per cell (before)", lambda: render_per_cell(rows, depth))
+        after = _time("  render_heatmap", lambda: render_heatmap(rows, VIRIDIS, depth=depth))
+        print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
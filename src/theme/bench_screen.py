@@ -0,0 +1,67 @@
+"""Benchmark: redrawing a whole 80x24 board every frame vs writing only changed cells.
+
+    python -m theme.bench_screen
+
+A snake moves across a bordered board with a status line, so each frame
+changes a handful of cells.
+"""
+
+import time
+from typing import Callable, List
+
+from theme.ansi import AnsiCodeEnum, compile_style
+from theme.screen import Screen
+
+WIDTH = 80
+HEIGHT = 24
+FRAMES = 2000
+
+BORDER = compile_style((AnsiCodeEnum.FOREGROUND_WHITE, AnsiCodeEnum.DIM))
+SNAKE = compile_style((AnsiCodeEnum.FOREGROUND_GREEN, AnsiCodeEnum.BOLD))
+STATUS = compile_style((AnsiCodeEnum.BOLD,))
+
+
+def draw(screen: Screen, frame: int) -> None:
+    screen.clear()
+    screen.put(0, 0, "┌" + "─" * (WIDTH - 2) + "┐", BORDER)
+    for y in range(1, HEIGHT - 2):
+        screen.put(0, y, "│", BORDER)
+        screen.put(WIDTH - 1, y, "│", BORDER)
+    screen.put(0, HEIGHT - 2, "└" + "─" * (WIDTH - 2) + "┘", BORDER)
+    for i in range(8):
+        step = frame - i
+        screen.put(1 + step % (WIDTH - 2), 1 + (step // (WIDTH - 2)) % (HEIGHT - 3), "█", SNAKE)
+    screen.put(0, HEIGHT - 1, f"frame {frame}", STATUS)
+
+
+def _run(label: str, render: Callable[[int], str]) -> float:
+    sizes: List[int] = []
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        sizes.append(len(render(frame).encode()))
+    ms = (time.perf_counter() - start) / FRAMES * 1e3
+    print(f"{label:<24} {ms:>7.3f} ms/frame {sum(sizes) / FRAMES:>9,.0f} bytes/frame")
+    return sum(sizes) / FRAMES
+
+
+def main() -> None:
+    full = Screen(WIDTH, HEIGHT)
+
+    def render_full(frame: int) -> str:
+        draw(full, frame)
+        full.invalidate()
+        return full.render()
+
+    diffed = Screen(WIDTH, HEIGHT)
+
+    def render_diff(frame: int) -> str:
+        draw(diffed, frame)
+        return diffed.render()
+
+    before = _run("full redraw", render_full)
+    after = _run("changed cells only", render_diff)
+    print(f"bytes reduced: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark: styled calls and theme construction for the colorful and native ANSI backends.
+
+Run from src/:
+
+    python -m theme.bench_themes
+"""
+
+import time
+from typing import Callable
+
+from theme.color import ColorDepth
+from theme.themes import AnsiTheme, CustomTheme, _colorful, _create_rgb_color_style, new_theme_from_hex_color
+
+N = 1_000_000
+HEX_COLOR = "#00FF00"
+DEPTH = ColorDepth.TRUE_COLOR
+
+
+# The previous CustomTheme: a new theme per call to new_theme_from_hex_color,
+# and bold/faint composed with the color style on every call
+class UncachedTheme(CustomTheme):
+    def __init__(self, color_value: str, depth: ColorDepth):
+        super().__init__(color_value, depth)
+        self._styler = _create_rgb_color_style(*self._rgb, depth)
+
+    def bold_color(self, s: str) -> str:
+        return (_colorful().bold & self._styler)(s)
+
+    def bold(self, s: str) -> str:
+        return _colorful().bold(s)
+
+    def color(self, s: str) -> str:
+        return self._styler(s)
+
+    def faint(self, s: str) -> str:
+        return _colorful().dimmed(s)
+
+    def faint_color(self, s: str) -> str:
+        return (_colorful().dimmed & self._styler)(s)
+
+
+def _time(label: str, n: int, call: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        call()
+    seconds = time.perf_counter() - start
+    print(f"{label:<36} {seconds:>7.3f} s {seconds / n * 1e9:>8.0f} ns/call")
+    return seconds
+
+
+def main() -> None:
+    before_theme = UncachedTheme(HEX_COLOR, DEPTH)
+    after_theme = new_theme_from_hex_color(HEX_COLOR, DEPTH)
+    for name in ("bold", "color", "faint", "bold_color", "faint_color"):
+        assert str(getattr(before_theme, name)("x")) == getattr(after_theme, name)("x")
+
+    for name in ("color", "bold_color", "faint_color"):
+        before_fn = getattr(before_theme, name)
+        after_fn = getattr(after_theme, name)
+        before = _time(f"{name} (before)", N, lambda: before_fn("text"))
+        after = _time(f"{name} (interned)", N, lambda: after_fn("text"))
+        print(f"speedup: {before / after:.1f}x")
+
+    # Construction: the old code built a theme and a ColorfulStyle per call
+    n = N // 10
+    before = _time("new theme per call (before)", n, lambda: UncachedTheme(HEX_COLOR, DEPTH))
+    after = _time("new_theme_from_hex_color (interned)", n, lambda: new_theme_from_hex_color(HEX_COLOR, DEPTH))
+    print(f"speedup: {before / after:.1f}x")
+
+    # Backends: styled calls, and building the styles of distinct colors
+    colorful_theme = CustomTheme(HEX_COLOR, DEPTH)
+    ansi_theme = AnsiTheme(HEX_COLOR, DEPTH)
+    before = _time("bold_color (colorful backend)", N, lambda: colorful_theme.bold_color("text"))
+    after = _time("bold_color (ansi backend)", N, lambda: ansi_theme.bold_color("text"))
+    print(f"speedup: {before / after:.1f}x")
+
+    colors = iter(range(1 << 24))
+    before = _time("new theme + first call (colorful)", n, lambda: CustomTheme(f"#{next(colors):06X}", DEPTH).bold("x"))
+    after = _time("new theme + first call (ansi)", n, lambda: AnsiTheme(f"#{next(colors):06X}", DEPTH).bold("x"))
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
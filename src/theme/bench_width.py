@@ -0,0 +1,77 @@
+"""Benchmark: strip_ansi/visible_width vs a naive regex, on a large log and on short repeated strings.
+
+Run from src/:
+
+    python -m theme.bench_width
+"""
+
+import random
+import re
+import time
+import unicodedata
+from typing import Callable, List
+
+from theme.ansi import AnsiCodeEnum, AnsiStyle, compile_style
+from theme.width import strip_ansi, visible_width
+
+N = 1_000_000
+LOG_LINES = 100_000
+
+_NAIVE_SGR = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def naive_strip_ansi(text: str) -> str:
+    return _NAIVE_SGR.sub("", text)
+
+
+def naive_visible_width(text: str) -> int:
+    return sum(2 if unicodedata.east_asian_width(c) in ("W", "F") else 1 for c in naive_strip_ansi(text))
+
+
+def styled_log(rng: random.Random, lines: int) -> str:
+    """Returns a captured log of styled lines, a few with wide characters."""
+    styles = [
+        compile_style((AnsiCodeEnum.BOLD,)),
+        compile_style((AnsiCodeEnum.DIM, AnsiCodeEnum.FOREGROUND_CYAN)),
+        compile_style(tuple(AnsiStyle.foreground_24_bit(r=255, g=100, b=100))),
+    ]
+    words = ["INFO", "parsed", "rows", "in", "ms", "worker", "ok", "漢字", "retry"]
+    out: List[str] = []
+    for i in range(lines):
+        line = " ".join(rng.choice(styles)(rng.choice(words)) for _ in range(8))
+        out.append(f"{i:>8} {line}")
+    return "\n".join(out)
+
+
+def _time(label: str, fn: Callable[[], object], units: int, unit: str) -> float:
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    print(f"{label:<40} {seconds:>7.3f} s {seconds / units * 1e9:>8.0f} ns/{unit}")
+    return seconds
+
+
+def main() -> None:
+    rng = random.Random(0)
+    log = styled_log(rng, LOG_LINES)
+    assert strip_ansi(log) == naive_strip_ansi(log)
+    print(f"log: {len(log) / 1e6:.1f} M characters")
+
+    before = _time("naive regex strip (log)", lambda: naive_strip_ansi(log), LOG_LINES, "line")
+    after = _time("strip_ansi (log)", lambda: strip_ansi(log), LOG_LINES, "line")
+    print(f"speedup: {before / after:.1f}x")
+    before = _time("naive regex width (log)", lambda: naive_visible_width(log), LOG_LINES, "line")
+    after = _time("visible_width (log)", lambda: visible_width(log), LOG_LINES, "line")
+    print(f"speedup: {before / after:.1f}x")
+
+    # Table cells: a few distinct short strings measured over and over
+    cells = log.splitlines()[:64]
+    cells = [cell[:120] for cell in cells]
+    n = len(cells)
+    before = _time("naive regex width (cells)", lambda: [naive_visible_width(cells[i % n]) for i in range(N)], N, "op")
+    after = _time("visible_width (cells, cached)", lambda: [visible_width(cells[i % n]) for i in range(N)], N, "op")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
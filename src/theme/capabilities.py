@@ -0,0 +1,172 @@
+"""Terminal capability detection: whether to style output, and with how many colors.
+
+`capabilities()` probes stdout once per process. Whether output is styled
+follows the usual conventions, checked in order:
+
+1. NO_COLOR (any non-empty value) turns colors off.
+2. FORCE_COLOR turns colors on even when not writing to a terminal; 2 and 3
+   also select 256 colors and true color. 0 and false turn colors off.
+3. Otherwise colors are on when the stream is a terminal other than TERM=dumb.
+
+The color depth comes from COLORTERM, then the terminfo entry for TERM
+(its RGB/Tc flags and number of colors), then TERM itself. Only the entry for
+the process's own TERM is read: curses cannot load a second one. Reading
+terminfo is the slow part, so its answer can be cached on disk, keyed by TERM,
+COLORTERM and whether the stream is a terminal, by setting
+THEME_CAPABILITY_CACHE to a file path.
+"""
+
+import os
+import sys
+from functools import cache
+from typing import Mapping, NamedTuple, Optional, TextIO
+
+from theme.color import ColorDepth, detect_color_depth
+
+# Environment variable naming the on-disk cache file
+CACHE_ENV = "THEME_CAPABILITY_CACHE"
+
+# FORCE_COLOR levels that also set the depth; other values only force colors on
+_FORCE_COLOR_DEPTHS = {"2": ColorDepth.COLORS_256, "3": ColorDepth.TRUE_COLOR}
+
+
+class Capabilities(NamedTuple):
+    color: bool  # Whether to write escape sequences at all
+    depth: ColorDepth  # Colors to use for styled output
+    isatty: bool
+
+
+def _isatty(stream: TextIO) -> bool:
+    isatty = getattr(stream, "isatty", None)
+    try:
+        return bool(isatty and isatty())
+    except ValueError:  # Closed stream
+        return False
+
+
+# Returns the color depth from the terminfo entry for term, or None when there
+# is no entry (or no curses, e.g. on Windows). curses.setupterm only loads an
+# entry on its first call in a process, so this must run at most once.
+def _read_terminfo(term: str) -> Optional[ColorDepth]:
+    try:
+        import curses
+    except ImportError:
+        return None
+    fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        curses.setupterm(term, fd)
+    except curses.error:
+        return None
+    finally:
+        os.close(fd)
+    if curses.tigetflag("RGB") > 0 or curses.tigetflag("Tc") > 0:
+        return ColorDepth.TRUE_COLOR
+    colors = curses.tigetnum("colors")
+    if colors >= 1 << 24:
+        return ColorDepth.TRUE_COLOR
+    if colors >= 256:
+        return ColorDepth.COLORS_256
+    if colors > 0:
+        return ColorDepth.COLORS_16
+    return None
+
+
+@cache
+def _own_terminfo() -> tuple[str, Optional[ColorDepth]]:
+    # (TERM, depth) for the terminal this process runs in
+    term = os.environ.get("TERM", "")
+    return term, _read_terminfo(term) if term else None
+
+
+# Returns the terminfo color depth for term, or None when it is not this
+# process's own TERM: other entries cannot be loaded once one has been
+def _terminfo_depth(term: str) -> Optional[ColorDepth]:
+    own_term, depth = _own_terminfo()
+    return depth if term == own_term else None
+
+
+# json is imported by the cache functions only, since most processes never
+# set THEME_CAPABILITY_CACHE
+def _read_cache(path: str) -> dict[str, int]:
+    import json
+
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache(path: str, data: dict[str, int]) -> None:
+    # Written to a temporary file and renamed, so concurrent processes never
+    # read a partial file. The cache is an optimization: failures are ignored.
+    import json
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _probe_depth(environ: Mapping[str, str], isatty: bool, cache_path: Optional[str]) -> ColorDepth:
+    if environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return ColorDepth.TRUE_COLOR
+    term = environ.get("TERM", "")
+    if not term:
+        return detect_color_depth(environ)
+
+    key = f"{term}|{environ.get('COLORTERM', '')}|{int(isatty)}"
+    cached = _read_cache(cache_path) if cache_path else {}
+    if key in cached:
+        try:
+            return ColorDepth(cached[key])
+        except ValueError:
+            pass
+
+    depth = _terminfo_depth(term)
+    if depth is None:
+        # Not cached: a later process whose own TERM this is can read terminfo
+        return detect_color_depth(environ)
+    if cache_path:
+        _write_cache(cache_path, {**cached, key: int(depth)})
+    return depth
+
+
+def detect_capabilities(
+    stream: Optional[TextIO] = None,
+    environ: Mapping[str, str] = os.environ,
+    cache_path: Optional[str] = None,
+) -> Capabilities:
+    """Probes the capabilities of stream (default: stdout) without caching in memory.
+
+    Args:
+        stream: Stream that styled output will be written to.
+        environ: Environment variables to read.
+        cache_path: JSON file caching the color depth probe (default: none).
+    """
+    isatty = _isatty(stream or sys.stdout)
+    force = environ.get("FORCE_COLOR")
+
+    if environ.get("NO_COLOR"):
+        color = False
+    elif force is not None:
+        color = force.lower() not in ("0", "false")
+    else:
+        color = isatty and environ.get("TERM") != "dumb"
+
+    if not color:
+        # Nothing should be styled, so skip the terminfo probe
+        return Capabilities(False, detect_color_depth(environ), isatty)
+    if force in _FORCE_COLOR_DEPTHS:
+        return Capabilities(True, _FORCE_COLOR_DEPTHS[force], isatty)
+    return Capabilities(True, _probe_depth(environ, isatty, cache_path), isatty)
+
+
+@cache
+def capabilities() -> Capabilities:
+    """Returns the capabilities of stdout, probed once per process."""
+    return detect_capabilities(cache_path=os.environ.get(CACHE_ENV) or None)
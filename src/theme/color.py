@@ -0,0 +1,174 @@
+"""Color depths and RGB downsampling to the 256- and 16-color palettes.
+
+Every RGB value is quantized to 5 bits per channel, and a 32x32x32 lookup
+table maps each of those 32768 cells to its nearest palette entry, so
+downsampling a color is one table lookup:
+
+>>> quantize_256(255, 100, 100)
+203
+>>> quantize_16(250, 5, 5)
+9
+>>> foreground_codes(255, 100, 100, ColorDepth.COLORS_256)
+[38, 5, 203]
+"""
+
+import os
+from enum import IntEnum
+from functools import cache
+from typing import List, Mapping
+
+
+class ColorDepth(IntEnum):
+    """Number of colors a terminal can display."""
+
+    COLORS_16 = 16
+    COLORS_256 = 256
+    TRUE_COLOR = 1 << 24
+
+
+# RGB for 16 ANSI codes
+ANSI_16_RGB = [
+    (0, 0, 0),
+    (128, 0, 0),
+    (0, 128, 0),
+    (128, 128, 0),
+    (0, 0, 128),
+    (128, 0, 128),
+    (0, 128, 128),
+    (192, 192, 192),
+    (128, 128, 128),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (0, 0, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+]
+
+# Channel levels of the 6x6x6 color cube (codes 16-231) and the gray ramp (232-255)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+GRAY_LEVELS = tuple(8 + 10 * i for i in range(24))
+
+# RGB for all 256 codes
+ANSI_256_RGB = [
+    *ANSI_16_RGB,
+    *((r, g, b) for r in CUBE_LEVELS for g in CUBE_LEVELS for b in CUBE_LEVELS),
+    *((v, v, v) for v in GRAY_LEVELS),
+]
+
+_BITS = 5
+_SIZE = 1 << _BITS
+_SHIFT = 8 - _BITS
+
+
+def _cell_index(r: int, g: int, b: int) -> int:
+    return (r >> _SHIFT) << (2 * _BITS) | (g >> _SHIFT) << _BITS | b >> _SHIFT
+
+
+# The RGB value each table cell stands for: the center of its 8x8x8 block
+_CELL_CENTERS = [(v << _SHIFT) + (1 << (_SHIFT - 1)) for v in range(_SIZE)]
+
+
+# Returns the index of the level nearest to value
+def _nearest_level(levels: tuple[int, ...], value: float) -> int:
+    return min(range(len(levels)), key=lambda i: abs(levels[i] - value))
+
+
+@cache
+def _lut_256() -> bytes:
+    # The cube is separable: the nearest cube color is the nearest level on
+    # each channel. The nearest gray only depends on the channel sum, since
+    # sum((c - v) ** 2) = sum(c ** 2) - 2 * v * sum(c) + 3 * v ** 2. Codes 0-15
+    # are left out because terminals let users redefine them.
+    cube = [_nearest_level(CUBE_LEVELS, c) for c in _CELL_CENTERS]
+    cube_error = [(c - CUBE_LEVELS[i]) ** 2 for c, i in zip(_CELL_CENTERS, cube)]
+    square = [c * c for c in _CELL_CENTERS]
+    gray_for_sum = [_nearest_level(GRAY_LEVELS, total / 3) for total in range(3 * 255 + 1)]
+
+    lut = bytearray(_SIZE**3)
+    i = 0
+    for r, cr in enumerate(_CELL_CENTERS):
+        for g, cg in enumerate(_CELL_CENTERS):
+            rg_code = 16 + 36 * cube[r] + 6 * cube[g]
+            rg_error = cube_error[r] + cube_error[g]
+            rg_square = square[r] + square[g]
+            for b, cb in enumerate(_CELL_CENTERS):
+                total = cr + cg + cb
+                gray = gray_for_sum[total]
+                v = GRAY_LEVELS[gray]
+                gray_error = rg_square + square[b] - 2 * v * total + 3 * v * v
+                lut[i] = 232 + gray if gray_error < rg_error + cube_error[b] else rg_code + cube[b]
+                i += 1
+    return bytes(lut)
+
+
+@cache
+def _lut_16() -> bytes:
+    # Squared distances to each palette entry are summed per channel, so the
+    # red and green terms are added once per (r, g) row, and the nearest code
+    # for each blue value is found with C-level min/index calls
+    lut = bytearray(_SIZE**3)
+    channel = [[[(c - p[k]) ** 2 for c in _CELL_CENTERS] for p in ANSI_16_RGB] for k in range(3)]
+    reds, greens, blues = channel
+    i = 0
+    for r in range(_SIZE):
+        for g in range(_SIZE):
+            rows = [[red[r] + green[g] + d for d in blue] for red, green, blue in zip(reds, greens, blues)]
+            for distances in zip(*rows):
+                lut[i] = distances.index(min(distances))
+                i += 1
+    return bytes(lut)
+
+
+def quantize_256(r: int, g: int, b: int) -> int:
+    """Returns the 256-color code nearest to an RGB color."""
+    return _lut_256()[_cell_index(r, g, b)]
+
+
+def quantize_16(r: int, g: int, b: int) -> int:
+    """Returns the 16-color code (0-15) nearest to an RGB color."""
+    return _lut_16()[_cell_index(r, g, b)]
+
+
+def ansi_16_codes(code: int, background: bool = False) -> List[int]:
+    """Returns the SGR code that sets the foreground (or background) to one of the 16 ANSI colors."""
+    if code < 8:
+        return [(40 if background else 30) + code]
+    return [(100 if background else 90) + code - 8]
+
+
+def _codes(r: int, g: int, b: int, depth: ColorDepth, background: bool) -> List[int]:
+    extended = 48 if background else 38
+    if depth == ColorDepth.TRUE_COLOR:
+        return [extended, 2, r, g, b]
+    if depth == ColorDepth.COLORS_256:
+        return [extended, 5, quantize_256(r, g, b)]
+    return ansi_16_codes(quantize_16(r, g, b), background)
+
+
+def foreground_codes(r: int, g: int, b: int, depth: ColorDepth = ColorDepth.TRUE_COLOR) -> List[int]:
+    """Returns the SGR codes that set the foreground to an RGB color at depth."""
+    return _codes(r, g, b, depth, False)
+
+
+def background_codes(r: int, g: int, b: int, depth: ColorDepth = ColorDepth.TRUE_COLOR) -> List[int]:
+    """Returns the SGR codes that set the background to an RGB color at depth."""
+    return _codes(r, g, b, depth, True)
+
+
+def detect_color_depth(environ: Mapping[str, str] = os.environ) -> ColorDepth:
+    """Returns the color depth advertised by COLORTERM and TERM."""
+    term = environ.get("TERM", "")
+    if environ.get("COLORTERM", "").lower() in ("truecolor", "24bit") or term.endswith("-direct"):
+        return ColorDepth.TRUE_COLOR
+    if "256color" in term:
+        return ColorDepth.COLORS_256
+    return ColorDepth.COLORS_16
+
+
+def color_depth() -> ColorDepth:
+    """Returns the color depth of this process's terminal, detected once."""
+    from theme.capabilities import capabilities  # capabilities builds on this module
+
+    return capabilities().depth
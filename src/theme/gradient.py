@@ -0,0 +1,155 @@
+"""Gradient bars and heatmaps with one color per character cell.
+
+A `Colormap` is sampled once into a table of escape sequences per color
+depth. Rendering a row maps every value to a table index in one pass and
+writes an escape sequence only where the color changes, so runs of cells
+with the same color cost one sequence:
+
+>>> render_row([0.0, 0.0, 1.0], GRAYSCALE, vmin=0, vmax=1, depth=ColorDepth.COLORS_256)
+'\\x1b[48;5;16m  \\x1b[48;5;231m \\x1b[49m'
+"""
+
+import math
+from itertools import groupby
+from typing import Any, List, Optional, Sequence
+
+from theme.color import ColorDepth, background_codes, color_depth, foreground_codes
+
+# Number of colors sampled from a colormap
+LEVELS = 256
+
+RGB = tuple[int, int, int]
+
+
+class Colormap:
+    """Maps values in [0, 1] to colors by interpolating between evenly spaced stops."""
+
+    def __init__(self, name: str, stops: Sequence[RGB]):
+        if len(stops) < 2:
+            raise ValueError("A colormap needs at least two stops")
+        self.name = name
+        self.stops = tuple(stops)
+        self._escapes: dict[tuple[ColorDepth, bool], tuple[str, ...]] = {}
+
+    def __repr__(self) -> str:
+        return f"Colormap({self.name!r})"
+
+    def rgb(self, t: float) -> RGB:
+        """Returns the color at t, clamped to [0, 1]."""
+        t = min(1.0, max(0.0, t)) * (len(self.stops) - 1)
+        i = min(int(t), len(self.stops) - 2)
+        f = t - i
+        (r0, g0, b0), (r1, g1, b1) = self.stops[i], self.stops[i + 1]
+        return round(r0 + (r1 - r0) * f), round(g0 + (g1 - g0) * f), round(b0 + (b1 - b0) * f)
+
+    def escapes(self, depth: ColorDepth, background: bool) -> tuple[str, ...]:
+        """Returns the escape sequence for each of the LEVELS sampled colors, built once per depth."""
+        key = (depth, background)
+        if key not in self._escapes:
+            codes = background_codes if background else foreground_codes
+            self._escapes[key] = tuple(
+                "\x1b[" + ";".join(map(str, codes(*self.rgb(level / (LEVELS - 1)), depth))) + "m"
+                for level in range(LEVELS)
+            )
+        return self._escapes[key]
+
+
+# fmt: off
+GRAYSCALE = Colormap("grayscale", [(0, 0, 0), (255, 255, 255)])
+HEAT      = Colormap("heat",      [(0, 0, 0), (180, 0, 0), (255, 140, 0), (255, 255, 120), (255, 255, 255)])
+VIRIDIS   = Colormap("viridis",   [(68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37)])
+# fmt: on
+
+
+def _tolist(values: Any) -> Any:
+    # Arrays (e.g. NumPy) are converted to lists once instead of being indexed
+    # element by element
+    tolist = getattr(values, "tolist", None)
+    return tolist() if tolist is not None else values
+
+
+def _levels(row: Sequence[float], vmin: float, vmax: float) -> List[int]:
+    top = LEVELS - 1
+    scale = top / (vmax - vmin) if vmax > vmin else 0.0
+    # NaN fails both comparisons and is drawn at the low end
+    return [top if v >= vmax else int((v - vmin) * scale) if v > vmin else 0 for v in row]
+
+
+def _render_levels(levels: List[int], escapes: tuple[str, ...], char: str, reset: str) -> str:
+    parts: List[str] = []
+    for escape, run in groupby(map(escapes.__getitem__, levels)):
+        parts.append(escape)
+        parts.append(char * sum(1 for _ in run))
+    parts.append(reset)
+    return "".join(parts)
+
+
+def _value_range(rows: List[Sequence[float]]) -> tuple[float, float]:
+    finite = [v for row in rows for v in row if not math.isnan(v)]
+    return (min(finite), max(finite)) if finite else (0.0, 0.0)
+
+
+def render_row(
+    values: Sequence[float],
+    colormap: Colormap,
+    vmin: Optional[float] = None,
+    vmax: Optional[float] = None,
+    depth: Optional[ColorDepth] = None,
+    background: bool = True,
+    char: str = " ",
+) -> str:
+    """Renders one line with a cell per value, colored by colormap.
+
+    Args:
+        values: Values for each cell; a sequence or an array with `tolist`.
+        colormap: Colors values between vmin (the first stop) and vmax (the last).
+        vmin, vmax: Value range (default: the range of values).
+        depth: Color depth (default: the terminal's).
+        background: Color the cell background (True) or char (False).
+        char: Character drawn in each cell.
+    """
+    row = _tolist(values)
+    if vmin is None or vmax is None:
+        low, high = _value_range([row])
+        vmin = low if vmin is None else vmin
+        vmax = high if vmax is None else vmax
+    escapes = colormap.escapes(depth or color_depth(), background)
+    return _render_levels(_levels(row, vmin, vmax), escapes, char, "\x1b[49m" if background else "\x1b[39m")
+
+
+def render_heatmap(
+    values: Sequence[Sequence[float]],
+    colormap: Colormap = VIRIDIS,
+    vmin: Optional[float] = None,
+    vmax: Optional[float] = None,
+    depth: Optional[ColorDepth] = None,
+    char: str = "  ",
+) -> str:
+    """Renders a 2D grid of values as lines of colored cells, one line per row.
+
+    All rows share one value range (default: the range of the whole grid).
+    Cells are two spaces wide by default so they are roughly square.
+    """
+    rows = _tolist(values)
+    if vmin is None or vmax is None:
+        low, high = _value_range(rows)
+        vmin = low if vmin is None else vmin
+        vmax = high if vmax is None else vmax
+    escapes = colormap.escapes(depth or color_depth(), True)
+    return "\n".join(_render_levels(_levels(row, vmin, vmax), escapes, char, "\x1b[49m") for row in rows)
+
+
+def render_bar(
+    fraction: float,
+    width: int,
+    colormap: Colormap = VIRIDIS,
+    depth: Optional[ColorDepth] = None,
+    fill: str = "█",
+    empty: str = " ",
+) -> str:
+    """Renders a progress bar whose filled cells run through colormap from left to right."""
+    filled = round(min(1.0, max(0.0, fraction)) * width)
+    escapes = colormap.escapes(depth or color_depth(), False)
+    top = LEVELS - 1
+    levels = [i * top // (width - 1) if width > 1 else 0 for i in range(filled)]
+    return _render_levels(levels, escapes, fill, "\x1b[39m") + empty * (width - filled)
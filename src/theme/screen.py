@@ -0,0 +1,158 @@
+"""Double-buffered full-screen rendering that only redraws changed cells.
+
+A `Screen` is a grid of cells, each a character and a style id. Frames are
+drawn into the back buffer with `put`; `present` compares it with the
+previous frame and writes only the changed cells, with cursor-addressing
+sequences between them, in one write:
+
+    with Screen(40, 12) as screen:
+        for frame in frames:
+            screen.clear()
+            screen.put(0, 0, f"Score: {frame.score}", BOLD)
+            ...
+            screen.present()
+
+Each cell holds one character, so wide characters are not supported.
+"""
+
+from array import array
+from typing import List, Optional, TextIO
+
+from theme.ansi import CompiledStyle
+from theme.writer import StyledWriter
+
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+CLEAR_SCREEN = "\x1b[2J"
+
+# Unchanged gaps up to this many cells between two changed cells are
+# rewritten rather than skipped, since a cursor move costs more bytes
+_MAX_GAP = 4
+
+_PLAIN = CompiledStyle("", "")
+
+
+def _move(x: int, y: int) -> str:
+    return f"\x1b[{y + 1};{x + 1}H"
+
+
+class Screen:
+    """A width x height grid of styled cells, drawn to file by diffing frames.
+
+    Args:
+        width, height: Size of the grid in cells.
+        file: Text stream to write frames to (default: sys.stdout).
+    """
+
+    def __init__(self, width: int, height: int, file: Optional[TextIO] = None):
+        self.width = width
+        self.height = height
+        self._out = StyledWriter(file)
+        # Style id 0 is unstyled
+        self._styles: List[CompiledStyle] = [_PLAIN]
+        self._style_ids: dict[CompiledStyle, int] = {_PLAIN: 0}
+        self._chars = [[" "] * width for _ in range(height)]
+        self._cell_styles = [array("H", bytes(2 * width)) for _ in range(height)]
+        # The previous frame; None until the first frame is presented
+        self._front_chars: Optional[List[List[str]]] = None
+        self._front_styles: Optional[List[array]] = None
+
+    def style_id(self, style: Optional[CompiledStyle]) -> int:
+        """Returns the id of style, registering it on first use."""
+        if style is None:
+            return 0
+        style_id = self._style_ids.get(style)
+        if style_id is None:
+            style_id = self._style_ids[style] = len(self._styles)
+            self._styles.append(style)
+        return style_id
+
+    def clear(self) -> None:
+        """Blanks the back buffer."""
+        for chars, styles in zip(self._chars, self._cell_styles):
+            chars[:] = [" "] * self.width
+            styles[:] = array("H", bytes(2 * self.width))
+
+    def put(self, x: int, y: int, text: str, style: Optional[CompiledStyle] = None) -> None:
+        """Draws text into the back buffer starting at column x of row y, clipped to the grid."""
+        if not 0 <= y < self.height or x >= self.width:
+            return
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        text = text[: self.width - x]
+        end = x + len(text)
+        self._chars[y][x:end] = text
+        self._cell_styles[y][x:end] = array("H", [self.style_id(style)]) * len(text)
+
+    def invalidate(self) -> None:
+        """Forgets the previous frame, so the next one is drawn in full (e.g. after the terminal was cleared)."""
+        self._front_chars = None
+        self._front_styles = None
+
+    def render(self) -> str:
+        """Returns the escape sequences that turn the previous frame into the back buffer, and makes it current."""
+        parts: List[str] = []
+        full = self._front_chars is None
+        if full:
+            parts.append(CLEAR_SCREEN)
+        styles = self._styles
+        current = 0  # Style currently switched on
+        cursor = None  # (x, y) the terminal cursor is at, if known
+
+        for y in range(self.height):
+            chars = self._chars[y]
+            cell_styles = self._cell_styles[y]
+            if full:
+                changed = list(range(self.width))
+            else:
+                front_chars = self._front_chars[y]
+                front_styles = self._front_styles[y]
+                if chars == front_chars and cell_styles == front_styles:
+                    continue
+                changed = [
+                    x for x in range(self.width) if chars[x] != front_chars[x] or cell_styles[x] != front_styles[x]
+                ]
+
+            # Group changed cells into runs, absorbing short unchanged gaps
+            start = prev = changed[0]
+            runs = []
+            for x in changed[1:]:
+                if x - prev > _MAX_GAP:
+                    runs.append((start, prev + 1))
+                    start = x
+                prev = x
+            runs.append((start, prev + 1))
+
+            for start, end in runs:
+                if cursor != (start, y):
+                    parts.append(_move(start, y))
+                for x in range(start, end):
+                    style_id = cell_styles[x]
+                    if style_id != current:
+                        parts.append(styles[current].suffix)
+                        parts.append(styles[style_id].prefix)
+                        current = style_id
+                    parts.append(chars[x])
+                cursor = (end, y) if end < self.width else None
+
+        parts.append(styles[current].suffix)
+        self._front_chars = [row[:] for row in self._chars]
+        self._front_styles = [array("H", row) for row in self._cell_styles]
+        return "".join(parts)
+
+    def present(self) -> None:
+        """Writes the changes since the previous frame in one write."""
+        frame = self.render()
+        if frame:
+            self._out.write(None, frame)
+            self._out.flush()
+
+    def __enter__(self) -> "Screen":
+        self._out.write(None, HIDE_CURSOR)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        # Leave the cursor below the board
+        self._out.write(None, _move(0, self.height) + SHOW_CURSOR)
+        self._out.flush()
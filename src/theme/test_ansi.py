@@ -0,0 +1,61 @@
+"""Tests for compiled SGR styles."""
+
+from theme.ansi import _OFF_CODES, AnsiCodeEnum, AnsiStyle, CompiledStyle, compile_style, get_off_codes
+
+
+def test_compile_style_prefix_and_suffix():
+    """Test a style compiles to its start sequence and reversed off codes."""
+    style = compile_style((AnsiCodeEnum.BOLD, AnsiCodeEnum.UNDERLINE))
+    assert style == CompiledStyle("\x1b[1;4m", "\x1b[24;22m")
+    assert style("Hi") == "\x1b[1;4mHi\x1b[24;22m"
+
+
+def test_compile_style_empty():
+    """Test an empty style leaves text unchanged."""
+    assert compile_style(())("Hi") == "Hi"
+
+
+def test_compile_style_is_interned():
+    """Test equal code tuples share one compiled style."""
+    codes = (AnsiCodeEnum.ITALIC, AnsiCodeEnum.FOREGROUND_GREEN)
+    assert compile_style(codes) is compile_style(tuple(codes))
+
+
+def test_dynamic_uses_compiled_style():
+    """Test AnsiStyle.dynamic matches the compiled style."""
+    codes = [AnsiCodeEnum.DIM, AnsiCodeEnum.BACKGROUND_BLUE]
+    assert AnsiStyle.dynamic(codes, "x") == "\x1b[2;44mx\x1b[49;22m"
+
+
+def test_off_code_table_covers_every_code():
+    """Test the off code table has an entry for every SGR code."""
+    assert len(_OFF_CODES) == 256
+    assert _OFF_CODES[AnsiCodeEnum.FOREGROUND_HIGH_INTENSITY_CYAN] == AnsiCodeEnum.FOREGROUND_RESET
+    assert _OFF_CODES[AnsiCodeEnum.BACKGROUND_RED] == AnsiCodeEnum.BACKGROUND_RESET
+    assert _OFF_CODES[AnsiCodeEnum.STRIKE] == AnsiCodeEnum.STRIKE_OFF
+    assert _OFF_CODES[AnsiCodeEnum.RESET] is None
+
+
+def test_extended_color_arguments_are_not_codes():
+    """Test 8-bit and 24-bit color arguments do not add off codes of their own."""
+    # 5 (8-bit mode) would otherwise read as BLINK and 100 as a background color
+    assert get_off_codes(AnsiStyle.foreground_8_bit(208)) == [AnsiCodeEnum.FOREGROUND_RESET]
+    assert get_off_codes(AnsiStyle.foreground_24_bit(255, 100, 1)) == [AnsiCodeEnum.FOREGROUND_RESET]
+    codes = [*AnsiStyle.foreground_24_bit(0, 255, 0), *AnsiStyle.background_8_bit(232), AnsiCodeEnum.BOLD]
+    assert get_off_codes(codes) == [
+        AnsiCodeEnum.BOLD_OFF,
+        AnsiCodeEnum.BACKGROUND_RESET,
+        AnsiCodeEnum.FOREGROUND_RESET,
+    ]
+    assert AnsiStyle.dynamic(AnsiStyle.background_24_bit(40, 40, 60), "x") == "\x1b[48;2;40;40;60mx\x1b[49m"
+
+
+def test_malformed_codes_do_not_raise():
+    """Test codes outside 0-255 and unknown extended color modes are ignored instead of raising."""
+    reset = AnsiCodeEnum.FOREGROUND_RESET
+    assert get_off_codes([38, 256]) == [reset]
+    assert get_off_codes([38, 5, 300]) == [reset]
+    assert get_off_codes([AnsiCodeEnum.BOLD, 300, -1]) == [AnsiCodeEnum.BOLD_OFF]
+    # An unknown mode takes the rest of the codes, so 1 is not read as BOLD
+    assert get_off_codes([38, 7, 1]) == [reset]
+    assert compile_style((38, 256)).suffix == "\x1b[39m"
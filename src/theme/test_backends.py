@@ -0,0 +1,72 @@
+"""Parity tests: the native ANSI backend against the colorful backend."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from theme.color import ANSI_16_RGB, ColorDepth
+from theme.themes import AnsiTheme, CustomTheme
+
+SRC = Path(__file__).resolve().parents[1]
+
+STYLES = ("bold_color", "bold", "color", "faint", "faint_color")
+COLOR_VALUES = [str(code) for code in range(len(ANSI_16_RGB))] + ["#000000", "#FFFFFF", "#00FF00", "#FF6464", "#123456"]
+TEXTS = ["", "x", "Hello, world!", "漢字 │ ok", "nested \x1b[1mbold\x1b[22m"]
+
+
+@pytest.mark.parametrize("depth", list(ColorDepth))
+@pytest.mark.parametrize("color_value", COLOR_VALUES)
+def test_ansi_backend_matches_colorful(color_value, depth):
+    """Test every style gives byte-identical output in both backends."""
+    colorful_theme = CustomTheme(color_value, depth)
+    ansi_theme = AnsiTheme(color_value, depth)
+    for name in STYLES:
+        for text in TEXTS:
+            expected = str(getattr(colorful_theme, name)(text)).encode()
+            assert getattr(ansi_theme, name)(text).encode() == expected, (name, text)
+
+
+def test_get_color():
+    """Test get_color returns the color value in both backends."""
+    assert CustomTheme("#00FF00").get_color() == "#00FF00"
+    assert AnsiTheme("10").get_color() == "10"
+
+
+def test_ansi_theme_validates_color():
+    """Test invalid colors raise like the colorful backend."""
+    with pytest.raises(ValueError):
+        AnsiTheme("#nope")
+
+
+def _run(code: str, backend: str) -> subprocess.CompletedProcess:
+    # Output is captured, so colors are forced on to get colored themes
+    env = dict(os.environ, THEME_BACKEND=backend, FORCE_COLOR="1")
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=SRC)
+
+
+def test_backend_selected_from_environment():
+    """Test THEME_BACKEND picks the theme class without importing colorful for ansi."""
+    code = (
+        "import sys, theme; t = theme.ANSI_CODE_BRIGHT_RED_THEME; t.bold_color('x');"
+        "print(type(t).__name__, 'colorful' in sys.modules)"
+    )
+    assert _run(code, "ansi").stdout.split() == ["AnsiTheme", "False"]
+    assert _run(code, "colorful").stdout.split() == ["CustomTheme", "True"]
+
+
+def test_unknown_backend_is_rejected():
+    """Test an unknown THEME_BACKEND fails at import."""
+    proc = _run("import theme", "nope")
+    assert proc.returncode != 0
+    assert "Unknown THEME_BACKEND 'nope'" in proc.stderr
+
+
+def test_ansi_code_themes_use_their_code_below_true_color():
+    """Test themes created from an ANSI code keep that code on 256- and 16-color terminals."""
+    for cls in (CustomTheme, AnsiTheme):
+        assert cls("9", ColorDepth.COLORS_256).color("x") == "\x1b[91mx\x1b[39m"
+        assert cls("4", ColorDepth.COLORS_16).color("x") == "\x1b[34mx\x1b[39m"
+        assert cls("4", ColorDepth.TRUE_COLOR).color("x") == "\x1b[38;2;0;0;128mx\x1b[39m"
@@ -0,0 +1,110 @@
+"""Tests for terminal capability detection."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from theme import capabilities as caps
+from theme.capabilities import Capabilities, detect_capabilities
+from theme.color import ColorDepth
+
+SRC = Path(__file__).resolve().parents[1]
+
+
+class FakeTTY(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def test_pipe_is_plain():
+    """Test a stream that is not a terminal is not styled."""
+    assert detect_capabilities(io.StringIO(), {"TERM": "xterm-256color"}) == Capabilities(
+        False, ColorDepth.COLORS_256, False
+    )
+
+
+def test_no_color_wins():
+    """Test NO_COLOR turns colors off, even with FORCE_COLOR."""
+    environ = {"NO_COLOR": "1", "FORCE_COLOR": "3", "COLORTERM": "truecolor"}
+    assert not detect_capabilities(FakeTTY(), environ).color
+
+
+def test_force_color():
+    """Test FORCE_COLOR turns colors on for pipes and its levels set the depth."""
+    assert detect_capabilities(io.StringIO(), {"FORCE_COLOR": "3"}) == Capabilities(True, ColorDepth.TRUE_COLOR, False)
+    assert detect_capabilities(io.StringIO(), {"FORCE_COLOR": "2"}).depth == ColorDepth.COLORS_256
+    assert detect_capabilities(io.StringIO(), {"FORCE_COLOR": "1", "COLORTERM": "24bit"}).color
+    assert not detect_capabilities(FakeTTY(), {"FORCE_COLOR": "0", "TERM": "xterm"}).color
+
+
+def test_terminal_depth():
+    """Test terminals are styled with the depth from COLORTERM, terminfo or TERM."""
+    assert detect_capabilities(FakeTTY(), {"TERM": "xterm", "COLORTERM": "truecolor"}).depth == ColorDepth.TRUE_COLOR
+    assert detect_capabilities(FakeTTY(), {"TERM": "foot-direct"}).depth == ColorDepth.TRUE_COLOR
+    assert detect_capabilities(FakeTTY(), {"TERM": "no-such-256color"}).depth == ColorDepth.COLORS_256
+    assert detect_capabilities(FakeTTY(), {"TERM": "no-such-term"}).depth == ColorDepth.COLORS_16
+    assert not detect_capabilities(FakeTTY(), {"TERM": "dumb"}).color
+
+
+def test_terminfo_is_read_for_own_term_only():
+    """Test probing a second TERM in one process does not reuse the first one's terminfo entry."""
+    code = (
+        "from theme.capabilities import _probe_depth;"
+        "print(*(int(_probe_depth({'TERM': term}, True, None)) for term in ('xterm-256color', 'xterm', 'vt100')))"
+    )
+    env = {**os.environ, "TERM": "xterm-256color"}
+    env.pop("COLORTERM", None)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=SRC, check=True)
+    assert out.stdout.split() == ["256", "16", "16"]
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    """Test the depth probe is cached on disk by TERM, COLORTERM and tty."""
+    path = str(tmp_path / "capabilities.json")
+    calls = []
+
+    def fake_terminfo_depth(term):
+        calls.append(term)
+        return ColorDepth.COLORS_256
+
+    monkeypatch.setattr(caps, "_terminfo_depth", fake_terminfo_depth)
+    environ = {"TERM": "screen"}
+    assert detect_capabilities(FakeTTY(), environ, cache_path=path).depth == ColorDepth.COLORS_256
+    assert detect_capabilities(FakeTTY(), environ, cache_path=path).depth == ColorDepth.COLORS_256
+    assert calls == ["screen"]
+    with open(path) as f:
+        assert json.load(f) == {"screen||1": 256}
+
+    detect_capabilities(FakeTTY(), {"TERM": "screen", "COLORTERM": "x"}, cache_path=path)
+    assert calls == ["screen", "screen"]
+
+
+def test_disk_cache_skips_guesses(tmp_path, monkeypatch):
+    """Test a depth guessed from TERM, without terminfo, is not written to the disk cache."""
+    path = tmp_path / "capabilities.json"
+    monkeypatch.setattr(caps, "_terminfo_depth", lambda term: None)
+    environ = {"TERM": "other-256color"}
+    assert detect_capabilities(FakeTTY(), environ, cache_path=str(path)).depth == ColorDepth.COLORS_256
+    assert not path.exists()
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    """Test an unreadable cache file falls back to probing."""
+    path = tmp_path / "capabilities.json"
+    path.write_text("{not json")
+    environ = {"TERM": "no-such-256color"}
+    assert detect_capabilities(FakeTTY(), environ, cache_path=str(path)).depth == ColorDepth.COLORS_256
+
+
+def test_piped_themes_are_plain():
+    """Test themes are plain and colorful is never imported when stdout is a pipe."""
+    code = (
+        "import sys, theme; t = theme.new_theme_from_hex_color('#FF0000');"
+        "print(type(t).__name__, theme.ANSI_CODE_DARK_RED_THEME.bold_color('x'), 'colorful' in sys.modules)"
+    )
+    env = {k: v for k, v in os.environ.items() if k not in ("FORCE_COLOR", "NO_COLOR")}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=SRC, check=True)
+    assert out.stdout.split() == ["PlainTheme", "x", "False"]
@@ -0,0 +1,68 @@
+"""Tests for color depths and palette quantization."""
+
+from theme.ansi import AnsiStyle
+from theme.color import (
+    ANSI_16_RGB,
+    ANSI_256_RGB,
+    ColorDepth,
+    background_codes,
+    detect_color_depth,
+    foreground_codes,
+    quantize_16,
+    quantize_256,
+)
+from theme.themes import new_theme_from_ansi_code, new_theme_from_hex_color
+
+
+def _distance(a, b):
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+def test_quantize_256_matches_nearest_search():
+    """Test the lookup table agrees with a full scan at sampled colors."""
+    for r in range(4, 256, 24):
+        for g in range(4, 256, 24):
+            for b in range(4, 256, 24):
+                rgb = (r, g, b)
+                best = min(_distance(rgb, ANSI_256_RGB[code]) for code in range(16, 256))
+                assert _distance(rgb, ANSI_256_RGB[quantize_256(r, g, b)]) == best
+
+
+def test_quantize_16_matches_nearest_search():
+    """Test the 16-color table agrees with a full scan at sampled colors."""
+    for r in range(4, 256, 24):
+        for g in range(4, 256, 24):
+            for b in range(4, 256, 24):
+                rgb = (r, g, b)
+                best = min(_distance(rgb, palette_rgb) for palette_rgb in ANSI_16_RGB)
+                assert _distance(rgb, ANSI_16_RGB[quantize_16(r, g, b)]) == best
+
+
+def test_palette_colors_map_to_themselves():
+    """Test the 16 ANSI colors and the color cube are their own nearest colors."""
+    assert [quantize_16(*rgb) for rgb in ANSI_16_RGB] == list(range(16))
+    assert [quantize_256(*rgb) for rgb in ANSI_256_RGB[16:232]] == list(range(16, 232))
+
+
+def test_codes_per_depth():
+    """Test foreground and background codes at each depth."""
+    assert foreground_codes(255, 100, 100) == [38, 2, 255, 100, 100]
+    assert foreground_codes(255, 100, 100, ColorDepth.COLORS_256) == [38, 5, 203]
+    assert foreground_codes(250, 5, 5, ColorDepth.COLORS_16) == [91]
+    assert background_codes(120, 0, 0, ColorDepth.COLORS_16) == [41]
+    assert AnsiStyle.background_24_bit(40, 40, 60, depth=ColorDepth.COLORS_256) == [48, 5, 236]
+
+
+def test_detect_color_depth():
+    """Test COLORTERM and TERM select the color depth."""
+    assert detect_color_depth({"COLORTERM": "truecolor", "TERM": "xterm"}) == ColorDepth.TRUE_COLOR
+    assert detect_color_depth({"TERM": "xterm-256color"}) == ColorDepth.COLORS_256
+    assert detect_color_depth({"TERM": "xterm"}) == ColorDepth.COLORS_16
+    assert detect_color_depth({}) == ColorDepth.COLORS_16
+
+
+def test_theme_color_is_downsampled():
+    """Test themes emit palette codes below true color."""
+    assert str(new_theme_from_hex_color("#FF6464", ColorDepth.COLORS_256).color("x")) == "\x1b[38;5;203mx\x1b[39m"
+    assert str(new_theme_from_ansi_code(9, ColorDepth.COLORS_16).color("x")) == "\x1b[91mx\x1b[39m"
+    assert str(new_theme_from_hex_color("#00FF00", ColorDepth.TRUE_COLOR).color("x")) == "\x1b[38;2;0;255;0mx\x1b[39m"
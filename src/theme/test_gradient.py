@@ -0,0 +1,72 @@
+"""Tests for gradient and heatmap rendering."""
+
+import pytest
+
+from theme.color import ColorDepth
+from theme.gradient import GRAYSCALE, HEAT, Colormap, render_bar, render_heatmap, render_row
+from theme.width import strip_ansi, visible_width
+
+
+class FakeArray:
+    """Stands in for an array type that converts with tolist."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def tolist(self):
+        return self.rows
+
+
+def test_colormap_interpolates_between_stops():
+    """Test colors are interpolated and clamped to the end stops."""
+    assert HEAT.rgb(0.0) == (0, 0, 0)
+    assert HEAT.rgb(1.0) == (255, 255, 255)
+    assert HEAT.rgb(2.0) == (255, 255, 255)
+    assert HEAT.rgb(0.125) == (90, 0, 0)
+
+
+def test_colormap_needs_two_stops():
+    """Test a colormap with a single stop is rejected."""
+    with pytest.raises(ValueError):
+        Colormap("flat", [(0, 0, 0)])
+
+
+def test_render_row_skips_repeated_escapes():
+    """Test neighbouring cells with the same color share one escape sequence."""
+    line = render_row([0, 0, 0, 10, 10], GRAYSCALE, depth=ColorDepth.TRUE_COLOR)
+    assert line == "\x1b[48;2;0;0;0m   \x1b[48;2;255;255;255m  \x1b[49m"
+
+
+def test_render_row_merges_colors_equal_after_downsampling():
+    """Test levels that quantize to the same palette color are merged."""
+    line = render_row([0.0, 0.01, 0.02], GRAYSCALE, vmin=0, vmax=1, depth=ColorDepth.COLORS_16)
+    assert line == "\x1b[40m   \x1b[49m"
+
+
+def test_render_row_foreground_and_out_of_range():
+    """Test foreground rendering clamps values outside vmin..vmax."""
+    line = render_row([-5, 5], GRAYSCALE, vmin=0, vmax=1, depth=ColorDepth.COLORS_256, background=False, char="#")
+    assert line == "\x1b[38;5;16m#\x1b[38;5;231m#\x1b[39m"
+
+
+def test_render_heatmap_shares_range_across_rows():
+    """Test every row is scaled with the range of the whole grid."""
+    out = render_heatmap(FakeArray([[0, 1], [2, 3]]), GRAYSCALE, depth=ColorDepth.TRUE_COLOR, char=" ")
+    first, second = out.split("\n")
+    assert first.startswith("\x1b[48;2;0;0;0m ")
+    assert second.endswith("\x1b[48;2;255;255;255m \x1b[49m")
+    assert [visible_width(line) for line in (first, second)] == [2, 2]
+
+
+def test_render_heatmap_nan_and_flat():
+    """Test NaN cells and a grid with a single value render without errors."""
+    assert strip_ansi(render_heatmap([[float("nan"), 1.0]], depth=ColorDepth.COLORS_256)) == "    "
+    assert strip_ansi(render_heatmap([[4, 4, 4]], depth=ColorDepth.COLORS_256, char="x")) == "xxx"
+
+
+def test_render_bar():
+    """Test the filled part runs through the colormap and the rest is empty."""
+    bar = render_bar(0.5, 10, GRAYSCALE, depth=ColorDepth.TRUE_COLOR)
+    assert strip_ansi(bar) == "█" * 5 + " " * 5
+    assert bar.startswith("\x1b[38;2;0;0;0m█\x1b[38;2;28;28;28m█")
+    assert strip_ansi(render_bar(2.0, 4, depth=ColorDepth.COLORS_16)) == "████"
@@ -0,0 +1,81 @@
+"""Tests for the double-buffered screen."""
+
+import io
+
+from theme.ansi import AnsiCodeEnum, compile_style
+from theme.screen import CLEAR_SCREEN, HIDE_CURSOR, SHOW_CURSOR, Screen
+from theme.width import strip_ansi
+
+BOLD = compile_style((AnsiCodeEnum.BOLD,))
+RED = compile_style((AnsiCodeEnum.FOREGROUND_RED,))
+
+
+def test_first_frame_is_drawn_in_full():
+    """Test the first frame clears the screen and draws every cell."""
+    screen = Screen(3, 2)
+    screen.put(0, 0, "ab", BOLD)
+    assert screen.render() == f"{CLEAR_SCREEN}\x1b[1;1H\x1b[1mab\x1b[22m \x1b[2;1H   "
+
+
+def test_unchanged_frame_writes_nothing():
+    """Test presenting the same frame twice writes nothing the second time."""
+    out = io.StringIO()
+    screen = Screen(5, 2, out)
+    screen.put(1, 1, "x", RED)
+    screen.present()
+    written = out.getvalue()
+    screen.put(1, 1, "x", RED)
+    screen.present()
+    assert out.getvalue() == written
+
+
+def test_only_changed_cells_are_written():
+    """Test changed cells are addressed directly and styles switch only when needed."""
+    screen = Screen(20, 3)
+    screen.put(0, 0, "score: 1", BOLD)
+    screen.render()
+
+    screen.put(7, 0, "2", BOLD)
+    screen.put(15, 2, "@", RED)
+    assert screen.render() == "\x1b[1;8H\x1b[1m2\x1b[3;16H\x1b[22m\x1b[31m@\x1b[39m"
+
+
+def test_short_gaps_are_rewritten():
+    """Test nearby changes on a row are joined instead of moving the cursor."""
+    screen = Screen(10, 1)
+    screen.render()
+    screen.put(0, 0, "a")
+    screen.put(3, 0, "b")
+    screen.put(9, 0, "c")
+    assert screen.render() == "\x1b[1;1Ha  b\x1b[1;10Hc"
+
+
+def test_style_change_alone_is_redrawn():
+    """Test a cell whose style changes is redrawn even if its character is the same."""
+    screen = Screen(3, 1)
+    screen.put(0, 0, "abc")
+    screen.render()
+    screen.put(1, 0, "b", BOLD)
+    assert screen.render() == "\x1b[1;2H\x1b[1mb\x1b[22m"
+
+
+def test_clipping_and_clear():
+    """Test text is clipped to the grid and clear blanks the back buffer."""
+    screen = Screen(4, 2)
+    screen.put(-2, 0, "xyabcd")
+    screen.put(0, 5, "ignored")
+    assert strip_ansi(screen.render()).replace(" ", "") == "abcd"
+    screen.clear()
+    assert strip_ansi(screen.render()) == "    "
+
+
+def test_invalidate_and_context_manager():
+    """Test invalidate forces a full redraw and the context manager hides and restores the cursor."""
+    out = io.StringIO()
+    with Screen(2, 1, out) as screen:
+        screen.present()
+        screen.invalidate()
+        screen.present()
+    assert out.getvalue().count(CLEAR_SCREEN) == 2
+    assert out.getvalue().startswith(HIDE_CURSOR)
+    assert out.getvalue().endswith("\x1b[2;1H" + SHOW_CURSOR)
@@ -0,0 +1,79 @@
+"""Tests for interned themes and their precomputed styles."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import theme
+from theme.color import ColorDepth
+from theme.themes import (
+    CustomTheme,
+    _colorful,
+    _create_rgb_color_style,
+    new_theme_from_ansi_code,
+    new_theme_from_hex_color,
+)
+
+SRC = Path(__file__).resolve().parents[1]
+
+
+def test_themes_are_interned():
+    """Test the same color value and depth returns the same theme."""
+    # An explicit depth, since without one every theme is PlainTheme when stdout is not a terminal
+    true_color, colors_256 = ColorDepth.TRUE_COLOR, ColorDepth.COLORS_256
+    green = new_theme_from_hex_color("#12ab34", true_color)
+    assert isinstance(green, CustomTheme)
+    assert green is new_theme_from_hex_color("#12AB34", true_color)
+    assert green is not new_theme_from_hex_color("#12ab35", true_color)
+    assert new_theme_from_ansi_code(3, colors_256) is new_theme_from_ansi_code(3, colors_256)
+    assert new_theme_from_ansi_code(3, colors_256) is not new_theme_from_ansi_code(3, true_color)
+    assert new_theme_from_ansi_code(3, colors_256) is not new_theme_from_ansi_code(4, colors_256)
+
+
+def test_invalid_colors_are_rejected():
+    """Test invalid color values raise instead of being interned."""
+    with pytest.raises(ValueError):
+        new_theme_from_ansi_code(16)
+    with pytest.raises(ValueError):
+        new_theme_from_hex_color("00FF00")
+
+
+def test_styles_match_colorful():
+    """Test every style matches composing the colorful styles directly."""
+    cf = _colorful()
+    theme = new_theme_from_hex_color("#FF8000", ColorDepth.TRUE_COLOR)
+    color = _create_rgb_color_style(255, 128, 0, ColorDepth.TRUE_COLOR)
+    expected = {
+        "bold_color": cf.bold & color,
+        "bold": cf.bold,
+        "color": color,
+        "faint": cf.dimmed,
+        "faint_color": cf.dimmed & color,
+    }
+    for name, style in expected.items():
+        assert getattr(theme, name)("Hi there") == str(style("Hi there"))
+        assert getattr(theme, name)("") == str(style(""))
+
+
+def test_defining_themes_does_not_import_colorful():
+    """Test importing theme and creating themes leaves colorful unimported."""
+    code = "import sys, theme; theme.new_theme_from_hex_color('#010203'); print('colorful' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=SRC)
+    assert out.stdout.strip() == "False"
+
+
+def test_import_does_not_probe_terminal():
+    """Test importing theme neither probes the terminal nor imports json, and constant themes are built on access."""
+    code = (
+        "import sys, theme; from theme.capabilities import capabilities;"
+        "print('json' in sys.modules, capabilities.cache_info().currsize);"
+        "from theme import ANSI_CODE_DARK_RED_THEME;"
+        "print(ANSI_CODE_DARK_RED_THEME is theme.ANSI_CODE_DARK_RED_THEME is theme.new_theme_from_ansi_code(1),"
+        "capabilities.cache_info().currsize)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=SRC)
+    assert out.stdout.split() == ["False", "0", "True", "1"]
+    with pytest.raises(AttributeError):
+        _ = theme.ANSI_CODE_NO_SUCH_THEME
@@ -0,0 +1,45 @@
+"""Tests for ANSI stripping and display width."""
+
+from theme.ansi import AnsiCodeEnum, AnsiStyle, compile_style
+from theme.width import strip_ansi, visible_width
+
+
+def test_strip_ansi_plain_text():
+    """Test text without escape sequences is returned unchanged."""
+    assert strip_ansi("hello") == "hello"
+    assert strip_ansi("") == ""
+
+
+def test_strip_ansi_sgr():
+    """Test SGR sequences from compiled styles are removed."""
+    codes = (AnsiCodeEnum.BOLD, *AnsiStyle.foreground_24_bit(r=1, g=2, b=3))
+    assert strip_ansi(compile_style(codes)("a") + "b" + compile_style((AnsiCodeEnum.ITALIC,))("c")) == "abc"
+
+
+def test_strip_ansi_other_sequences():
+    """Test cursor movement, OSC hyperlinks and two-character escapes are removed."""
+    assert strip_ansi("\x1b[2J\x1b[1;1Hx") == "x"
+    assert strip_ansi("\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x07!") == "link!"
+    assert strip_ansi("a\x1b7b\x1b8c") == "abc"
+
+
+def test_strip_ansi_truncated_sequence():
+    """Test a sequence cut off at the end of the text is dropped."""
+    assert strip_ansi("ok\x1b[1;3") == "ok"
+    assert strip_ansi("ok\x1b") == "ok"
+
+
+def test_visible_width():
+    """Test wide, combining and control characters are measured in columns."""
+    assert visible_width(compile_style((AnsiCodeEnum.BOLD,))("abc")) == 3
+    assert visible_width("漢字") == 4
+    assert visible_width("ｆｕｌｌ") == 8
+    assert visible_width("é") == 1
+    assert visible_width("───┼───") == 7
+
+
+def test_long_strings_bypass_cache():
+    """Test strings longer than the cache limit give the same results."""
+    line = compile_style((AnsiCodeEnum.FOREGROUND_RED,))("字x") * 1000
+    assert strip_ansi(line) == "字x" * 1000
+    assert visible_width(line) == 3000
@@ -0,0 +1,63 @@
+"""Tests for the buffered styled writer."""
+
+import io
+import os
+
+from theme.ansi import AnsiCodeEnum, compile_style
+from theme.writer import StyledWriter
+
+BOLD = compile_style((AnsiCodeEnum.BOLD,))
+RED = compile_style((AnsiCodeEnum.FOREGROUND_RED,))
+
+
+def test_adjacent_spans_are_merged():
+    """Test adjacent spans in the same style share one start and one end sequence."""
+    out = io.StringIO()
+    StyledWriter(out).write(BOLD, "a").write(BOLD, "b").write(RED, "c").flush()
+    assert out.getvalue() == "\x1b[1mab\x1b[22m\x1b[31mc\x1b[39m"
+
+
+def test_codes_and_empty_styles():
+    """Test raw codes are compiled and empty styles write plain text."""
+    out = io.StringIO()
+    StyledWriter(out).write([AnsiCodeEnum.BOLD], "a").write((), "b").write(None, "c").flush()
+    assert out.getvalue() == "\x1b[1ma\x1b[22mbc"
+
+
+def test_unstyled_writer_ignores_styles():
+    """Test styled=False writes only the text."""
+    out = io.StringIO()
+    StyledWriter(out, styled=False).write(BOLD, "a").writeln(RED, "b").flush()
+    assert out.getvalue() == "ab\n"
+
+
+def test_flush_closes_open_style_and_reuses_buffer():
+    """Test each flush closes the open style and starts from an empty buffer."""
+    out = io.StringIO()
+    writer = StyledWriter(out)
+    writer.write(BOLD, "a").flush()
+    writer.write(BOLD, "b").flush()
+    writer.flush()
+    assert out.getvalue() == "\x1b[1ma\x1b[22m\x1b[1mb\x1b[22m"
+    assert writer.getvalue() == ""
+
+
+def test_flush_threshold():
+    """Test the buffer is flushed automatically once it is large enough."""
+    out = io.StringIO()
+    writer = StyledWriter(out, flush_threshold=4)
+    writer.write(None, "abc")
+    assert out.getvalue() == ""
+    writer.write(None, "d")
+    assert out.getvalue() == "abcd"
+
+
+def test_writes_to_file_descriptor(tmp_path):
+    """Test output goes to the file descriptor in one write, after earlier stream output."""
+    path = tmp_path / "out.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("before\n")
+        with StyledWriter(f) as writer:
+            writer.writeln(BOLD, "│ ok")
+        assert os.fstat(f.fileno()).st_size == path.stat().st_size
+    assert path.read_text(encoding="utf-8") == "before\n\x1b[1m│ ok\x1b[22m\n"
@@ -1,28 +1,39 @@
-import colorful as cf
-from colorful import ansi
-from colorful.core import Colorful
-
-cf.use_true_colors()  # Enable true colors for hex/RGB
-
-# RGB for 16 ANSI codes
-ANSI_16_RGB = [
-    (0, 0, 0),
-    (128, 0, 0),
-    (0, 128, 0),
-    (128, 128, 0),
-    (0, 0, 128),
-    (128, 0, 128),
-    (0, 128, 128),
-    (192, 192, 192),
-    (128, 128, 128),
-    (255, 0, 0),
-    (0, 255, 0),
-    (255, 255, 0),
-    (0, 0, 255),
-    (255, 0, 255),
-    (0, 255, 255),
-    (255, 255, 255),
-]
+import os
+from functools import cache
+from typing import TextIO
+
+from theme.ansi import AnsiCodeEnum, CompiledStyle, compile_style
+from theme.capabilities import capabilities as _capabilities
+from theme.capabilities import detect_capabilities as _detect_capabilities
+from theme.color import ANSI_16_RGB, ColorDepth, ansi_16_codes, color_depth, foreground_codes
+
+# colorful is imported lazily, on the first styled write, so commands whose
+# output is piped (or that never style anything) do not pay for importing it.
+
+
+@cache
+def _colorful():
+    """Imports colorful and sets its color mode to the terminal's color depth, once."""
+    import colorful as cf
+
+    use_colors = {
+        ColorDepth.TRUE_COLOR: cf.use_true_colors,
+        ColorDepth.COLORS_256: cf.use_256_ansi_colors,
+        ColorDepth.COLORS_16: cf.use_16_ansi_colors,
+    }[color_depth()]
+    use_colors()
+    return cf
+
+
+def colors_enabled(stream: TextIO | None = None) -> bool:
+    """Returns whether styled output should be written to stream (default: stdout).
+
+    See theme.capabilities; the answer for stdout is probed once per process.
+    """
+    if stream is None:
+        return _capabilities().color
+    return _detect_capabilities(stream).color
+
 
 # Define the ANSI codes
 ANSI_CODE_BLACK = 0
@@ -43,28 +54,83 @@ ANSI_CODE_BRIGHT_CYAN = 14
 ANSI_CODE_WHITE = 15
 
 
-def _create_rgb_color_style(r: int, g: int, b: int):
-    """Create a ColorfulStyle for RGB color using true colors."""
-    # Create ANSI escape code for true color foreground
-    start_code = ansi.ANSI_ESCAPE_CODE.format(
-        code=f"{8 + ansi.FOREGROUND_COLOR_OFFSET};2;{r};{g};{b}"
-    )
-    end_code = ansi.ANSI_ESCAPE_CODE.format(
-        code=ansi.FOREGROUND_COLOR_OFFSET + ansi.COLOR_CLOSE_OFFSET
-    )
+def _create_rgb_color_style(r: int, g: int, b: int, depth: ColorDepth):
+    """Create a ColorfulStyle for an RGB color, downsampled to depth."""
+    return _create_color_style(foreground_codes(r, g, b, depth), depth)
+
+
+def _create_color_style(codes: list[int], depth: ColorDepth):
+    """Create a ColorfulStyle that sets the foreground with codes."""
+    cf = _colorful()
+    from colorful import ansi
+    from colorful.core import Colorful
+
+    # Create ANSI escape code for the foreground: 24-bit, or a 256/16 palette color
+    start_code = ansi.ANSI_ESCAPE_CODE.format(code=";".join(map(str, codes)))
+    end_code = ansi.ANSI_ESCAPE_CODE.format(code=ansi.FOREGROUND_COLOR_OFFSET + ansi.COLOR_CLOSE_OFFSET)
     # Create ColorfulStyle with the style tuple
     style_tuple = (start_code, end_code)
-    return Colorful.ColorfulStyle(style_tuple, Colorful.TRUE_COLORS, cf.colorful)
+    colormode = {
+        ColorDepth.TRUE_COLOR: Colorful.TRUE_COLORS,
+        ColorDepth.COLORS_256: Colorful.ANSI_256_COLORS,
+        ColorDepth.COLORS_16: Colorful.ANSI_16_COLORS,
+    }[depth]
+    return Colorful.ColorfulStyle(style_tuple, colormode, cf.colorful)
+
+
+# Interned themes by (backend, color value, depth), so every call for the same
+# color returns the same theme and its styles are only built once
+_THEMES: dict[tuple[type["CustomTheme"], str, ColorDepth | None], "CustomTheme"] = {}
+
+
+def _intern_theme(color_value: str, depth: ColorDepth | None) -> "CustomTheme | PlainTheme":
+    key = (_BACKEND, color_value, depth)
+    theme = _THEMES.get(key)
+    if theme is None:
+        if depth is None and not _capabilities().color:
+            # Output is not styled (e.g. piped), so no escape codes are ever built
+            _parse_rgb(color_value)
+            theme = _PLAIN_THEME
+        else:
+            theme = _BACKEND(color_value, depth)
+        _THEMES[key] = theme
+    return theme
+
+
+def new_theme_from_ansi_code(code: int, depth: ColorDepth | None = None) -> "CustomTheme | PlainTheme":
+    """Create a CustomTheme from an ANSI code (0-15).
+
+    Without a depth, this returns PlainTheme when stdout is not styled.
+    """
+    return _intern_theme(str(code), depth)
+
+
+def new_theme_from_hex_color(hex_color: str, depth: ColorDepth | None = None) -> "CustomTheme | PlainTheme":
+    """Create a CustomTheme from a hex color string (e.g., "#00FF00").
+
+    depth defaults to the terminal's color depth; on 256- and 16-color
+    terminals the color is replaced by the nearest palette color. Without a
+    depth, this returns PlainTheme when stdout is not styled.
+    """
+    return _intern_theme(hex_color.upper(), depth)
 
 
-def new_theme_from_ansi_code(code: int) -> "CustomTheme":
-    """Create a CustomTheme from an ANSI code (0-15)."""
-    return CustomTheme(str(code))
+def _parse_rgb(color_value: str) -> tuple[int, int, int]:
+    if color_value.isdigit():
+        code = int(color_value)
+        if 0 <= code <= 15:
+            return ANSI_16_RGB[code]
+        raise ValueError("Unsupported ANSI code")
+    elif color_value.startswith("#"):
+        r = int(color_value[1:3], 16)
+        g = int(color_value[3:5], 16)
+        b = int(color_value[5:7], 16)
+        return r, g, b
+    raise ValueError("Invalid color value")
 
 
-def new_theme_from_hex_color(hex_color: str) -> "CustomTheme":
-    """Create a CustomTheme from a hex color string (e.g., "#00FF00")."""
-    return CustomTheme(hex_color)
+# Rendered through each colorful style to split it into prefix and suffix
+_SENTINEL = "\0"
 
 
 class CustomTheme:
@@ -74,41 +140,103 @@ class CustomTheme:
     >>> theme.color("Test")  # Colored output
     """
 
-    def __init__(self, color_value: str):
+    def __init__(self, color_value: str, depth: ColorDepth | None = None):
         self.color_value = color_value
-        self._color_styler = self._get_color_styler()
-
-    def _get_color_styler(self):
-        if self.color_value.isdigit():
-            code = int(self.color_value)
-            if 0 <= code <= 15:
-                r, g, b = ANSI_16_RGB[code]
-                return _create_rgb_color_style(r, g, b)
-            raise ValueError("Unsupported ANSI code")
-        elif self.color_value.startswith("#"):
-            r = int(self.color_value[1:3], 16)
-            g = int(self.color_value[3:5], 16)
-            b = int(self.color_value[5:7], 16)
-            return _create_rgb_color_style(r, g, b)
-        raise ValueError("Invalid color value")
+        self._rgb = self._get_rgb()
+        self._depth = depth
+
+    def _get_rgb(self) -> tuple[int, int, int]:
+        return _parse_rgb(self.color_value)
+
+    # Returns the SGR codes for the theme's color. Below true color, themes
+    # created from an ANSI code use that code directly, so they follow the
+    # terminal's palette and need no quantization.
+    def _foreground_codes(self) -> list[int]:
+        depth = self._depth or color_depth()
+        if self.color_value.isdigit() and depth != ColorDepth.TRUE_COLOR:
+            return ansi_16_codes(int(self.color_value))
+        return foreground_codes(*self._rgb, depth)
+
+    # Renders each of the five styles through colorful once and splits it
+    # into its prefix and suffix
+    def _styles(self) -> dict[str, CompiledStyle]:
+        cf = _colorful()
+        color = _create_color_style(self._foreground_codes(), self._depth or color_depth())
+        styles = {
+            "bold_color": cf.bold & color,
+            "bold": cf.bold,
+            "color": color,
+            "faint": cf.dimmed,
+            "faint_color": cf.dimmed & color,
+        }
+        return {name: CompiledStyle(*str(style(_SENTINEL)).split(_SENTINEL)) for name, style in styles.items()}
+
+    # The compiled styles are set as instance attributes, which shadow the
+    # methods below, so after the first styled call every call is a single
+    # concatenation. They are built on first use rather than in __init__ so
+    # that defining themes does not import colorful.
+    def _compile_styles(self) -> None:
+        for name, style in self._styles().items():
+            setattr(self, name, style)
 
     def color_value(self) -> str:
         return self.color_value
 
+    def get_color(self) -> str:
+        return self.color_value
+
     def bold_color(self, s: str) -> str:
-        return (cf.bold & self._color_styler)(s)
+        self._compile_styles()
+        return self.bold_color(s)
 
     def bold(self, s: str) -> str:
-        return cf.bold(s)
+        self._compile_styles()
+        return self.bold(s)
 
     def color(self, s: str) -> str:
-        return self._color_styler(s)
+        self._compile_styles()
+        return self.color(s)
 
     def faint(self, s: str) -> str:
-        return cf.dimmed(s)
+        self._compile_styles()
+        return self.faint(s)
 
     def faint_color(self, s: str) -> str:
-        return (cf.dimmed & self._color_styler)(s)
+        self._compile_styles()
+        return self.faint_color(s)
+
+
+# Chains compiled styles the way colorful's & operator does: prefixes in
+# order, then suffixes in the same order
+def _chain(*styles: CompiledStyle) -> CompiledStyle:
+    return CompiledStyle("".join(s.prefix for s in styles), "".join(s.suffix for s in styles))
+
+
+class AnsiTheme(CustomTheme):
+    """Implements Theme with ANSI or hex, writing SGR sequences with theme.ansi instead of colorful.
+
+    Output is byte-identical to CustomTheme.
+
+    >>> theme = AnsiTheme("#00FF00", ColorDepth.TRUE_COLOR)
+    >>> theme.bold_color("Test")
+    '\\x1b[1m\\x1b[38;2;0;255;0mTest\\x1b[22m\\x1b[39m'
+    """
+
+    def __init__(self, color_value: str, depth: ColorDepth | None = None):
+        super().__init__(color_value, depth)
+        self._compile_styles()
+
+    def _styles(self) -> dict[str, CompiledStyle]:
+        bold = compile_style((AnsiCodeEnum.BOLD,))
+        faint = compile_style((AnsiCodeEnum.DIM,))
+        color = compile_style(tuple(self._foreground_codes()))
+        return {
+            "bold_color": _chain(bold, color),
+            "bold": bold,
+            "color": color,
+            "faint": faint,
+            "faint_color": _chain(faint, color),
+        }
 
 
 class PlainTheme:
@@ -138,20 +266,35 @@ class PlainTheme:
         return s
 
 
-# Define the themes
-ANSI_CODE_BLACK_THEME = new_theme_from_ansi_code(ANSI_CODE_BLACK)
-ANSI_CODE_DARK_RED_THEME = new_theme_from_ansi_code(ANSI_CODE_DARK_RED)
-ANSI_CODE_DARK_GREEN_THEME = new_theme_from_ansi_code(ANSI_CODE_DARK_GREEN)
-ANSI_CODE_DARK_YELLOW_THEME = new_theme_from_ansi_code(ANSI_CODE_DARK_YELLOW)
-ANSI_CODE_DARK_BLUE_THEME = new_theme_from_ansi_code(ANSI_CODE_DARK_BLUE)
-ANSI_CODE_DARK_MAGENTA_THEME = new_theme_from_ansi_code(ANSI_CODE_DARK_MAGENTA)
-ANSI_CODE_DARK_CYAN_THEME = new_theme_from_ansi_code(ANSI_CODE_DARK_CYAN)
-ANSI_CODE_LIGHT_GRAY_THEME = new_theme_from_ansi_code(ANSI_CODE_LIGHT_GRAY)
-ANSI_CODE_MEDIUM_GRAY_THEME = new_theme_from_ansi_code(ANSI_CODE_MEDIUM_GRAY)
-ANSI_CODE_BRIGHT_RED_THEME = new_theme_from_ansi_code(ANSI_CODE_BRIGHT_RED)
-ANSI_CODE_BRIGHT_GREEN_THEME = new_theme_from_ansi_code(ANSI_CODE_BRIGHT_GREEN)
-ANSI_CODE_BRIGHT_YELLOW_THEME = new_theme_from_ansi_code(ANSI_CODE_BRIGHT_YELLOW)
-ANSI_CODE_BRIGHT_BLUE_THEME = new_theme_from_ansi_code(ANSI_CODE_BRIGHT_BLUE)
-ANSI_CODE_BRIGHT_MAGENTA_THEME = new_theme_from_ansi_code(ANSI_CODE_BRIGHT_MAGENTA)
-ANSI_CODE_BRIGHT_CYAN_THEME = new_theme_from_ansi_code(ANSI_CODE_BRIGHT_CYAN)
-ANSI_CODE_WHITE_THEME = new_theme_from_ansi_code(ANSI_CODE_WHITE)
+# Theme classes by backend name. THEME_BACKEND selects the one that
+# new_theme_from_ansi_code/new_theme_from_hex_color create; it is read once,
+# when this module is imported.
+THEME_BACKENDS: dict[str, type[CustomTheme]] = {"colorful": CustomTheme, "ansi": AnsiTheme}
+
+
+def _backend_from_env() -> type[CustomTheme]:
+    name = os.environ.get("THEME_BACKEND", "colorful")
+    if name not in THEME_BACKENDS:
+        raise ValueError(f"Unknown THEME_BACKEND {name!r}, expected one of {', '.join(THEME_BACKENDS)}")
+    return THEME_BACKENDS[name]
+
+
+_BACKEND = _backend_from_env()
+_PLAIN_THEME = PlainTheme()
+
+# The ANSI_CODE_*_THEME themes are created on first access, by __getattr__
+# below, so importing this module does not probe the terminal
+ANSI_CODE_THEMES = {f"{name}_THEME": code for name, code in globals().items() if name.startswith("ANSI_CODE_")}
+
+
+def __getattr__(name: str) -> "CustomTheme | PlainTheme":
+    if name not in ANSI_CODE_THEMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Stored as a module global, so later lookups do not come back here
+    theme = globals()[name] = new_theme_from_ansi_code(ANSI_CODE_THEMES[name])
+    return theme
+
+
+def default_theme(theme: "CustomTheme | PlainTheme", stream: TextIO | None = None) -> "CustomTheme | PlainTheme":
+    """Returns theme when colors are enabled for stream, PlainTheme otherwise."""
+    return theme if colors_enabled(stream) else _PLAIN_THEME
@@ -0,0 +1,88 @@
+"""Stripping escape sequences and measuring the display width of styled text.
+
+Both functions make a single linear pass over the string, so they stay fast on
+multi-megabyte captured logs:
+
+>>> styled = compile_style((AnsiCodeEnum.BOLD,))("漢字 ok")
+>>> strip_ansi(styled)
+'漢字 ok'
+>>> visible_width(styled)
+7
+"""
+
+import re
+import unicodedata
+from functools import cache, lru_cache
+
+from theme.ansi import AnsiCodeEnum, compile_style  # noqa: F401 (used by the doctest)
+
+# Escape sequences. Every alternative starts with a different character and
+# every repetition is possessive, so the scan never backtracks.
+#
+# - CSI sequences (ESC [ parameters intermediates final), which include SGR
+# - OSC sequences (ESC ] ... BEL), e.g. hyperlinks. An OSC terminated by
+#   ESC \ stops at the ESC, and the ESC \ is matched as a two-character escape.
+# - Other two-character escapes (ESC + one character)
+#
+# A sequence cut off at the end of the text is matched as far as it goes.
+_ESCAPE_SEQUENCE = re.compile(
+    r"""
+    \x1b (?:
+        \[ [0-?]*+ [ -/]*+ [@-~]?
+      | \] [^\x07\x1b]*+ \x07?
+      | .?
+    )
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Characters that are not printable ASCII, i.e. whose width is not 1
+_SPECIAL_CHARS = re.compile(r"[^ -~]+")
+
+# Strings longer than this are processed directly instead of through the LRU
+# caches, so large captured logs are not kept alive by the cache
+_CACHE_MAX_LEN = 256
+
+
+def _strip_ansi(text: str) -> str:
+    if "\x1b" not in text:
+        return text
+    return _ESCAPE_SEQUENCE.sub("", text)
+
+
+# Returns the number of terminal columns a character takes: 0 for control,
+# combining and format characters, 2 for East Asian wide and fullwidth
+# characters and 1 otherwise
+@cache
+def _char_width(char: str) -> int:
+    if unicodedata.category(char) in ("Cc", "Cf", "Mn", "Me"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+def _visible_width(text: str) -> int:
+    plain = _strip_ansi(text)
+    if plain.isascii() and plain.isprintable():
+        return len(plain)
+    special = "".join(_SPECIAL_CHARS.findall(plain))
+    return len(plain) - len(special) + sum(map(_char_width, special))
+
+
+_strip_ansi_cached = lru_cache(maxsize=4096)(_strip_ansi)
+_visible_width_cached = lru_cache(maxsize=4096)(_visible_width)
+
+
+def strip_ansi(text: str) -> str:
+    """Returns text without ANSI escape sequences."""
+    if len(text) > _CACHE_MAX_LEN:
+        return _strip_ansi(text)
+    return _strip_ansi_cached(text)
+
+
+def visible_width(text: str) -> int:
+    """Returns the number of terminal columns text takes once escape sequences are removed."""
+    if len(text) > _CACHE_MAX_LEN:
+        return _visible_width(text)
+    return _visible_width_cached(text)
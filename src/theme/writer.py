@@ -0,0 +1,109 @@
+"""Buffered writer for styled terminal output.
+
+`StyledWriter` collects (style, text) spans and writes them to the underlying
+file descriptor in one large write on `flush`, instead of one write (and
+flush) per `print`. Adjacent spans that share a style are merged: the style is
+switched on once and off once, with no reset/re-enable pair between them.
+
+>>> from theme.ansi import AnsiCodeEnum
+>>> out = StyledWriter(io.StringIO())
+>>> bold = compile_style((AnsiCodeEnum.BOLD,))
+>>> out.write(bold, "a").write(bold, "b").write(None, "c").getvalue()
+'\\x1b[1mab\\x1b[22mc'
+"""
+
+import io
+import os
+import sys
+from typing import Sequence, TextIO
+
+from theme.ansi import CompiledStyle, compile_style
+
+# Buffered text size that triggers an automatic flush
+DEFAULT_FLUSH_THRESHOLD = 1 << 16
+
+
+class StyledWriter:
+    """Accumulates styled spans and flushes them in a single write.
+
+    Args:
+        file: Text stream to write to (default: sys.stdout). When it has a
+            file descriptor, output goes straight to it with os.write.
+        styled: When False, styles are ignored and only the text is written.
+        flush_threshold: Flush automatically once this many characters are
+            buffered.
+    """
+
+    def __init__(
+        self,
+        file: TextIO | None = None,
+        styled: bool = True,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+    ) -> None:
+        self._file = file or sys.stdout
+        self._styled = styled
+        self._flush_threshold = flush_threshold
+        self._parts: list[str] = []  # Reused between flushes
+        self._size = 0
+        self._open: CompiledStyle | None = None  # Style currently switched on
+
+    def write(self, style: CompiledStyle | Sequence[int] | None, text: str) -> "StyledWriter":
+        """Buffers text in style (a compiled style, ANSI codes, or None for plain)."""
+        if not text:
+            return self
+        if self._styled:
+            if style is not None and not isinstance(style, CompiledStyle):
+                style = compile_style(tuple(style))
+            if style is not None and not style.prefix:
+                style = None
+            if style != self._open:
+                if self._open is not None:
+                    self._parts.append(self._open.suffix)
+                if style is not None:
+                    self._parts.append(style.prefix)
+                self._open = style
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._flush_threshold:
+            self.flush()
+        return self
+
+    def writeln(self, style: CompiledStyle | Sequence[int] | None = None, text: str = "") -> "StyledWriter":
+        """Buffers text in style followed by an unstyled newline."""
+        return self.write(style, text).write(None, "\n")
+
+    def getvalue(self) -> str:
+        """Returns the buffered output, with any open style closed, without writing it."""
+        suffix = self._open.suffix if self._open is not None else ""
+        return "".join(self._parts) + suffix
+
+    def flush(self) -> None:
+        """Writes everything buffered in one write and closes any open style."""
+        if self._open is not None:
+            self._parts.append(self._open.suffix)
+            self._open = None
+        if not self._parts:
+            return
+        data = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+
+        try:
+            fd = self._file.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            self._file.write(data)
+            self._file.flush()
+            return
+
+        # Keep ordering with anything already written through the stream
+        self._file.flush()
+        buffer = memoryview(data.encode(getattr(self._file, "encoding", None) or "utf-8"))
+        while buffer:
+            written = os.write(fd, buffer)
+            buffer = buffer[written:]
+
+    def __enter__(self) -> "StyledWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
@@ -1,38 +1,62 @@
-import colorful as cf
+from functools import cache
 
+from theme import colors_enabled
+from theme.ansi import AnsiCodeEnum, CompiledStyle, compile_style
+from theme.color import color_depth, foreground_codes
+from theme.writer import StyledWriter
+from tic_tac_toe.bitboard import Position
 
-def print_board() -> None:
-    # --- Styles ---
-    X = cf.bold
-    O = cf.bold
-    empty = cf.gray
-    grid_line = cf.gray
-    number = cf.gray
+# --- Styles ---
+BOLD = compile_style((AnsiCodeEnum.BOLD,))
+ITALIC = compile_style((AnsiCodeEnum.ITALIC,))
 
-    # --- Static board ---
-    board = [["X", " ", "O"], [" ", "X", " "], ["O", " ", "X"]]
+
+@cache
+def gray() -> CompiledStyle:
+    """Returns the gray style, at the terminal's color depth (detected on first call)."""
+    return compile_style(tuple(foreground_codes(190, 190, 190, color_depth())))
+
+
+# Shown by main until the game can be played: X.O .X. O.X
+EXAMPLE = Position(0b100_010_001, 0b001_000_100)
+
+
+def print_board(out: StyledWriter | None = None, position: Position = EXAMPLE) -> None:
+    out = out or StyledWriter(styled=colors_enabled())
+    X = BOLD
+    O = BOLD
+    empty = gray()
+    grid_line = empty
+    number = empty
 
     # --- Header ---
-    print("\n" + cf.bold("   TIC TAC TOE   ") + "\n")
+    out.writeln()
+    out.writeln(BOLD, "   TIC TAC TOE   ")
+    out.writeln()
 
     # --- Rows ---
-    for i, row in enumerate(board):
-        cells = []
-        for j, cell in enumerate(row):
-            if cell == "X":
-                cells.append(str(X(" X ")))
-            elif cell == "O":
-                cells.append(str(O(" O ")))
+    for i in range(3):
+        for j in range(3):
+            if j > 0:
+                out.write(grid_line, "│")
+            bit = 1 << (i * 3 + j)
+            if position.x & bit:
+                out.write(X, " X ")
+            elif position.o & bit:
+                out.write(O, " O ")
             else:
                 pos = i * 3 + j + 1
-                cells.append(str(number(f" {pos} ")))
-        print(str(grid_line("│")).join(cells))
+                out.write(number, f" {pos} ")
+        out.writeln()
 
         if i < 2:
-            print(str(grid_line("───┼───┼───")))
+            out.writeln(grid_line, "───┼───┼───")
 
     # --- Footer ---
-    print("\n" + cf.italic("Use numbers 1–9 to place your mark.") + "\n")
+    out.writeln()
+    out.writeln(ITALIC, "Use numbers 1–9 to place your mark.")
+    out.writeln()
+    out.flush()
 
 
 def main() -> None:
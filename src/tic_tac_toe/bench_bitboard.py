@@ -0,0 +1,56 @@
+"""Benchmark: perfect-play games from the bitboard table versus searching every move.
+
+Run from src/:
+
+    python -m tic_tac_toe.bench_bitboard
+"""
+
+import random
+import time
+from typing import Callable
+
+from tic_tac_toe.bitboard import EMPTY, Position, _table, best_move
+
+GAMES = 20_000
+
+
+# Perfect play by plain minimax from scratch on every move
+def _search_move(position: Position) -> int:
+    def value(position: Position) -> int:
+        if position.winner() is not None:
+            return -1
+        moves = position.moves()
+        if not moves:
+            return 0
+        return max(-value(position.play(square)) for square in moves)
+
+    return max(position.moves(), key=lambda square: -value(position.play(square)))
+
+
+def _play(choose: Callable[[Position], int]) -> None:
+    position = EMPTY
+    while not position.is_over():
+        position = position.play(choose(position))
+
+
+def _time(label: str, choose: Callable[[Position], int], games: int) -> None:
+    start = time.perf_counter()
+    for _ in range(games):
+        _play(choose)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} {elapsed / games * 1e6:>12,.1f} µs/game {games / elapsed:>12,.0f} games/s")
+
+
+def main() -> None:
+    start = time.perf_counter()
+    _table()
+    print(f"{'solve table':<22} {(time.perf_counter() - start) * 1e3:>12,.1f} ms")
+
+    rng = random.Random(0)
+    _time("minimax each move", _search_move, 3)
+    _time("table lookup", best_move, GAMES)
+    _time("table lookup, random", lambda position: best_move(position, rng), GAMES)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark: m,n,k search speed, and incremental threat scores versus rescanning.
+
+Run from src/:
+
+    python -m tic_tac_toe.bench_mnk
+"""
+
+import random
+import time
+
+from tic_tac_toe.mnk import Board, Engine
+
+N = 20_000
+
+
+def _bench_scoring() -> None:
+    board = Board(15, 15, 5)
+    rng = random.Random(0)
+    for cell in rng.sample(range(225), 40):
+        board.play(cell)
+    cell = board.moves()[0]
+    scores: list[int] = []
+    rescored: list[int] = []
+
+    start = time.perf_counter()
+    for _ in range(N):
+        board.play(cell)
+        scores.append(board.score)
+        board.undo()
+    incremental = (time.perf_counter() - start) / N
+    start = time.perf_counter()
+    for _ in range(N):
+        board.play(cell)
+        rescored.append(board.rescore())
+        board.undo()
+    rescan = (time.perf_counter() - start) / N
+    assert scores == rescored
+    print(f"{'play+score+undo':<28} {incremental * 1e6:>8.2f} µs incremental {rescan * 1e6:>8.2f} µs rescanned")
+
+
+def _bench_search(label: str, board: Board, **limits: float) -> None:
+    result = Engine().search(board, **limits)
+    print(
+        f"{label:<28} depth {result.depth:>2} {result.seconds:>6.2f} s {result.nodes:>9,} nodes "
+        f"{result.nodes_per_second:>9,.0f} nodes/s  TT hit rate {result.tt_hit_rate:>6.1%}"
+    )
+
+
+def main() -> None:
+    _bench_scoring()
+    _bench_search("3x3, k=3 (solved)", Board(3, 3, 3, radius=2))
+    _bench_search("7x7, k=4, 1 s", Board(7, 7, 4), time_limit=1.0)
+    board = Board(15, 15, 5)
+    for cell in (112, 113, 97, 128):
+        board.play(cell)
+    _bench_search("15x15, k=5, 2 s", board, time_limit=2.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Tic-tac-toe positions as two 9-bit masks, with a perfect-play table.
+
+Squares are numbered 0-8 row by row, and square i is bit i of a mask:
+
+     0 │ 1 │ 2
+    ───┼───┼───
+     3 │ 4 │ 5
+    ───┼───┼───
+     6 │ 7 │ 8
+
+X always moves first, so the side to move follows from the number of marks.
+Every one of the 5478 positions reachable from the empty board is solved once,
+on first use, into a flat table indexed by `x | o << 9`. After that, looking
+up the value of a position and its best moves is a single array index:
+
+>>> position = Position.from_string("XX. OO. ...")
+>>> solve(position)
+Solution(value=1, moves=(2,))
+"""
+
+import random
+from array import array
+from enum import IntEnum
+from functools import cache
+from typing import NamedTuple, Optional
+
+FULL = 0x1FF
+
+# fmt: off
+LINES = (
+    0b000_000_111, 0b000_111_000, 0b111_000_000,  # Rows
+    0b001_001_001, 0b010_010_010, 0b100_100_100,  # Columns
+    0b100_010_001, 0b001_010_100,                 # Diagonals
+)
+# fmt: on
+
+
+# The per-mask tables below are built by walking only the masks each step
+# changes, in about 0.1 ms, so importing this module stays cheap. They are
+# module globals rather than lazily built because every move reads them.
+def _has_line_table() -> bytes:
+    # Marks every superset of each line: the line plus each subset of the other squares
+    table = bytearray(FULL + 1)
+    for line in LINES:
+        rest = subset = FULL & ~line
+        while True:
+            table[line | subset] = 1
+            if not subset:
+                break
+            subset = (subset - 1) & rest
+    return bytes(table)
+
+
+def _squares_table() -> tuple[tuple[int, ...], ...]:
+    # Masks with square set are the masks without it, plus 1 << square
+    table = [()]
+    for square in range(9):
+        table += [squares + (square,) for squares in table]
+    return tuple(table)
+
+
+# _HAS_LINE[mask] is 1 when the marks in mask complete a line
+_HAS_LINE = _has_line_table()
+
+# _SQUARES[mask] lists the squares set in mask, in order
+_SQUARES = _squares_table()
+
+# Positions that cannot be reached from the empty board have no table entry
+_UNREACHABLE = 0
+
+
+class Mark(IntEnum):
+    X = 0
+    O = 1
+
+
+class Solution(NamedTuple):
+    value: int  # 1 if the side to move wins with perfect play, 0 for a draw, -1 if it loses
+    moves: tuple[int, ...]  # Squares that keep that value; empty once the game is over
+
+
+class Position(NamedTuple):
+    x: int = 0  # Mask of squares marked X
+    o: int = 0  # Mask of squares marked O
+
+    @classmethod
+    def from_string(cls, text: str) -> "Position":
+        """Parses 9 cells of X, O, '.' or '-' (empty), ignoring whitespace."""
+        cells = "".join(text.split())
+        if len(cells) != 9 or not set(cells) <= set("XO.-"):
+            raise ValueError(f"Invalid position: {text!r}")
+        x = sum(1 << i for i, cell in enumerate(cells) if cell == "X")
+        o = sum(1 << i for i, cell in enumerate(cells) if cell == "O")
+        return cls(x, o)
+
+    def __str__(self) -> str:
+        return "".join("X" if self.x >> i & 1 else "O" if self.o >> i & 1 else "." for i in range(9))
+
+    @property
+    def key(self) -> int:
+        """Returns the 18-bit index of this position in the solution table."""
+        return self.x | self.o << 9
+
+    @property
+    def to_move(self) -> Mark:
+        return Mark.X if self.x.bit_count() == self.o.bit_count() else Mark.O
+
+    def winner(self) -> Optional[Mark]:
+        if _HAS_LINE[self.x]:
+            return Mark.X
+        if _HAS_LINE[self.o]:
+            return Mark.O
+        return None
+
+    def is_over(self) -> bool:
+        return bool(_HAS_LINE[self.x] or _HAS_LINE[self.o]) or self.x | self.o == FULL
+
+    def moves(self) -> tuple[int, ...]:
+        """Returns the empty squares, or none once the game is over."""
+        if self.is_over():
+            return ()
+        return _SQUARES[FULL & ~(self.x | self.o)]
+
+    def play(self, square: int) -> "Position":
+        """Returns the position after the side to move marks square."""
+        x, o = self
+        # A full board has no empty square, so only wins need checking
+        if not 0 <= square < 9 or (x | o) >> square & 1 or _HAS_LINE[x] or _HAS_LINE[o]:
+            raise ValueError(f"Illegal move: {square}")
+        if x.bit_count() == o.bit_count():
+            return _new_position(Position, (x | 1 << square, o))
+        return _new_position(Position, (x, o | 1 << square))
+
+
+EMPTY = Position()
+
+# Skips NamedTuple's keyword-handling __new__ on the hot path
+_new_position = tuple.__new__
+
+
+# Each entry packs (value + 2) << 9 | mask of best moves, so reachable
+# positions are never 0 (_UNREACHABLE)
+@cache
+def _table() -> array:
+    table = array("H", bytes(2 << 18))
+
+    def search(x: int, o: int) -> int:
+        key = x | o << 9
+        entry = table[key]
+        if entry:
+            return (entry >> 9) - 2
+
+        x_to_move = x.bit_count() == o.bit_count()
+        if _HAS_LINE[o if x_to_move else x]:
+            value, best = -1, 0  # The side that just moved won
+        elif x | o == FULL:
+            value, best = 0, 0
+        else:
+            value, best = -2, 0
+            for square in _SQUARES[FULL & ~(x | o)]:
+                bit = 1 << square
+                score = -(search(x | bit, o) if x_to_move else search(x, o | bit))
+                if score > value:
+                    value, best = score, bit
+                elif score == value:
+                    best |= bit
+        table[key] = (value + 2) << 9 | best
+        return value
+
+    search(0, 0)
+    return table
+
+
+def solve(position: Position) -> Solution:
+    """Returns the perfect-play value of a reachable position for the side to move, and its best moves."""
+    entry = _table()[position.x | position.o << 9]
+    if entry == _UNREACHABLE:
+        raise ValueError(f"Unreachable position: {position}")
+    return Solution((entry >> 9) - 2, _SQUARES[entry & FULL])
+
+
+def best_move(position: Position, rng: Optional[random.Random] = None) -> int:
+    """Returns a best move for the side to move, the lowest-numbered one unless rng picks among them."""
+    entry = _table()[position.x | position.o << 9]
+    if entry == _UNREACHABLE:
+        raise ValueError(f"Unreachable position: {position}")
+    moves = _SQUARES[entry & FULL]
+    if not moves:
+        raise ValueError(f"Game is over: {position}")
+    return rng.choice(moves) if rng else moves[0]
+
+
+def reachable_positions() -> int:
+    """Returns the number of positions in the solution table."""
+    table = _table()
+    return len(table) - table.count(_UNREACHABLE)
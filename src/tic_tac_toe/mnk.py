@@ -0,0 +1,436 @@
+"""Generalized m,n,k tic-tac-toe with an alpha-beta search engine.
+
+A `Board` is width x height, and k marks in a row (across, down or
+diagonally) win: 3,3,3 is tic-tac-toe, 7,7,4 connect-four-like, and 15,15,5
+gomoku. Cells are numbered row by row, `cell = row * width + column`, and X
+always moves first.
+
+The board keeps everything the search needs up to date on every play and
+undo, so nothing is rescanned from scratch:
+
+- the Zobrist hash of the position,
+- the number of X and O marks in every window of k cells, from which the
+  winner and the threat score (windows only one side can still complete,
+  weighted by how full they are) follow,
+- the empty cells next to a mark, which are the moves worth searching.
+
+`Engine.search` runs iterative deepening alpha-beta over those moves, with
+a fixed-size transposition table and the history heuristic for move ordering:
+
+>>> board = Board(7, 7, 4)
+>>> for cell in (24, 0, 25, 1, 26):
+...     board.play(cell)
+>>> result = Engine().search(board, max_depth=4)
+>>> result.move in (23, 27)  # Block the open three
+True
+"""
+
+import random
+import time
+from functools import cache
+from typing import NamedTuple, Optional
+
+from tic_tac_toe.bitboard import Mark
+
+# Scores beyond WIN_BOUND mean a forced win or loss, WIN - plies away
+WIN = 1 << 30
+WIN_BOUND = WIN - (1 << 16)
+_INFINITY = WIN + 1
+
+# Transposition table bound types
+EXACT = 0
+LOWER = 1  # The value is at least this (a beta cutoff)
+UPPER = 2  # The value is at most this (no move raised alpha)
+
+# Check the clock every this many nodes
+_CLOCK_INTERVAL = 1024
+
+_EMPTY = 0  # Cell contents are _EMPTY or Mark + 1
+
+
+class _Geometry(NamedTuple):
+    windows: int  # Number of windows of k cells
+    windows_of: tuple[tuple[int, ...], ...]  # Windows through each cell
+    neighbors: tuple[tuple[int, ...], ...]  # Cells within the search radius of each cell
+    weights: tuple[int, ...]  # Threat score of a window holding n marks of one side only
+
+
+@cache
+def _geometry(width: int, height: int, k: int, radius: int) -> _Geometry:
+    windows_of: list[list[int]] = [[] for _ in range(width * height)]
+    windows = 0
+    for row in range(height):
+        for column in range(width):
+            for dx, dy in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                end_column, end_row = column + dx * (k - 1), row + dy * (k - 1)
+                if not (0 <= end_column < width and 0 <= end_row < height):
+                    continue
+                for i in range(k):
+                    windows_of[(row + dy * i) * width + column + dx * i].append(windows)
+                windows += 1
+
+    neighbors = tuple(
+        tuple(
+            y * width + x
+            for y in range(max(0, row - radius), min(height, row + radius + 1))
+            for x in range(max(0, column - radius), min(width, column + radius + 1))
+            if (x, y) != (column, row)
+        )
+        for row in range(height)
+        for column in range(width)
+    )
+    # Each extra mark in an open window is worth 8 times as much
+    weights = (0,) + tuple(8 ** (n - 1) for n in range(1, k + 1))
+    return _Geometry(windows, tuple(map(tuple, windows_of)), neighbors, weights)
+
+
+# The same keys for every board of a geometry, so hashes are reproducible.
+# Boards that differ in any parameter get different keys, so an engine reused
+# on another board never reads the old board's table entries.
+@cache
+def _zobrist_keys(width: int, height: int, k: int, radius: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    cells = width * height
+    rng = random.Random(f"{width}x{height}:{k}:{radius}")
+    return tuple(rng.getrandbits(64) for _ in range(cells)), tuple(rng.getrandbits(64) for _ in range(cells))
+
+
+class Board:
+    """A width x height board where k marks in a row win.
+
+    Args:
+        width, height: Size of the board.
+        k: Number of marks in a row that wins.
+        radius: Only empty cells within this distance of a mark are searched.
+    """
+
+    def __init__(self, width: int = 3, height: int = 3, k: int = 3, radius: int = 1):
+        if width < 1 or height < 1 or not 1 <= k <= max(width, height) or radius < 1:
+            raise ValueError(f"Invalid board: {width}x{height}, k={k}, radius={radius}")
+        self.width = width
+        self.height = height
+        self.k = k
+        geometry = _geometry(width, height, k, radius)
+        self._windows_of = geometry.windows_of
+        self._neighbors = geometry.neighbors
+        self._weights = geometry.weights
+        self._keys = _zobrist_keys(width, height, k, radius)
+        self.cells = bytearray(width * height)
+        # Marks of each side in every window, indexed by Mark
+        self._counts = ([0] * geometry.windows, [0] * geometry.windows)
+        # Number of marks near each cell, and the empty cells with any
+        self._near = [0] * (width * height)
+        self._candidates: set[int] = set()
+        self._history: list[tuple[int, int]] = []  # (cell, score change) per move
+        self.hash = 0
+        self.score = 0  # Threat score from X's point of view
+        self.winner: Optional[Mark] = None
+
+    def __str__(self) -> str:
+        marks = ".XO"
+        return "\n".join(
+            "".join(marks[cell] for cell in self.cells[row * self.width : (row + 1) * self.width])
+            for row in range(self.height)
+        )
+
+    @property
+    def to_move(self) -> Mark:
+        return Mark(len(self._history) & 1)
+
+    @property
+    def history(self) -> list[int]:
+        """Returns the cells played so far, in order."""
+        return [cell for cell, _ in self._history]
+
+    def is_full(self) -> bool:
+        return len(self._history) == len(self.cells)
+
+    def is_over(self) -> bool:
+        return self.winner is not None or self.is_full()
+
+    def moves(self) -> list[int]:
+        """Returns every empty cell, or none once the game is over."""
+        if self.is_over():
+            return []
+        return [cell for cell, mark in enumerate(self.cells) if mark == _EMPTY]
+
+    def candidates(self) -> list[int]:
+        """Returns the empty cells next to a mark (the center on an empty board), or none once the game is over."""
+        if self.is_over():
+            return []
+        if not self._history:
+            return [self.height // 2 * self.width + self.width // 2]
+        return list(self._candidates)
+
+    def play(self, cell: int) -> None:
+        """Marks cell for the side to move."""
+        if not 0 <= cell < len(self.cells) or self.cells[cell] != _EMPTY or self.winner is not None:
+            raise ValueError(f"Illegal move: {cell}")
+        side = len(self._history) & 1
+        mine, theirs = self._counts[side], self._counts[side ^ 1]
+        weights = self._weights
+        k = self.k
+        change = 0  # From the mover's point of view
+        for window in self._windows_of[cell]:
+            count = mine[window]
+            if theirs[window] == 0:
+                change += weights[count + 1] - weights[count]
+                if count + 1 == k:
+                    self.winner = Mark(side)
+            elif count == 0:
+                change += weights[theirs[window]]  # The opponent can no longer complete this window
+            mine[window] = count + 1
+        if side:
+            change = -change
+
+        self.cells[cell] = side + 1
+        self.hash ^= self._keys[side][cell]
+        self.score += change
+        self._history.append((cell, change))
+        near = self._near
+        candidates = self._candidates
+        candidates.discard(cell)
+        for neighbor in self._neighbors[cell]:
+            near[neighbor] += 1
+            if self.cells[neighbor] == _EMPTY:
+                candidates.add(neighbor)
+
+    def undo(self) -> None:
+        """Takes back the last move."""
+        cell, change = self._history.pop()
+        side = len(self._history) & 1
+        mine = self._counts[side]
+        for window in self._windows_of[cell]:
+            mine[window] -= 1
+
+        self.cells[cell] = _EMPTY
+        self.hash ^= self._keys[side][cell]
+        self.score -= change
+        self.winner = None  # No move is played after a win
+        near = self._near
+        candidates = self._candidates
+        for neighbor in self._neighbors[cell]:
+            near[neighbor] -= 1
+            if not near[neighbor]:
+                candidates.discard(neighbor)
+        if near[cell]:
+            candidates.add(cell)
+
+    def rescore(self) -> int:
+        """Returns the threat score from X's point of view, computed from scratch."""
+        x_counts, o_counts = self._counts[Mark.X], self._counts[Mark.O]
+        score = 0
+        for x, o in zip(x_counts, o_counts):
+            if not o:
+                score += self._weights[x]
+            elif not x:
+                score -= self._weights[o]
+        return score
+
+
+class TranspositionTable:
+    """Search results by Zobrist hash, in a fixed number of slots.
+
+    Each hash maps to one slot, by its low bits. A slot keeps the deeper of
+    two entries from the same search, but entries left over from earlier
+    searches are always replaced, so the table never grows or goes stale.
+
+    Args:
+        bits: The table has 2**bits slots.
+    """
+
+    def __init__(self, bits: int = 18):
+        self._mask = (1 << bits) - 1
+        # Slots hold (hash, depth, value, bound, move, generation) tuples
+        self._slots: list[Optional[tuple[int, int, int, int, int, int]]] = [None] * (1 << bits)
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._slots) - self._slots.count(None)
+
+    def new_search(self) -> None:
+        """Marks existing entries as replaceable and resets the hit counters."""
+        self.generation += 1
+        self.probes = self.hits = 0
+
+    def probe(self, key: int) -> Optional[tuple[int, int, int, int, int, int]]:
+        self.probes += 1
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, value: int, bound: int, move: int) -> None:
+        index = key & self._mask
+        old = self._slots[index]
+        if old is None or old[0] == key or old[5] != self.generation or depth >= old[1]:
+            self._slots[index] = (key, depth, value, bound, move, self.generation)
+
+
+class SearchResult(NamedTuple):
+    move: int
+    score: int  # From the point of view of the side to move
+    depth: int  # Deepest iteration completed
+    nodes: int
+    seconds: float
+    tt_probes: int
+    tt_hits: int
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    @property
+    def tt_hit_rate(self) -> float:
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+
+class _Timeout(Exception):
+    pass
+
+
+class Engine:
+    """Iterative deepening alpha-beta search, keeping its transposition table between moves.
+
+    Args:
+        table_bits: The transposition table has 2**table_bits slots.
+    """
+
+    def __init__(self, table_bits: int = 18):
+        self.table = TranspositionTable(table_bits)
+        self._board = Board()
+        self._order: list[int] = []  # History heuristic score per cell
+        self._nodes = 0
+        self._deadline: Optional[float] = None
+
+    def search(self, board: Board, max_depth: Optional[int] = None, time_limit: Optional[float] = None) -> SearchResult:
+        """Returns the best move for the side to move.
+
+        Searches one ply deeper at a time until max_depth (default: the rest
+        of the game), a forced win or loss is found, or time_limit seconds
+        have passed. On timeout, the move from the deepest completed
+        iteration is returned, and board is left as it was.
+        """
+        moves = board.candidates()
+        if not moves:
+            raise ValueError("Game is over")
+        start = time.perf_counter()
+        self._board = board
+        self._order = [0] * len(board.cells)
+        self._nodes = 0
+        self._deadline = start + time_limit if time_limit is not None else None
+        self.table.new_search()
+        played = len(board.history)
+        if max_depth is None:
+            max_depth = len(board.cells) - played
+
+        best_move, best_score, completed = moves[0], 0, 0
+        for depth in range(1, max_depth + 1):
+            # Search the previous best move first
+            moves.sort(key=lambda move: move != best_move)
+            try:
+                score, move = self._root(moves, depth)
+            except _Timeout:
+                while len(board.history) > played:
+                    board.undo()
+                break
+            best_move, best_score, completed = move, score, depth
+            if abs(score) >= WIN_BOUND:
+                break
+
+        return SearchResult(
+            best_move,
+            best_score,
+            completed,
+            self._nodes,
+            time.perf_counter() - start,
+            self.table.probes,
+            self.table.hits,
+        )
+
+    def _root(self, moves: list[int], depth: int) -> tuple[int, int]:
+        board = self._board
+        alpha, best_move = -_INFINITY, moves[0]
+        for move in moves:
+            board.play(move)
+            value = -self._negamax(depth - 1, -_INFINITY, -alpha, 1)
+            board.undo()
+            if value > alpha:
+                alpha, best_move = value, move
+        return alpha, best_move
+
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        self._nodes += 1
+        if self._deadline is not None and not self._nodes % _CLOCK_INTERVAL and time.perf_counter() > self._deadline:
+            raise _Timeout
+        board = self._board
+        if board.winner is not None:
+            return ply - WIN  # The previous move won
+        if board.is_full():
+            return 0
+        if depth == 0:
+            return -board.score if len(board._history) & 1 else board.score
+
+        key = board.hash
+        original_alpha = alpha
+        entry = self.table.probe(key)
+        table_move = -1
+        if entry is not None:
+            _, entry_depth, value, bound, table_move, _ = entry
+            if entry_depth >= depth:
+                value = _from_table(value, ply)
+                if bound == EXACT:
+                    return value
+                if bound == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        moves = sorted(board._candidates, key=self._order.__getitem__, reverse=True)
+        if table_move in board._candidates:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+
+        best_value, best_move = -_INFINITY, moves[0]
+        for move in moves:
+            board.play(move)
+            value = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            board.undo()
+            if value > best_value:
+                best_value, best_move = value, move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        self._order[move] += depth * depth
+                        break
+
+        if best_value <= original_alpha:
+            bound = UPPER
+        elif best_value >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table.store(key, depth, _to_table(best_value, ply), bound, best_move)
+        return best_value
+
+
+# Win and loss scores count plies from the root, but the table is shared
+# between nodes at different plies, so it stores them counted from the node
+def _to_table(value: int, ply: int) -> int:
+    if value >= WIN_BOUND:
+        return value + ply
+    if value <= -WIN_BOUND:
+        return value - ply
+    return value
+
+
+def _from_table(value: int, ply: int) -> int:
+    if value >= WIN_BOUND:
+        return value - ply
+    if value <= -WIN_BOUND:
+        return value + ply
+    return value
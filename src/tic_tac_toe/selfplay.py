@@ -0,0 +1,221 @@
+"""Headless tic-tac-toe: many games between strategies, with no board output.
+
+    tic_tac_toe_selfplay --games 1000000 --x table --o random --workers 0
+    tic_tac_toe_selfplay --tournament --games 10000
+
+A strategy is a function from a position and a random generator to a square.
+Games are split into fixed-size chunks, and chunk i draws its random numbers
+from a generator seeded with (seed, i). Chunks do not depend on each other and
+their tallies are summed, so results depend only on the strategies, the number
+of games and the seed, never on the number of workers.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from typing import Callable, Iterable, NamedTuple, Optional, Sequence, TextIO
+
+from tic_tac_toe.bitboard import EMPTY, Mark, Position, best_move
+from tic_tac_toe.mnk import Board, Engine
+
+# Strategies must be picklable (module-level functions or instances) to run in workers
+type Strategy = Callable[[Position, random.Random], int]
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def random_move(position: Position, rng: random.Random) -> int:
+    """Plays any empty square."""
+    return rng.choice(position.moves())
+
+
+def table_move(position: Position, rng: random.Random) -> int:
+    """Plays perfectly from the precomputed table, choosing among equally good moves at random."""
+    return best_move(position, rng)
+
+
+# The search is deterministic, so each position is searched once per process
+@cache
+def _search_move(x: int, o: int, depth: Optional[int]) -> int:
+    board = Board(3, 3, 3, radius=2)
+    # The order marks are placed in does not matter, only that they alternate
+    x_squares = [square for square in range(9) if x >> square & 1]
+    o_squares = [square for square in range(9) if o >> square & 1]
+    for square in itertools.chain.from_iterable(itertools.zip_longest(x_squares, o_squares)):
+        if square is not None:
+            board.play(square)
+    return Engine(table_bits=10).search(board, max_depth=depth).move
+
+
+class SearchStrategy:
+    """Plays the m,n,k engine's move, searching depth plies (default: to the end of the game).
+
+    Each position is searched by a fresh engine, so a move never depends on
+    the games played before it, and the move is remembered for the rest of
+    the process.
+    """
+
+    def __init__(self, depth: Optional[int] = None):
+        self.depth = depth
+
+    def __call__(self, position: Position, rng: random.Random) -> int:
+        return _search_move(position.x, position.o, self.depth)
+
+
+STRATEGIES: dict[str, Strategy] = {
+    "random": random_move,
+    "table": table_move,
+    "search": SearchStrategy(),
+}
+
+
+class Tally(NamedTuple):
+    x_wins: int = 0
+    o_wins: int = 0
+    draws: int = 0
+
+    @property
+    def games(self) -> int:
+        return self.x_wins + self.o_wins + self.draws
+
+
+def sum_tallies(tallies: Iterable[Tally]) -> Tally:
+    return Tally(*map(sum, zip(Tally(), *tallies)))
+
+
+def play_game(x: Strategy, o: Strategy, rng: random.Random) -> Optional[Mark]:
+    """Plays one game and returns the winner, or None for a draw."""
+    position = EMPTY
+    players = (x, o)
+    turn = 0
+    while not position.is_over():
+        position = position.play(players[turn](position, rng))
+        turn ^= 1
+    return position.winner()
+
+
+def _play_chunk(x: Strategy, o: Strategy, seed: int, chunk: int, games: int) -> Tally:
+    """Worker: plays games with the generator for chunk, and tallies the results."""
+    # String seeds are hashed with SHA-512, so they are the same in every process
+    rng = random.Random(f"{seed}:{chunk}")
+    x_wins = o_wins = 0
+    for _ in range(games):
+        winner = play_game(x, o, rng)
+        if winner is Mark.X:
+            x_wins += 1
+        elif winner is Mark.O:
+            o_wins += 1
+    return Tally(x_wins, o_wins, games - x_wins - o_wins)
+
+
+def _chunks(x: Strategy, o: Strategy, games: int, seed: int, chunk_size: int) -> list[tuple]:
+    return [
+        (x, o, seed, chunk, min(chunk_size, games - start)) for chunk, start in enumerate(range(0, games, chunk_size))
+    ]
+
+
+def _run(jobs: list[tuple], workers: Optional[int]) -> list[Tally]:
+    if workers == 1 or len(jobs) <= 1:
+        return [_play_chunk(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_play_chunk, *zip(*jobs)))
+
+
+def play_match(
+    x: Strategy,
+    o: Strategy,
+    games: int,
+    seed: int = 0,
+    workers: Optional[int] = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tally:
+    """Plays games between x (moving first) and o and tallies the results.
+
+    Args:
+        x, o: Strategies for each side.
+        games: Number of games.
+        seed: Seed for every random choice; the same seed gives the same tally.
+        workers: Number of worker processes (None: os.cpu_count()); 1 plays in the calling process.
+        chunk_size: Games per chunk. Changing it changes which random numbers each game gets.
+    """
+    return sum_tallies(_run(_chunks(x, o, games, seed, chunk_size), workers))
+
+
+def tournament(
+    strategies: dict[str, Strategy],
+    games: int,
+    seed: int = 0,
+    workers: Optional[int] = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[tuple[str, str], Tally]:
+    """Plays a match between every ordered pair of strategies, in one pool.
+
+    Returns:
+        {(x name, o name): tally}, with each strategy playing both sides against every other.
+    """
+    pairings = list(itertools.product(strategies, repeat=2))
+    jobs = [_chunks(strategies[x], strategies[o], games, seed, chunk_size) for x, o in pairings]
+    tallies = iter(_run([job for chunks in jobs for job in chunks], workers))
+    return {pairing: sum_tallies(itertools.islice(tallies, len(chunks))) for pairing, chunks in zip(pairings, jobs)}
+
+
+def _format(x: str, o: str, tally: Tally) -> str:
+    return f"{x:>6} vs {o:<6} X wins {tally.x_wins:>10,}  O wins {tally.o_wins:>10,}  draws {tally.draws:>10,}\n"
+
+
+def _format_rate(games: int, seconds: float) -> str:
+    return f"{games:,} games in {seconds:.2f} s ({games / seconds if seconds else 0.0:,.0f} games/s)\n"
+
+
+def main(argv: Optional[Sequence[str]] = None, stdout: Optional[TextIO] = None) -> None:
+    """Self-play CLI program.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+        stdout: Stream the tallies are written to (default: sys.stdout)
+    """
+    parser = argparse.ArgumentParser(
+        prog="tic_tac_toe_selfplay",
+        description="Play tic-tac-toe games between strategies and tally the results.",
+    )
+    parser.add_argument("--games", type=int, default=100_000, help="games per match (default: 100000)")
+    parser.add_argument("--x", choices=STRATEGIES, default="table", help="strategy moving first (default: table)")
+    parser.add_argument("--o", choices=STRATEGIES, default="random", help="strategy moving second (default: random)")
+    parser.add_argument("--tournament", action="store_true", help="play every pair of strategies, both ways")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="play across this many processes; 0 uses every core (default: 1)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="games per chunk")
+    args = parser.parse_args(argv)
+    if args.games < 0:
+        parser.error("--games must be at least 0")
+    if args.workers < 0:
+        parser.error("--workers must be at least 0")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    stdout = stdout or sys.stdout
+    workers = args.workers or None
+    start = time.perf_counter()
+    if args.tournament:
+        results = tournament(STRATEGIES, args.games, args.seed, workers, args.chunk_size)
+    else:
+        tally = play_match(STRATEGIES[args.x], STRATEGIES[args.o], args.games, args.seed, workers, args.chunk_size)
+        results = {(args.x, args.o): tally}
+    seconds = time.perf_counter() - start
+
+    for (x, o), tally in results.items():
+        stdout.write(_format(x, o, tally))
+    stdout.write(_format_rate(sum_tallies(results.values()).games, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Tests for the bitboard tic-tac-toe core and its perfect-play table."""
+
+import random
+from functools import cache
+
+import pytest
+
+from tic_tac_toe.bitboard import (
+    _HAS_LINE,
+    _SQUARES,
+    EMPTY,
+    LINES,
+    Mark,
+    Position,
+    best_move,
+    reachable_positions,
+    solve,
+)
+
+
+# Plain recursive minimax, to check the table against
+@cache
+def _minimax(position: Position) -> int:
+    if position.winner() is not None:
+        return -1
+    if not position.moves():
+        return 0
+    return max(-_minimax(position.play(square)) for square in position.moves())
+
+
+def test_lines_and_winner():
+    """Test every line wins for either mark and a full board without a line is a draw."""
+    for line in LINES:
+        assert Position(line, 0).winner() == Mark.X
+        assert Position(0, line).winner() == Mark.O
+    draw = Position.from_string("XOX XOO OXX")
+    assert draw.winner() is None
+    assert draw.is_over()
+    assert draw.moves() == ()
+
+
+def test_mask_tables():
+    """Test the per-mask tables agree with checking every line and square directly."""
+    for mask in range(512):
+        assert _HAS_LINE[mask] == any(mask & line == line for line in LINES)
+        assert _SQUARES[mask] == tuple(square for square in range(9) if mask >> square & 1)
+
+
+def test_play():
+    """Test moves alternate between X and O and illegal moves are rejected."""
+    position = EMPTY.play(4).play(0)
+    assert str(position) == "O...X...."
+    assert position.to_move == Mark.X
+    for square in (0, 4, 9, -1):
+        with pytest.raises(ValueError):
+            position.play(square)
+    with pytest.raises(ValueError):
+        Position.from_string("XXX OO. ...").play(8)
+
+
+def test_from_string():
+    """Test parsing round-trips and rejects malformed boards."""
+    assert str(Position.from_string("X-O\n.X.\nO.X")) == "X.O.X.O.X"
+    for text in ("X.O", "X.O.X.O.Z"):
+        with pytest.raises(ValueError):
+            Position.from_string(text)
+
+
+def test_table_covers_reachable_positions():
+    """Test the table holds exactly the 5478 positions reachable from the empty board."""
+    assert reachable_positions() == 5478
+    with pytest.raises(ValueError):
+        solve(Position.from_string("XXX XXX ..."))
+
+
+def test_known_values():
+    """Test the table finds wins, blocks and the drawn empty board."""
+    assert solve(EMPTY) == (0, tuple(range(9)))
+    assert solve(Position.from_string("XX. OO. ...")) == (1, (2,))
+    assert solve(Position.from_string("XX. O.. ...")) == (-1, (2, 4, 5, 6, 7, 8))
+    assert solve(Position.from_string("X.. .O. ..X")).moves == (1, 3, 5, 7)
+    assert solve(Position.from_string("XXX OO. ...")) == (-1, ())
+
+
+def test_table_matches_minimax():
+    """Test the table agrees with plain minimax on random reachable positions."""
+    rng = random.Random(0)
+    for _ in range(200):
+        position = EMPTY
+        for _ in range(rng.randrange(1, 7)):
+            if position.is_over():
+                break
+            position = position.play(rng.choice(position.moves()))
+        value, moves = solve(position)
+        assert value == _minimax(position)
+        for square in position.moves():
+            assert (-_minimax(position.play(square)) == value) == (square in moves)
+
+
+def test_perfect_play_draws():
+    """Test perfect play against itself always draws, and never loses to a random player."""
+    rng = random.Random(1)
+    for game in range(100):
+        position = EMPTY
+        while not position.is_over():
+            if game % 2 and position.to_move == Mark.O:
+                position = position.play(rng.choice(position.moves()))
+            else:
+                position = position.play(best_move(position, rng))
+        assert position.winner() in (None, Mark.X) if game % 2 else position.winner() is None
@@ -0,0 +1,22 @@
+"""Tests for the tic-tac-toe board display."""
+
+import io
+
+import tic_tac_toe
+from theme.color import ColorDepth
+from theme.writer import StyledWriter
+
+
+def test_gray_follows_color_depth(monkeypatch):
+    """Test the board's gray is written at the terminal's color depth."""
+    for depth, prefix in (
+        (ColorDepth.TRUE_COLOR, "\x1b[38;2;190;190;190m"),
+        (ColorDepth.COLORS_256, "\x1b[38;5;250m"),
+        (ColorDepth.COLORS_16, "\x1b[37m"),
+    ):
+        monkeypatch.setattr(tic_tac_toe, "color_depth", lambda depth=depth: depth)
+        tic_tac_toe.gray.cache_clear()
+        stream = io.StringIO()
+        tic_tac_toe.print_board(StyledWriter(stream))
+        assert prefix + "───┼───┼───" in stream.getvalue()
+    tic_tac_toe.gray.cache_clear()
@@ -0,0 +1,136 @@
+"""Tests for the m,n,k board and search engine."""
+
+import random
+
+import pytest
+
+from tic_tac_toe.bitboard import EMPTY, Mark, solve
+from tic_tac_toe.mnk import EXACT, LOWER, WIN_BOUND, Board, Engine, TranspositionTable
+
+
+def _board(width: int, height: int, k: int, cells: list[int], radius: int = 1) -> Board:
+    board = Board(width, height, k, radius)
+    for cell in cells:
+        board.play(cell)
+    return board
+
+
+def test_wins_in_every_direction():
+    """Test k in a row wins across, down and along both diagonals, and fewer does not."""
+    # X plays the first list, O plays far away in the top row
+    for line in ([8, 9, 10, 11], [8, 15, 22, 29], [8, 16, 24, 32], [11, 17, 23, 29]):
+        board = Board(7, 7, 4)
+        for i, cell in enumerate(line):
+            assert board.winner is None
+            board.play(cell)
+            if i < 3:
+                board.play(i)
+        assert board.winner == Mark.X
+        assert board.is_over()
+        assert board.moves() == board.candidates() == []
+
+
+def test_illegal_moves():
+    """Test occupied cells, cells off the board and moves after a win are rejected."""
+    board = _board(3, 3, 3, [0, 3, 1, 4, 2])
+    for cell in (5, 0, 9, -1):
+        with pytest.raises(ValueError):
+            board.play(cell)
+    with pytest.raises(ValueError):
+        Board(3, 3, 4)
+
+
+def test_incremental_state_matches_rescan():
+    """Test the score, hash and candidate moves kept up to date by play and undo match a rescan."""
+    rng = random.Random(0)
+    board = Board(9, 7, 4)
+    seen = {}
+    for _ in range(300):
+        if board.is_over() or (board.history and rng.random() < 0.3):
+            board.undo()
+        else:
+            board.play(rng.choice(board.moves()))
+        assert board.score == board.rescore()
+        assert seen.setdefault(bytes(board.cells), board.hash) == board.hash
+        near = {neighbor for cell in board.history for neighbor in board._neighbors[cell] if board.cells[neighbor] == 0}
+        assert board._candidates == near
+    while board.history:
+        board.undo()
+    assert (board.hash, board.score) == (0, 0)
+
+
+def test_tic_tac_toe_matches_table():
+    """Test full-depth search on 3x3 agrees with the perfect-play table."""
+    rng = random.Random(1)
+    engine = Engine(table_bits=12)
+    for _ in range(40):
+        board, position = Board(3, 3, 3, radius=2), EMPTY
+        for _ in range(rng.randrange(1, 6)):
+            if position.is_over():
+                break
+            cell = rng.choice(position.moves())
+            board.play(cell)
+            position = position.play(cell)
+        if position.is_over():
+            continue
+        value, moves = solve(position)
+        result = engine.search(board)
+        assert (result.score > 0) - (result.score < 0) == value
+        assert result.move in moves
+
+
+def test_finds_wins_and_blocks():
+    """Test the engine blocks an open three and completes its own four at depth 1."""
+    engine = Engine()
+    board = _board(7, 7, 4, [24, 0, 25, 1, 26])
+    assert engine.search(board, max_depth=4).move in (23, 27)
+
+    board = _board(7, 7, 4, [24, 0, 25, 1, 26, 2])
+    result = engine.search(board, max_depth=4)
+    assert result.move in (23, 27)
+    assert result.score >= WIN_BOUND
+    assert result.depth == 1
+
+
+def test_engine_reused_across_boards():
+    """Test an engine reused on a board of another geometry agrees with a fresh engine."""
+    engine = Engine(table_bits=12)
+    engine.search(Board(5, 5, 3), max_depth=4)
+    for board in (Board(5, 5, 5), Board(3, 4, 3), Board(4, 3, 3)):
+        reused = engine.search(board, max_depth=3)
+        fresh = Engine(table_bits=12).search(board, max_depth=3)
+        assert (reused.move, reused.score) == (fresh.move, fresh.score)
+    assert Engine().search(Board(5, 5, 5), max_depth=0).depth == 0
+
+
+def test_time_limit():
+    """Test a search with a deadline returns a legal move in time and leaves the board as it was."""
+    board = _board(15, 15, 5, [112, 113, 97])
+    before = (bytes(board.cells), board.hash, board.score, board.history)
+    result = Engine().search(board, time_limit=0.2)
+    assert result.seconds < 1
+    assert board.cells[result.move] == 0
+    assert (bytes(board.cells), board.hash, board.score, board.history) == before
+    assert result.nodes > 0 and result.nodes_per_second > 0
+    assert 0 <= result.tt_hit_rate <= 1
+
+
+def test_transposition_table_is_bounded():
+    """Test the table never holds more than its slots, keeping deeper entries within a search."""
+    table = TranspositionTable(bits=2)
+    for key in range(100):
+        table.store(key, 1, 0, EXACT, 0)
+    assert len(table) == 4
+
+    table.store(0, 5, 7, LOWER, 3)
+    table.store(4, 2, 0, EXACT, 0)  # Same slot, shallower
+    assert table.probe(0) == (0, 5, 7, LOWER, 3, 0)
+    assert table.probe(4) is None
+    table.new_search()
+    table.store(4, 2, 0, EXACT, 0)  # Entries from an earlier search are replaced
+    assert table.probe(0) is None
+    assert (table.probes, table.hits) == (1, 0)
+
+    engine = Engine(table_bits=6)
+    engine.search(Board(5, 5, 4), max_depth=4)
+    assert len(engine.table) <= 64
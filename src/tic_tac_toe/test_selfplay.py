@@ -0,0 +1,81 @@
+"""Tests for headless self-play."""
+
+import io
+import random
+
+import pytest
+
+from tic_tac_toe.bitboard import Mark
+from tic_tac_toe.selfplay import (
+    SearchStrategy,
+    Tally,
+    main,
+    play_game,
+    play_match,
+    random_move,
+    table_move,
+    tournament,
+)
+
+
+def test_perfect_play():
+    """Test the table never loses, and always draws against itself."""
+    assert play_match(table_move, table_move, 200) == Tally(0, 0, 200)
+    assert play_match(table_move, random_move, 300).o_wins == 0
+    assert play_match(random_move, table_move, 300).x_wins == 0
+
+
+def test_search_strategy_plays_perfectly():
+    """Test full-depth search draws against the table and beats random play as often as it can."""
+    search = SearchStrategy()
+    rng = random.Random(0)
+    for _ in range(5):
+        assert play_game(search, table_move, rng) is None
+        assert play_game(random_move, search, rng) is not Mark.X
+
+
+def test_search_strategy_is_fast_enough_for_matches():
+    """Test the search strategy can play a full match against random play, each position searched once."""
+    assert play_match(SearchStrategy(), random_move, 2000, seed=5).o_wins == 0
+
+
+def test_reproducible():
+    """Test the same seed gives the same tally and another seed a different one."""
+    tally = play_match(random_move, random_move, 2000, seed=1)
+    assert tally.games == 2000
+    assert play_match(random_move, random_move, 2000, seed=1) == tally
+    assert play_match(random_move, random_move, 2000, seed=2) != tally
+
+
+def test_results_do_not_depend_on_workers():
+    """Test tallies are identical whether games run in-process or across worker processes."""
+    expected = play_match(random_move, table_move, 1000, seed=3, workers=1, chunk_size=100)
+    for workers in (2, 3):
+        assert play_match(random_move, table_move, 1000, seed=3, workers=workers, chunk_size=100) == expected
+
+
+def test_tournament():
+    """Test every ordered pairing is played, each the same as a separate match."""
+    strategies = {"random": random_move, "table": table_move}
+    results = tournament(strategies, 300, seed=4, workers=2, chunk_size=64)
+    assert list(results) == [("random", "random"), ("random", "table"), ("table", "random"), ("table", "table")]
+    assert results["random", "table"] == play_match(random_move, table_move, 300, seed=4, chunk_size=64)
+    assert results["table", "table"] == Tally(0, 0, 300)
+
+
+def test_main():
+    """Test the CLI writes a tally line and the throughput."""
+    out = io.StringIO()
+    main(["--games", "100", "--x", "table", "--o", "table"], stdout=out)
+    lines = out.getvalue().splitlines()
+    assert lines[0].split() == ["table", "vs", "table", "X", "wins", "0", "O", "wins", "0", "draws", "100"]
+    assert lines[1].startswith("100 games in ")
+
+
+def test_main_rejects_invalid_sizes(capsys):
+    """Test a chunk size below 1 or a negative worker count is a usage error, not a traceback."""
+    for argv in (["--chunk-size", "0"], ["--workers", "-1"]):
+        with pytest.raises(SystemExit) as exit_info:
+            main(argv, stdout=io.StringIO())
+        assert exit_info.value.code == 2
+    assert "--workers must be at least 0" in capsys.readouterr().err